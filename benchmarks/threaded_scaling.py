@@ -0,0 +1,85 @@
+"""Multithreaded stress benchmark for the bulk functions.
+
+Runs the same set of bulk indicator calls from an increasing number of threads and reports
+the throughput and the speedup over a single thread. On a free-threaded build of CPython
+(3.13t or later) the speedup should grow close to linearly with the number of threads, up to
+the number of physical cores. On a standard build the GIL serializes the calls and the speedup
+stays near 1.
+
+Every thread also checks its results against a single threaded reference, so the benchmark
+doubles as a stress test of the extension under concurrent use.
+
+```shell
+$ python3.13t -m pip install -r test_requirements.txt
+
+$ maturin develop --release
+
+$ python3.13t benchmarks/threaded_scaling.py --bars 200000 --calls 40
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pytechnicalindicators import candle_indicators, momentum_indicators, moving_average, other_indicators
+
+
+def make_series(bars):
+    close = [100.0 + (i % 97) * 0.5 - (i % 13) * 1.5 for i in range(bars)]
+    high = [c + 1.0 + (i % 5) * 0.25 for i, c in enumerate(close)]
+    low = [c - 1.0 - (i % 7) * 0.25 for i, c in enumerate(close)]
+    return high, low, close
+
+
+def workload(high, low, close):
+    return [
+        moving_average.bulk.moving_average(close, "exponential", 20),
+        momentum_indicators.bulk.relative_strength_index(close, "smoothed", 14),
+        other_indicators.bulk.average_true_range(close, high, low, "simple", 14),
+        candle_indicators.bulk.keltner_channel(high, low, close, "exponential", "simple", 2.0, 20),
+    ]
+
+
+def run(threads, calls, high, low, close, reference):
+    def task(_):
+        output = workload(high, low, close)
+        if output != reference:
+            raise AssertionError("threaded results differ from the single threaded reference")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(task, range(calls)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=100_000, help="bars per series")
+    parser.add_argument("--calls", type=int, default=32, help="workload calls per run")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+    print(f"{args.bars} bars, {args.calls} calls per run")
+
+    high, low, close = make_series(args.bars)
+    reference = workload(high, low, close)
+
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= args.max_threads:
+        thread_counts.append(thread_counts[-1] * 2)
+
+    baseline = None
+    print(f"{'threads':>8} {'seconds':>10} {'calls/s':>10} {'speedup':>8}")
+    for threads in thread_counts:
+        elapsed = run(threads, args.calls, high, low, close, reference)
+        baseline = baseline or elapsed
+        print(f"{threads:>8} {elapsed:>10.3f} {args.calls / elapsed:>10.1f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
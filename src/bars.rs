@@ -0,0 +1,366 @@
+use std::sync::{Arc, Mutex, MutexGuard};
+
+use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PySlice;
+
+/// The `bars` module provides a Rust owned OHLCV container that indicator calls can share.
+///
+/// Converting Python lists to Rust vectors happens on every indicator call. A `Bars` container
+/// converts the columns once, and its column views are then passed to any bulk or single
+/// function without converting or copying them again.
+///
+/// ## When to Use
+/// Use bars when:
+/// - Several indicators are calculated on the same OHLCV data
+/// - New bars arrive over time and indicators are recalculated on the growing history
+///
+/// ## Structure
+/// - **Bars**: Struct-of-arrays OHLCV buffer with cheap append and slicing.
+/// - **BarsColumn**: Read-only view of one column, accepted in place of a list of prices.
+#[pymodule(gil_used = false)]
+pub fn bars(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<Bars>()?;
+    m.add_class::<BarsColumn>()?;
+    Ok(())
+}
+
+const COLUMN_NAMES: [&str; 5] = ["open", "high", "low", "close", "volume"];
+const OPEN: usize = 0;
+const HIGH: usize = 1;
+const LOW: usize = 2;
+const CLOSE: usize = 3;
+const VOLUME: usize = 4;
+
+/// Resolves a Python slice to a contiguous range of a sequence of length `len`
+fn slice_range(slice: &Bound<'_, PySlice>, len: usize) -> PyResult<(usize, usize)> {
+    let indices = slice.indices(len as isize)?;
+    if indices.step != 1 {
+        return Err(PyValueError::new_err(
+            "Only contiguous slices (step 1) are supported",
+        ));
+    }
+    let start = indices.start as usize;
+    Ok((start, start + indices.slicelength))
+}
+
+/// Read-only view of one column of a `Bars` container
+///
+/// Views share the column buffer with the container, so creating and slicing them copies no
+/// data. Appending to the container after a view was taken does not change the view.
+#[pyclass(frozen, module = "pytechnicalindicators.bars")]
+pub struct BarsColumn {
+    values: Arc<Vec<f64>>,
+    start: usize,
+    end: usize,
+}
+
+impl BarsColumn {
+    /// Values of the view
+    pub fn as_slice(&self) -> &[f64] {
+        &self.values[self.start..self.end]
+    }
+
+    /// Shared buffer and range of the view
+    pub fn shared(&self) -> (Arc<Vec<f64>>, usize, usize) {
+        (Arc::clone(&self.values), self.start, self.end)
+    }
+}
+
+#[pymethods]
+impl BarsColumn {
+    fn __len__(&self) -> usize {
+        self.end - self.start
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+        let len = self.end - self.start;
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let (start, end) = slice_range(slice, len)?;
+            let view = BarsColumn {
+                values: Arc::clone(&self.values),
+                start: self.start + start,
+                end: self.start + end,
+            };
+            return Ok(Py::new(py, view)?.into_any());
+        }
+        let index: isize = index.extract()?;
+        let position = if index < 0 {
+            index + len as isize
+        } else {
+            index
+        };
+        if position < 0 || position >= len as isize {
+            return Err(PyIndexError::new_err("column index out of range"));
+        }
+        Ok(self.values[self.start + position as usize]
+            .into_pyobject(py)?
+            .into_any()
+            .unbind())
+    }
+
+    /// Copies the view into a list
+    fn to_list(&self) -> Vec<f64> {
+        self.as_slice().to_vec()
+    }
+}
+
+#[derive(Clone)]
+struct BarsData {
+    columns: [Option<Arc<Vec<f64>>>; 5],
+    start: usize,
+    end: usize,
+}
+
+impl BarsData {
+    fn len(&self) -> usize {
+        self.end - self.start
+    }
+
+    fn append(&mut self, values: [Option<&[f64]>; 5]) -> PyResult<()> {
+        let mut added = None;
+        for (index, (column, new)) in self.columns.iter().zip(values.iter()).enumerate() {
+            match (column, new) {
+                (Some(_), None) => {
+                    return Err(PyValueError::new_err(format!(
+                        "Bars has a '{}' column, so '{}' must be given",
+                        COLUMN_NAMES[index], COLUMN_NAMES[index]
+                    )))
+                }
+                (None, Some(_)) => {
+                    return Err(PyValueError::new_err(format!(
+                        "Bars has no '{}' column",
+                        COLUMN_NAMES[index]
+                    )))
+                }
+                _ => {}
+            }
+            if let Some(new) = new {
+                if added.is_some_and(|added| added != new.len()) {
+                    return Err(PyValueError::new_err(
+                        "All appended columns must be the same length",
+                    ));
+                }
+                added = Some(new.len());
+            }
+        }
+        let added = added.unwrap_or(0);
+        let (start, end) = (self.start, self.end);
+        for (column, new) in self.columns.iter_mut().zip(values) {
+            if let (Some(column), Some(new)) = (column, new) {
+                if start != 0 || end != column.len() {
+                    // A slice owns only part of the buffer, copy that part before growing it
+                    *column = Arc::new(column[start..end].to_vec());
+                }
+                // Copies the buffer only while column views still share it
+                Arc::make_mut(column).extend_from_slice(new);
+            }
+        }
+        self.start = 0;
+        self.end = end - start + added;
+        Ok(())
+    }
+}
+
+/// Struct-of-arrays OHLCV buffer owned by Rust
+///
+/// The columns are converted from lists (or any float64 buffer) once, when the container is
+/// built. `bars.high`, `bars.close`, etc. return `BarsColumn` views that every bulk and single
+/// function accepts in place of a list, without any conversion. Only `close` is required,
+/// the other columns are optional.
+///
+/// Appending is amortized O(1) per bar; a column is copied only when views of it are still
+/// alive, which keep seeing the data from when they were taken. Slicing, `bars[-500:]`,
+/// returns a new container sharing the same buffers.
+///
+/// Args:
+///     close: List of closing prices
+///     open: List of opening prices (default None)
+///     high: List of highs (default None)
+///     low: List of lows (default None)
+///     volume: List of volumes (default None)
+///
+/// Example:
+///     data = bars.Bars(high=high, low=low, close=close)
+///     channel = candle_indicators.bulk.keltner_channel(data.high, data.low, data.close, "exponential", "simple", 2.0, 20)
+///     supertrend = trend_indicators.bulk.supertrend(data.high, data.low, data.close, "simple", 3.0, 10)
+#[pyclass(frozen, module = "pytechnicalindicators.bars")]
+pub struct Bars {
+    data: Mutex<BarsData>,
+}
+
+impl Bars {
+    fn data(&self) -> MutexGuard<'_, BarsData> {
+        self.data.lock().unwrap_or_else(|e| e.into_inner())
+    }
+
+    fn column(&self, index: usize) -> PyResult<BarsColumn> {
+        let data = self.data();
+        match &data.columns[index] {
+            Some(values) => Ok(BarsColumn {
+                values: Arc::clone(values),
+                start: data.start,
+                end: data.end,
+            }),
+            None => Err(PyValueError::new_err(format!(
+                "Bars has no '{}' column",
+                COLUMN_NAMES[index]
+            ))),
+        }
+    }
+}
+
+#[pymethods]
+impl Bars {
+    #[new]
+    #[pyo3(signature = (*, close, open = None, high = None, low = None, volume = None))]
+    fn new(
+        close: crate::PriceSeries,
+        open: Option<crate::PriceSeries>,
+        high: Option<crate::PriceSeries>,
+        low: Option<crate::PriceSeries>,
+        volume: Option<crate::PriceSeries>,
+    ) -> PyResult<Self> {
+        let len = close.len();
+        let mut columns: [Option<Arc<Vec<f64>>>; 5] = Default::default();
+        for (index, column) in [(OPEN, open), (HIGH, high), (LOW, low), (VOLUME, volume)] {
+            if let Some(column) = column {
+                if column.len() != len {
+                    return Err(PyValueError::new_err(format!(
+                        "'{}' has {} values but 'close' has {}",
+                        COLUMN_NAMES[index],
+                        column.len(),
+                        len
+                    )));
+                }
+                columns[index] = Some(Arc::new(column.into_vec()));
+            }
+        }
+        columns[CLOSE] = Some(Arc::new(close.into_vec()));
+        Ok(Bars {
+            data: Mutex::new(BarsData {
+                columns,
+                start: 0,
+                end: len,
+            }),
+        })
+    }
+
+    /// Appends one bar
+    ///
+    /// Args:
+    ///     close: Closing price
+    ///     open: Opening price, required if the container has opens
+    ///     high: High, required if the container has highs
+    ///     low: Low, required if the container has lows
+    ///     volume: Volume, required if the container has volumes
+    #[pyo3(signature = (*, close, open = None, high = None, low = None, volume = None))]
+    fn append(
+        &self,
+        close: f64,
+        open: Option<f64>,
+        high: Option<f64>,
+        low: Option<f64>,
+        volume: Option<f64>,
+    ) -> PyResult<()> {
+        let (open, high, low, close, volume) = (
+            open.map(|v| [v]),
+            high.map(|v| [v]),
+            low.map(|v| [v]),
+            [close],
+            volume.map(|v| [v]),
+        );
+        self.data().append([
+            open.as_ref().map(|v| &v[..]),
+            high.as_ref().map(|v| &v[..]),
+            low.as_ref().map(|v| &v[..]),
+            Some(&close[..]),
+            volume.as_ref().map(|v| &v[..]),
+        ])
+    }
+
+    /// Appends several bars
+    ///
+    /// Args:
+    ///     close: List of closing prices
+    ///     open: List of opening prices, required if the container has opens
+    ///     high: List of highs, required if the container has highs
+    ///     low: List of lows, required if the container has lows
+    ///     volume: List of volumes, required if the container has volumes
+    #[pyo3(signature = (*, close, open = None, high = None, low = None, volume = None))]
+    fn extend(
+        &self,
+        close: crate::PriceSeries,
+        open: Option<crate::PriceSeries>,
+        high: Option<crate::PriceSeries>,
+        low: Option<crate::PriceSeries>,
+        volume: Option<crate::PriceSeries>,
+    ) -> PyResult<()> {
+        self.data().append([
+            open.as_deref(),
+            high.as_deref(),
+            low.as_deref(),
+            Some(&close[..]),
+            volume.as_deref(),
+        ])
+    }
+
+    /// Opening prices
+    #[getter]
+    fn open(&self) -> PyResult<BarsColumn> {
+        self.column(OPEN)
+    }
+
+    /// Highs
+    #[getter]
+    fn high(&self) -> PyResult<BarsColumn> {
+        self.column(HIGH)
+    }
+
+    /// Lows
+    #[getter]
+    fn low(&self) -> PyResult<BarsColumn> {
+        self.column(LOW)
+    }
+
+    /// Closing prices
+    #[getter]
+    fn close(&self) -> PyResult<BarsColumn> {
+        self.column(CLOSE)
+    }
+
+    /// Volumes
+    #[getter]
+    fn volume(&self) -> PyResult<BarsColumn> {
+        self.column(VOLUME)
+    }
+
+    /// Names of the columns present
+    #[getter]
+    fn columns(&self) -> Vec<&'static str> {
+        let data = self.data();
+        COLUMN_NAMES
+            .iter()
+            .zip(data.columns.iter())
+            .filter(|(_, column)| column.is_some())
+            .map(|(name, _)| *name)
+            .collect()
+    }
+
+    fn __len__(&self) -> usize {
+        self.data().len()
+    }
+
+    fn __getitem__(&self, index: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let slice = index
+            .downcast::<PySlice>()
+            .map_err(|_| PyTypeError::new_err("Bars can only be indexed with a slice"))?;
+        let mut data = self.data().clone();
+        let (start, end) = slice_range(slice, data.len())?;
+        data.end = data.start + end;
+        data.start += start;
+        Ok(Bars {
+            data: Mutex::new(data),
+        })
+    }
+}
@@ -0,0 +1,465 @@
+use std::collections::{BTreeMap, HashMap};
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::sync::{Mutex, MutexGuard};
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple};
+
+/// The `cache` module provides an opt-in memoization layer for indicator calls.
+///
+/// Results are keyed by the function called and a fingerprint of its arguments, so repeated
+/// calls with identical inputs and parameters return the stored result instead of recomputing it.
+///
+/// ## When to Use
+/// Use the cache when:
+/// - Several consumers request the same bulk indicator on the same data within a short time
+/// - Recomputing an indicator is expensive compared to fingerprinting its inputs
+///
+/// ## Structure
+/// - **ResultCache**: A memory bounded, least recently used (LRU) result cache.
+#[pymodule(gil_used = false)]
+pub fn cache(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<ResultCache>()?;
+    Ok(())
+}
+
+/// One normalized argument, or the start of a nested list or tuple
+#[derive(PartialEq, Hash)]
+enum KeyToken {
+    None,
+    Bool(bool),
+    Int(i64),
+    BigInt(String),
+    Float(u64),
+    Floats(Vec<u64>),
+    Str(String),
+    List(usize),
+    Tuple(usize),
+    Keyword(String),
+    Object(String, isize),
+}
+
+/// Normalized function and arguments of a call
+///
+/// Entries are looked up by the hash of the key, and the stored key is compared on every hit
+/// so calls whose keys collide never share a result. Arguments of other hashable types are
+/// kept in `objects` and compared with `==`.
+struct CacheKey {
+    function: usize,
+    tokens: Vec<KeyToken>,
+    objects: Vec<PyObject>,
+}
+
+impl CacheKey {
+    fn hash(&self) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.function.hash(&mut hasher);
+        self.tokens.hash(&mut hasher);
+        hasher.finish()
+    }
+
+    /// Approximates the memory held by the key
+    fn size(&self) -> usize {
+        self.tokens
+            .iter()
+            .map(|token| match token {
+                KeyToken::Floats(bits) => 32 + 8 * bits.len(),
+                KeyToken::Str(s) | KeyToken::BigInt(s) | KeyToken::Keyword(s) => 32 + s.len(),
+                _ => 32,
+            })
+            .sum::<usize>()
+            + 8 * self.objects.len()
+    }
+}
+
+struct CacheEntry {
+    key: CacheKey,
+    function: PyObject,
+    value: PyObject,
+    size: usize,
+    last_used: u64,
+}
+
+#[derive(Default)]
+struct CacheState {
+    entries: HashMap<u64, CacheEntry>,
+    recency: BTreeMap<u64, u64>,
+    tick: u64,
+    size: usize,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+impl CacheState {
+    fn touch(&mut self, key: u64) {
+        self.tick += 1;
+        let tick = self.tick;
+        if let Some(entry) = self.entries.get_mut(&key) {
+            self.recency.remove(&entry.last_used);
+            entry.last_used = tick;
+            self.recency.insert(tick, key);
+        }
+    }
+
+    fn remove(&mut self, key: u64) -> Option<CacheEntry> {
+        let entry = self.entries.remove(&key)?;
+        self.recency.remove(&entry.last_used);
+        self.size -= entry.size;
+        Some(entry)
+    }
+
+    fn evict_least_recently_used(&mut self) -> Option<CacheEntry> {
+        let (_, key) = self.recency.pop_first()?;
+        let entry = self.entries.remove(&key)?;
+        self.size -= entry.size;
+        self.evictions += 1;
+        Some(entry)
+    }
+}
+
+/// Memory bounded LRU cache for indicator results
+///
+/// Entries are keyed by the identity of the function called and a fingerprint of the
+/// positional and keyword arguments. Float lists, float64 buffers and `Bars` columns are
+/// fingerprinted by their contents, and arguments that can only be told apart by identity are
+/// rejected with a `TypeError`. When the estimated size of the stored results and their keys
+/// exceeds `max_bytes` the least recently used entries are evicted.
+///
+/// Args:
+///     max_bytes: Memory budget for the stored results in bytes (default 64 MiB)
+///
+/// Example:
+///     results = cache.ResultCache(max_bytes=16 * 1024 * 1024)
+///     rsi = results.call(momentum_indicators.bulk.relative_strength_index, prices, "smoothed", 14)
+#[pyclass(module = "pytechnicalindicators.cache")]
+pub struct ResultCache {
+    max_bytes: usize,
+    state: Mutex<CacheState>,
+}
+
+impl ResultCache {
+    fn state(&self) -> MutexGuard<'_, CacheState> {
+        self.state.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+#[pymethods]
+impl ResultCache {
+    #[new]
+    #[pyo3(signature = (max_bytes = 64 * 1024 * 1024))]
+    fn new(max_bytes: usize) -> PyResult<Self> {
+        if max_bytes == 0 {
+            return Err(PyValueError::new_err("max_bytes must be greater than 0"));
+        }
+        Ok(ResultCache {
+            max_bytes,
+            state: Mutex::new(CacheState::default()),
+        })
+    }
+
+    /// Calls `function` with the given arguments, returning the cached result if present
+    ///
+    /// Lists in the result, including those inside tuples, are returned as copies so callers
+    /// cannot alter the cached value.
+    ///
+    /// Args:
+    ///     function: Indicator function to call
+    ///     *args: Positional arguments for the function
+    ///     **kwargs: Keyword arguments for the function
+    ///
+    /// Returns:
+    ///     The result of `function(*args, **kwargs)`
+    #[pyo3(signature = (function, *args, **kwargs))]
+    fn call(
+        &self,
+        py: Python<'_>,
+        function: &Bound<'_, PyAny>,
+        args: &Bound<'_, PyTuple>,
+        kwargs: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyObject> {
+        let key = cache_key(function, args, kwargs)?;
+        let hash = key.hash();
+
+        let candidate = {
+            let state = self.state();
+            state
+                .entries
+                .get(&hash)
+                .filter(|entry| {
+                    entry.key.function == key.function && entry.key.tokens == key.tokens
+                })
+                .map(|entry| {
+                    let objects: Vec<PyObject> =
+                        entry.key.objects.iter().map(|o| o.clone_ref(py)).collect();
+                    (entry.value.clone_ref(py), objects)
+                })
+        };
+        // Other objects are compared outside the lock, their `__eq__` may run Python code
+        let cached = match candidate {
+            Some((value, objects)) if same_objects(py, &objects, &key.objects)? => Some(value),
+            _ => None,
+        };
+        {
+            let mut state = self.state();
+            match cached {
+                Some(_) => {
+                    state.hits += 1;
+                    state.touch(hash);
+                }
+                None => state.misses += 1,
+            }
+        }
+        if let Some(value) = cached {
+            return copy_result(value.bind(py));
+        }
+
+        let value = function.call(args, kwargs)?;
+        let size = estimate_size(&value) + key.size();
+        if size <= self.max_bytes {
+            let mut evicted = Vec::new();
+            {
+                let mut state = self.state();
+                if let Some(previous) = state.remove(hash) {
+                    evicted.push(previous);
+                }
+                while state.size + size > self.max_bytes {
+                    match state.evict_least_recently_used() {
+                        Some(entry) => evicted.push(entry),
+                        None => break,
+                    }
+                }
+                state.tick += 1;
+                let tick = state.tick;
+                state.entries.insert(
+                    hash,
+                    CacheEntry {
+                        key,
+                        function: function.clone().unbind(),
+                        value: value.clone().unbind(),
+                        size,
+                        last_used: tick,
+                    },
+                );
+                state.recency.insert(tick, hash);
+                state.size += size;
+            }
+            // Python references are released once the lock is dropped
+            drop(evicted);
+        }
+        copy_result(&value)
+    }
+
+    /// Removes every cached result produced by `function`
+    ///
+    /// Args:
+    ///     function: Indicator function whose results should be dropped
+    ///
+    /// Returns:
+    ///     Number of entries removed
+    fn invalidate(&self, function: &Bound<'_, PyAny>) -> usize {
+        let mut removed = Vec::new();
+        {
+            let mut state = self.state();
+            let keys: Vec<u64> = state
+                .entries
+                .iter()
+                .filter(|(_, entry)| entry.function.as_ptr() == function.as_ptr())
+                .map(|(key, _)| *key)
+                .collect();
+            for key in keys {
+                if let Some(entry) = state.remove(key) {
+                    removed.push(entry);
+                }
+            }
+        }
+        removed.len()
+    }
+
+    /// Removes all cached results and resets the statistics
+    fn clear(&self) {
+        let previous = std::mem::take(&mut *self.state());
+        drop(previous);
+    }
+
+    /// Returns the cache statistics
+    ///
+    /// Returns:
+    ///     Dictionary with "hits", "misses", "evictions", "entries", "size_bytes" and "max_bytes"
+    fn stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let (hits, misses, evictions, entries, size) = {
+            let state = self.state();
+            (
+                state.hits,
+                state.misses,
+                state.evictions,
+                state.entries.len(),
+                state.size,
+            )
+        };
+        let stats = PyDict::new(py);
+        stats.set_item("hits", hits)?;
+        stats.set_item("misses", misses)?;
+        stats.set_item("evictions", evictions)?;
+        stats.set_item("entries", entries)?;
+        stats.set_item("size_bytes", size)?;
+        stats.set_item("max_bytes", self.max_bytes)?;
+        Ok(stats)
+    }
+
+    fn __len__(&self) -> usize {
+        self.state().entries.len()
+    }
+}
+
+fn cache_key(
+    function: &Bound<'_, PyAny>,
+    args: &Bound<'_, PyTuple>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<CacheKey> {
+    let mut key = CacheKey {
+        function: function.as_ptr() as usize,
+        tokens: Vec::new(),
+        objects: Vec::new(),
+    };
+    fingerprint(args.as_any(), &mut key)?;
+    if let Some(kwargs) = kwargs {
+        let mut items: Vec<(String, Bound<'_, PyAny>)> = Vec::with_capacity(kwargs.len());
+        for (name, value) in kwargs.iter() {
+            items.push((name.extract()?, value));
+        }
+        items.sort_by(|a, b| a.0.cmp(&b.0));
+        for (name, value) in items {
+            key.tokens.push(KeyToken::Keyword(name));
+            fingerprint(&value, &mut key)?;
+        }
+    }
+    Ok(key)
+}
+
+/// Appends a Python value to the key, fingerprinting floats by their bit pattern
+fn fingerprint(value: &Bound<'_, PyAny>, key: &mut CacheKey) -> PyResult<()> {
+    if value.is_none() {
+        key.tokens.push(KeyToken::None);
+    } else if let Ok(boolean) = value.downcast::<PyBool>() {
+        key.tokens.push(KeyToken::Bool(boolean.is_true()));
+    } else if let Ok(int) = value.downcast::<PyInt>() {
+        match int.extract::<i64>() {
+            Ok(int) => key.tokens.push(KeyToken::Int(int)),
+            Err(_) => key.tokens.push(KeyToken::BigInt(int.str()?.to_string())),
+        }
+    } else if let Ok(float) = value.downcast::<PyFloat>() {
+        key.tokens.push(KeyToken::Float(float.value().to_bits()));
+    } else if let Ok(string) = value.downcast::<PyString>() {
+        key.tokens.push(KeyToken::Str(string.to_str()?.to_owned()));
+    } else if let Ok(list) = value.downcast::<PyList>() {
+        let floats: Option<Vec<u64>> = list
+            .iter()
+            .map(|item| item.downcast::<PyFloat>().ok().map(|f| f.value().to_bits()))
+            .collect();
+        match floats {
+            Some(bits) => key.tokens.push(KeyToken::Floats(bits)),
+            None => {
+                key.tokens.push(KeyToken::List(list.len()));
+                for item in list.iter() {
+                    fingerprint(&item, key)?;
+                }
+            }
+        }
+    } else if let Ok(tuple) = value.downcast::<PyTuple>() {
+        key.tokens.push(KeyToken::Tuple(tuple.len()));
+        for item in tuple.iter() {
+            fingerprint(&item, key)?;
+        }
+    } else if let Ok(column) = value.downcast::<crate::bars::BarsColumn>() {
+        let bits = column
+            .get()
+            .as_slice()
+            .iter()
+            .map(|v| v.to_bits())
+            .collect();
+        key.tokens.push(KeyToken::Floats(bits));
+    } else if let Ok(buffer) = PyBuffer::<f64>::get(value) {
+        let bits = buffer
+            .to_vec(value.py())?
+            .into_iter()
+            .map(f64::to_bits)
+            .collect();
+        key.tokens.push(KeyToken::Floats(bits));
+    } else {
+        let object_hash = value
+            .py()
+            .import("builtins")?
+            .getattr("object")?
+            .getattr("__hash__")?;
+        if value.get_type().getattr("__hash__")?.as_ptr() == object_hash.as_ptr() {
+            // Identity hashes change meaning once the object is freed and its id reused
+            return Err(PyTypeError::new_err(format!(
+                "Cannot cache a call with an argument of type '{}', it is only hashable by identity",
+                value.get_type().name()?
+            )));
+        }
+        key.tokens.push(KeyToken::Object(
+            value.get_type().name()?.to_string(),
+            value.hash()?,
+        ));
+        key.objects.push(value.clone().unbind());
+    }
+    Ok(())
+}
+
+fn same_objects(py: Python<'_>, stored: &[PyObject], given: &[PyObject]) -> PyResult<bool> {
+    for (stored, given) in stored.iter().zip(given) {
+        if !stored.bind(py).eq(given)? {
+            return Ok(false);
+        }
+    }
+    Ok(stored.len() == given.len())
+}
+
+/// Approximates the memory held by a result using CPython object sizes
+fn estimate_size(value: &Bound<'_, PyAny>) -> usize {
+    if let Ok(list) = value.downcast::<PyList>() {
+        56 + list
+            .iter()
+            .map(|item| 8 + estimate_size(&item))
+            .sum::<usize>()
+    } else if let Ok(tuple) = value.downcast::<PyTuple>() {
+        40 + tuple
+            .iter()
+            .map(|item| 8 + estimate_size(&item))
+            .sum::<usize>()
+    } else {
+        24
+    }
+}
+
+/// Copies the lists of a result, including those inside tuples, so the cached value stays intact
+fn copy_result(value: &Bound<'_, PyAny>) -> PyResult<PyObject> {
+    if let Ok(list) = value.downcast::<PyList>() {
+        if list.iter().all(|item| item.is_instance_of::<PyFloat>()) {
+            return Ok(list.get_slice(0, list.len()).into_any().unbind());
+        }
+        let items = list
+            .iter()
+            .map(|item| copy_result(&item))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyList::new(value.py(), items)?.into_any().unbind())
+    } else if let Ok(tuple) = value.downcast::<PyTuple>() {
+        if !tuple
+            .iter()
+            .any(|item| item.is_instance_of::<PyList>() || item.is_instance_of::<PyTuple>())
+        {
+            return Ok(tuple.clone().into_any().unbind());
+        }
+        let items = tuple
+            .iter()
+            .map(|item| copy_result(&item))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyTuple::new(value.py(), items)?.into_any().unbind())
+    } else {
+        Ok(value.clone().unbind())
+    }
+}
@@ -13,7 +13,7 @@ use rust_ti::candle_indicators as ci;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn candle_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -23,6 +23,7 @@ pub fn candle_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(
         bulk_moving_constant_envelopes,
         &bulk_module
@@ -44,6 +45,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_moving_constant_envelopes,
         &single_module
@@ -82,7 +84,7 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 ///     Moving Constant Envelopes tuple (lower envelope, constant model result, upper envelope)
 #[pyfunction(name = "moving_constant_envelopes")]
 fn single_moving_constant_envelopes(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     difference: f64,
 ) -> PyResult<(f64, f64, f64)> {
@@ -106,7 +108,7 @@ fn single_moving_constant_envelopes(
 ///     List of Moving Constant Envelopes tuple (lower envelope, constant model result, upper envelope)
 #[pyfunction(name = "moving_constant_envelopes")]
 fn bulk_moving_constant_envelopes(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     difference: f64,
     period: usize,
@@ -132,7 +134,7 @@ fn bulk_moving_constant_envelopes(
 ///     McGinley dynamic envelopes tuple (lower envelope, McGinley dynamic, upper envelope)
 #[pyfunction(name = "mcginley_dynamic_envelopes")]
 fn single_mcginley_dynamic_envelopes(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     difference: f64,
     previous_mcginley_dynamic: f64,
 ) -> PyResult<(f64, f64, f64)> {
@@ -155,7 +157,7 @@ fn single_mcginley_dynamic_envelopes(
 ///     List of McGinley dynamic envelopes tuple (lower envelope, McGinley dynamic, upper envelope)
 #[pyfunction(name = "mcginley_dynamic_envelopes")]
 fn bulk_mcginley_dynamic_envelopes(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     difference: f64,
     previous_mcginley_dynamic: f64,
     period: usize,
@@ -184,7 +186,7 @@ fn bulk_mcginley_dynamic_envelopes(
 ///     Moving constant bands tuple (lower band, constant model result, upper lower band)
 #[pyfunction(name = "moving_constant_bands")]
 fn single_moving_constant_bands(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     deviation_model: &str,
     deviation_multiplier: f64,
@@ -207,23 +209,37 @@ fn single_moving_constant_bands(
 ///         "median_absolute_deviation", "mode_absolute_deviation", or "ulcer_index"
 ///     deviation_multiplier: Price deviation multiplier
 ///     period: Period over which to calculate the moving constant bands
+///     parallel: Split the series into segments calculated on all cores (default False)
 ///
 /// Returns:
 ///     List of Moving constant bands tuple (lower band, constant model result, upper band)
 #[pyfunction(name = "moving_constant_bands")]
+#[pyo3(signature = (prices, constant_model_type, deviation_model, deviation_multiplier, period, parallel=false))]
 fn bulk_moving_constant_bands(
-    prices: Vec<f64>,
+    py: Python<'_>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     deviation_model: &str,
     deviation_multiplier: f64,
     period: usize,
+    parallel: bool,
 ) -> PyResult<Vec<(f64, f64, f64)>> {
-    Ok(ci::bulk::moving_constant_bands(
-        &prices,
-        crate::PyConstantModelType::from_string(constant_model_type)?.into(),
-        crate::PyDeviationModel::from_string(deviation_model)?.into(),
-        deviation_multiplier,
+    let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+    let deviation_model = crate::PyDeviationModel::from_string(deviation_model)?;
+    Ok(crate::windowed_bulk(
+        py,
+        parallel,
+        prices.len(),
         period,
+        |start, end| {
+            ci::bulk::moving_constant_bands(
+                &prices[start..end],
+                constant_model_type.clone().into(),
+                deviation_model.clone().into(),
+                deviation_multiplier,
+                period,
+            )
+        },
     ))
 }
 
@@ -242,7 +258,7 @@ fn bulk_moving_constant_bands(
 ///     McGinley dynamic bands tuple (lower band, McGinley dynamic, upper band)
 #[pyfunction(name = "mcginley_dynamic_bands")]
 fn single_mcginley_dynamic_bands(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     deviation_model: &str,
     deviation_multiplier: f64,
     previous_mcginley_dynamic: f64,
@@ -269,7 +285,7 @@ fn single_mcginley_dynamic_bands(
 ///     List of McGinley dynamic bands tuple (lower band, McGinley dynamic, upper band)
 #[pyfunction(name = "mcginley_dynamic_bands")]
 fn bulk_mcginley_dynamic_bands(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     deviation_model: &str,
     deviation_multiplier: f64,
     previous_mcginley_dynamic: f64,
@@ -301,9 +317,9 @@ fn bulk_mcginley_dynamic_bands(
 ///     revelant closing price)
 #[pyfunction(name = "ichimoku_cloud")]
 fn single_ichimoku_cloud(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
     conversion_period: usize,
     base_period: usize,
     span_b_period: usize,
@@ -333,9 +349,9 @@ fn single_ichimoku_cloud(
 ///     revelant closing price)
 #[pyfunction(name = "ichimoku_cloud")]
 fn bulk_ichimoku_cloud(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
     conversion_period: usize,
     base_period: usize,
     span_b_period: usize,
@@ -361,7 +377,10 @@ fn bulk_ichimoku_cloud(
 /// Returns:
 ///     Donchian channel tuple (lower, average, upper)
 #[pyfunction(name = "donchian_channels")]
-fn single_donchian_channels(high: Vec<f64>, low: Vec<f64>) -> PyResult<(f64, f64, f64)> {
+fn single_donchian_channels(
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+) -> PyResult<(f64, f64, f64)> {
     Ok(ci::single::donchian_channels(&high, &low))
 }
 
@@ -376,8 +395,8 @@ fn single_donchian_channels(high: Vec<f64>, low: Vec<f64>) -> PyResult<(f64, f64
 ///     List of Donchian channel tuples (lower, average, upper)
 #[pyfunction(name = "donchian_channels")]
 fn bulk_donchian_channels(
-    high: Vec<f64>,
-    low: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
     period: usize,
 ) -> PyResult<Vec<(f64, f64, f64)>> {
     Ok(ci::bulk::donchian_channels(&high, &low, period))
@@ -403,9 +422,9 @@ fn bulk_donchian_channels(
 ///     Keltner channel tuple
 #[pyfunction(name = "keltner_channel")]
 fn single_keltner_channel(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     constant_model_type: &str,
     atr_constant_model_type: &str,
     multiplier: f64,
@@ -434,23 +453,28 @@ fn single_keltner_channel(
 ///         for the ATR
 ///     multiplier: Multiplier for the ATR
 ///     period: Period over which to calculate the Keltner Channel
+///     last: Only calculate the last N values, which reads only the final N + period - 1
+///         inputs (default None, all values)
 ///
 /// Returns:
 ///     List of Keltner channel tuples
 #[pyfunction(name = "keltner_channel")]
+#[pyo3(signature = (high, low, close, constant_model_type, atr_constant_model_type, multiplier, period, last=None))]
 fn bulk_keltner_channel(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: &Bound<'_, PyAny>,
+    low: &Bound<'_, PyAny>,
+    close: &Bound<'_, PyAny>,
     constant_model_type: &str,
     atr_constant_model_type: &str,
     multiplier: f64,
     period: usize,
+    last: Option<usize>,
 ) -> PyResult<Vec<(f64, f64, f64)>> {
+    let prices = crate::extract_tails(&[high, low, close], period, last)?;
     Ok(ci::bulk::keltner_channel(
-        &high,
-        &low,
-        &close,
+        &prices[0],
+        &prices[1],
+        &prices[2],
         crate::PyConstantModelType::from_string(constant_model_type)?.into(),
         crate::PyConstantModelType::from_string(atr_constant_model_type)?.into(),
         multiplier,
@@ -472,9 +496,9 @@ fn bulk_keltner_channel(
 ///     Super Trend indicator
 #[pyfunction(name = "supertrend")]
 fn single_supertrend(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     constant_model_type: &str,
     multiplier: f64,
 ) -> PyResult<f64> {
@@ -502,9 +526,9 @@ fn single_supertrend(
 ///     List of Super Trend indicators
 #[pyfunction(name = "supertrend")]
 fn bulk_supertrend(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     constant_model_type: &str,
     multiplier: f64,
     period: usize,
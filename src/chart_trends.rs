@@ -1,3 +1,4 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use rust_ti::chart_trends as ct;
 
@@ -10,7 +11,7 @@ use rust_ti::chart_trends as ct;
 /// - Decompose a price series into upward/downward trends
 /// - Find peaks and valleys for support/resistance analysis
 /// - Quantify the overall or local trend direction of an asset
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn chart_trends(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(peaks, m)?)?;
     m.add_function(wrap_pyfunction!(valleys, m)?)?;
@@ -18,6 +19,7 @@ pub fn chart_trends(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(valley_trend, m)?)?;
     m.add_function(wrap_pyfunction!(overall_trend, m)?)?;
     m.add_function(wrap_pyfunction!(break_down_trends, m)?)?;
+    m.add_function(wrap_pyfunction!(rolling_trend, m)?)?;
     Ok(())
 }
 
@@ -31,7 +33,11 @@ pub fn chart_trends(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     List of tuples containing (peak value, peak index)
 #[pyfunction]
-fn peaks(prices: Vec<f64>, period: usize, closest_neighbor: usize) -> PyResult<Vec<(f64, usize)>> {
+fn peaks(
+    prices: crate::PriceSeries,
+    period: usize,
+    closest_neighbor: usize,
+) -> PyResult<Vec<(f64, usize)>> {
     Ok(ct::peaks(&prices, period, closest_neighbor))
 }
 
@@ -46,7 +52,7 @@ fn peaks(prices: Vec<f64>, period: usize, closest_neighbor: usize) -> PyResult<V
 ///     List of tuples containing (valley value, valley index)
 #[pyfunction]
 fn valleys(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     period: usize,
     closest_neighbor: usize,
 ) -> PyResult<Vec<(f64, usize)>> {
@@ -62,7 +68,7 @@ fn valleys(
 /// Returns:
 ///     Tuple containing (slope, intercept) of the peak trend line
 #[pyfunction]
-fn peak_trend(prices: Vec<f64>, period: usize) -> PyResult<(f64, f64)> {
+fn peak_trend(prices: crate::PriceSeries, period: usize) -> PyResult<(f64, f64)> {
     Ok(ct::peak_trend(&prices, period))
 }
 
@@ -75,7 +81,7 @@ fn peak_trend(prices: Vec<f64>, period: usize) -> PyResult<(f64, f64)> {
 /// Returns:
 ///     Tuple containing (slope, intercept) of the valley trend line
 #[pyfunction]
-fn valley_trend(prices: Vec<f64>, period: usize) -> PyResult<(f64, f64)> {
+fn valley_trend(prices: crate::PriceSeries, period: usize) -> PyResult<(f64, f64)> {
     Ok(ct::valley_trend(&prices, period))
 }
 
@@ -87,12 +93,19 @@ fn valley_trend(prices: Vec<f64>, period: usize) -> PyResult<(f64, f64)> {
 /// Returns:
 ///     Tuple containing (slope, intercept) of the overall trend line
 #[pyfunction]
-fn overall_trend(prices: Vec<f64>) -> PyResult<(f64, f64)> {
+fn overall_trend(prices: crate::PriceSeries) -> PyResult<(f64, f64)> {
     Ok(ct::overall_trend(&prices))
 }
 
 /// Calculates price trends and their slopes and intercepts
 ///
+/// Each trend is grown one price at a time and its least squares fit updated from running
+/// sums, so the whole breakdown is O(n). Once a trend has 4 or more prices the new price is
+/// judged against the fit: failing any hard limit (adjusted R², RMSE relative to the fit
+/// before the price was added, Durbin-Watson) or failing a soft limit more than
+/// `max_outliers` times in a row ends the trend at the previous price, and the next trend
+/// starts from that price. RMSE and Durbin-Watson limits are not applied to exact fits.
+///
 /// Args:
 ///     prices: List of prices
 ///     max_outliers: Allowed consecutive trend-breaks before splitting
@@ -109,7 +122,7 @@ fn overall_trend(prices: Vec<f64>) -> PyResult<(f64, f64)> {
 ///     List of tuples containing (start_index, end_index, slope, intercept) for each trend segment
 #[pyfunction]
 fn break_down_trends(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     max_outliers: usize,
     soft_adj_r_squared_minimum: f64,
     hard_adj_r_squared_minimum: f64,
@@ -120,9 +133,12 @@ fn break_down_trends(
     hard_durbin_watson_min: f64,
     hard_durbin_watson_max: f64,
 ) -> PyResult<Vec<(usize, usize, f64, f64)>> {
-    Ok(ct::break_down_trends(
+    if prices.is_empty() {
+        return Err(PyValueError::new_err("prices cannot be empty"));
+    }
+    Ok(segment_trends(
         &prices,
-        ct::TrendBreakConfig {
+        &ct::TrendBreakConfig {
             max_outliers,
             soft_adj_r_squared_minimum,
             hard_adj_r_squared_minimum,
@@ -135,3 +151,301 @@ fn break_down_trends(
         },
     ))
 }
+
+/// Calculates the least squares trend line of every rolling window
+///
+/// Each window is fitted as if passed to `overall_trend`, so x runs from 0 to `period - 1`
+/// and the intercept is the fitted value at the start of the window. Sliding sums make the
+/// scan O(n) rather than O(n * period). Windows holding a NaN or infinite price are all NaN.
+///
+/// Args:
+///     prices: List of prices
+///     period: Number of prices in each window (at least 2)
+///
+/// Returns:
+///     List of tuples containing (slope, intercept, r_squared, rmse) for each window
+#[pyfunction]
+fn rolling_trend(prices: crate::PriceSeries, period: usize) -> PyResult<Vec<(f64, f64, f64, f64)>> {
+    if period < 2 {
+        return Err(PyValueError::new_err("period must be at least 2"));
+    }
+    if period > prices.len() {
+        return Err(PyValueError::new_err(format!(
+            "period ({}) cannot be longer than prices ({})",
+            period,
+            prices.len()
+        )));
+    }
+    Ok(RollingRegression::new(&prices, period).collect())
+}
+
+/// Sums of a window of prices used by the least squares fit
+///
+/// Prices are offset by `shift` to limit cancellation in the sums of squares.
+#[derive(Clone, Copy)]
+struct WindowSums {
+    y: f64,
+    xy: f64,
+    yy: f64,
+}
+
+impl WindowSums {
+    fn exact(window: &[f64], shift: f64) -> Self {
+        let mut sums = WindowSums {
+            y: 0.0,
+            xy: 0.0,
+            yy: 0.0,
+        };
+        for (x, price) in window.iter().enumerate() {
+            let y = price - shift;
+            sums.y += y;
+            sums.xy += x as f64 * y;
+            sums.yy += y * y;
+        }
+        sums
+    }
+}
+
+/// Incremental least squares fit over a sliding window
+///
+/// The sums of x and x² are constant for a fixed window length, the sums of y, xy and y² are
+/// updated in O(1) per step. They are recomputed exactly once every `period` steps so rounding
+/// error cannot build up over long series.
+struct RollingRegression<'a> {
+    prices: &'a [f64],
+    period: usize,
+    start: usize,
+    shift: f64,
+    sum_x: f64,
+    denominator: f64,
+    sums: WindowSums,
+}
+
+impl<'a> RollingRegression<'a> {
+    fn new(prices: &'a [f64], period: usize) -> Self {
+        let n = period as f64;
+        let sum_x = n * (n - 1.0) / 2.0;
+        let sum_xx = (n - 1.0) * n * (2.0 * n - 1.0) / 6.0;
+        let shift = prices
+            .iter()
+            .copied()
+            .find(|price| price.is_finite())
+            .unwrap_or(0.0);
+        RollingRegression {
+            prices,
+            period,
+            start: 0,
+            shift,
+            sum_x,
+            denominator: n * sum_xx - sum_x * sum_x,
+            sums: WindowSums::exact(&prices[..period], shift),
+        }
+    }
+
+    fn slide(&mut self) {
+        let start = self.start;
+        // A NaN or infinite price cannot be subtracted back out of the sums
+        if start % self.period == 0 || !self.prices[start - 1].is_finite() {
+            self.sums = WindowSums::exact(&self.prices[start..start + self.period], self.shift);
+            return;
+        }
+        let removed = self.prices[start - 1] - self.shift;
+        let added = self.prices[start + self.period - 1] - self.shift;
+        // Every remaining price moves one x position to the left
+        self.sums.y += added - removed;
+        self.sums.xy += self.period as f64 * added - self.sums.y;
+        self.sums.yy += added * added - removed * removed;
+    }
+}
+
+impl Iterator for RollingRegression<'_> {
+    type Item = (f64, f64, f64, f64);
+
+    fn next(&mut self) -> Option<Self::Item> {
+        if self.start + self.period > self.prices.len() {
+            return None;
+        }
+        if self.start > 0 {
+            self.slide();
+        }
+        self.start += 1;
+
+        let n = self.period as f64;
+        let sums = self.sums;
+        if !sums.yy.is_finite() {
+            // The window holds a NaN or infinite price
+            return Some((f64::NAN, f64::NAN, f64::NAN, f64::NAN));
+        }
+        let slope = (n * sums.xy - self.sum_x * sums.y) / self.denominator;
+        let intercept = (sums.y - slope * self.sum_x) / n;
+        let sum_squared_errors = (sums.yy - intercept * sums.y - slope * sums.xy).max(0.0);
+        let total_sum_squares = sums.yy - sums.y * sums.y / n;
+        let r_squared = if total_sum_squares > 0.0 {
+            1.0 - sum_squared_errors / total_sum_squares
+        } else {
+            1.0
+        };
+        let rmse = (sum_squared_errors / n).sqrt();
+        Some((slope, intercept + self.shift, r_squared, rmse))
+    }
+}
+
+/// Least squares fit of a trend that grows one price at a time
+///
+/// x is counted from the first price of the trend and prices are offset by it, the sums of x
+/// and x² follow from the number of prices. The sums of price changes give the Durbin-Watson
+/// statistic without revisiting the residuals, since consecutive x differ by one.
+#[derive(Clone, Copy)]
+struct SegmentFit {
+    start: usize,
+    shift: f64,
+    len: usize,
+    sums: WindowSums,
+    change: f64,
+    change_squared: f64,
+}
+
+/// Goodness of fit of a trend
+struct FitQuality {
+    adj_r_squared: f64,
+    rmse: f64,
+    /// None for an exact fit
+    durbin_watson: Option<f64>,
+}
+
+impl SegmentFit {
+    fn new(prices: &[f64], start: usize) -> Self {
+        SegmentFit {
+            start,
+            shift: prices[start],
+            len: 0,
+            sums: WindowSums {
+                y: 0.0,
+                xy: 0.0,
+                yy: 0.0,
+            },
+            change: 0.0,
+            change_squared: 0.0,
+        }
+    }
+
+    /// Adds the price at `index`, which must follow the last price of the trend
+    fn push(&mut self, prices: &[f64], index: usize) {
+        let y = prices[index] - self.shift;
+        self.sums.y += y;
+        self.sums.xy += self.len as f64 * y;
+        self.sums.yy += y * y;
+        if self.len > 0 {
+            let change = prices[index] - prices[index - 1];
+            self.change += change;
+            self.change_squared += change * change;
+        }
+        self.len += 1;
+    }
+
+    /// Slope and intercept with x counted from the start of the trend and prices offset
+    fn line(&self) -> (f64, f64) {
+        if self.len < 2 {
+            return (0.0, self.sums.y);
+        }
+        let n = self.len as f64;
+        let sum_x = n * (n - 1.0) / 2.0;
+        let sum_xx = (n - 1.0) * n * (2.0 * n - 1.0) / 6.0;
+        let slope = (n * self.sums.xy - sum_x * self.sums.y) / (n * sum_xx - sum_x * sum_x);
+        (slope, (self.sums.y - slope * sum_x) / n)
+    }
+
+    /// Slope and intercept with x as the index into the prices
+    fn trend(&self) -> (f64, f64) {
+        let (slope, intercept) = self.line();
+        (slope, intercept + self.shift - slope * self.start as f64)
+    }
+
+    fn quality(&self) -> FitQuality {
+        let n = self.len as f64;
+        let (slope, intercept) = self.line();
+        let sums = self.sums;
+        let sum_squared_errors = (sums.yy - intercept * sums.y - slope * sums.xy).max(0.0);
+        // Errors this small are rounding in the sums, the prices lie on the line
+        if sum_squared_errors <= sums.yy * f64::EPSILON * n {
+            return FitQuality {
+                adj_r_squared: 1.0,
+                rmse: 0.0,
+                durbin_watson: None,
+            };
+        }
+        let total_sum_squares = sums.yy - sums.y * sums.y / n;
+        let r_squared = if total_sum_squares > 0.0 {
+            1.0 - sum_squared_errors / total_sum_squares
+        } else {
+            1.0
+        };
+        // Residual differences are the price changes less the slope
+        let residual_changes =
+            (self.change_squared - 2.0 * slope * self.change + slope * slope * (n - 1.0)).max(0.0);
+        FitQuality {
+            adj_r_squared: 1.0 - (1.0 - r_squared) * (n - 1.0) / (n - 2.0),
+            rmse: (sum_squared_errors / n).sqrt(),
+            durbin_watson: Some(residual_changes / sum_squared_errors),
+        }
+    }
+}
+
+impl FitQuality {
+    fn breaks(
+        &self,
+        previous: &FitQuality,
+        adj_r_squared_minimum: f64,
+        rmse_multiplier: f64,
+        durbin_watson_min: f64,
+        durbin_watson_max: f64,
+    ) -> bool {
+        self.adj_r_squared < adj_r_squared_minimum
+            || (previous.rmse > 0.0 && self.rmse > rmse_multiplier * previous.rmse)
+            || self
+                .durbin_watson
+                .is_some_and(|dw| dw < durbin_watson_min || dw > durbin_watson_max)
+    }
+}
+
+/// Splits prices into trends, see `break_down_trends`
+fn segment_trends(prices: &[f64], config: &ct::TrendBreakConfig) -> Vec<(usize, usize, f64, f64)> {
+    let mut trends = Vec::new();
+    let mut fit = SegmentFit::new(prices, 0);
+    fit.push(prices, 0);
+    let mut outliers = 0;
+    for index in 1..prices.len() {
+        let previous = fit;
+        fit.push(prices, index);
+        if fit.len < 4 {
+            continue;
+        }
+        let (before, after) = (previous.quality(), fit.quality());
+        let hard_break = after.breaks(
+            &before,
+            config.hard_adj_r_squared_minimum,
+            config.hard_rmse_multiplier,
+            config.hard_durbin_watson_min,
+            config.hard_durbin_watson_max,
+        );
+        let soft_break = after.breaks(
+            &before,
+            config.soft_adj_r_squared_minimum,
+            config.soft_rmse_multiplier,
+            config.soft_durbin_watson_min,
+            config.soft_durbin_watson_max,
+        );
+        outliers = if soft_break { outliers + 1 } else { 0 };
+        if hard_break || outliers > config.max_outliers {
+            let (slope, intercept) = previous.trend();
+            trends.push((previous.start, index - 1, slope, intercept));
+            fit = SegmentFit::new(prices, index - 1);
+            fit.push(prices, index - 1);
+            fit.push(prices, index);
+            outliers = 0;
+        }
+    }
+    let (slope, intercept) = fit.trend();
+    trends.push((fit.start, prices.len() - 1, slope, intercept));
+    trends
+}
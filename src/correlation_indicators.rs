@@ -13,7 +13,7 @@ use rust_ti::correlation_indicators as ci;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn correlation_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -23,6 +23,7 @@ pub fn correlation_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_correlate_asset_prices, &bulk_module)?)?;
     parent_module.add_submodule(&bulk_module)?;
     Ok(())
@@ -30,6 +31,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_correlate_asset_prices,
         &single_module
@@ -52,8 +54,8 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 ///     Correlation between the two asset price series.
 #[pyfunction(name = "correlate_asset_prices")]
 fn single_correlate_asset_prices(
-    prices_asset_a: Vec<f64>,
-    prices_asset_b: Vec<f64>,
+    prices_asset_a: crate::PriceSeries,
+    prices_asset_b: crate::PriceSeries,
     constant_model_type: &str,
     deviation_model: &str,
 ) -> PyResult<f64> {
@@ -75,22 +77,51 @@ fn single_correlate_asset_prices(
 ///     deviation_model: Choice of "standard_deviation", "mean_absolute_deviation",
 ///         "median_absolute_deviation", "mode_absolute_deviation", or "ulcer_index"
 ///     period: Period over which to calculate the correlation
+///     parallel: Split the series into segments calculated on all cores (default False)
+///     last: Only calculate the last N values, which reads only the final N + period - 1
+///         inputs (default None, all values)
 ///
 /// Returns:
 ///     List of correlations for each window of the given period.
 #[pyfunction(name = "correlate_asset_prices")]
+#[pyo3(signature = (prices_asset_a, prices_asset_b, constant_model_type, deviation_model, period, parallel=false, last=None))]
 fn bulk_correlate_asset_prices(
-    prices_asset_a: Vec<f64>,
-    prices_asset_b: Vec<f64>,
+    py: Python<'_>,
+    prices_asset_a: &Bound<'_, PyAny>,
+    prices_asset_b: &Bound<'_, PyAny>,
     constant_model_type: &str,
     deviation_model: &str,
     period: usize,
+    parallel: bool,
+    last: Option<usize>,
 ) -> PyResult<Vec<f64>> {
-    Ok(ci::bulk::correlate_asset_prices(
-        &prices_asset_a,
-        &prices_asset_b,
-        crate::PyConstantModelType::from_string(constant_model_type)?.into(),
-        crate::PyDeviationModel::from_string(deviation_model)?.into(),
+    let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+    let deviation_model = crate::PyDeviationModel::from_string(deviation_model)?;
+    let prices = crate::extract_tails(&[prices_asset_a, prices_asset_b], period, last)?;
+    let (prices_asset_a, prices_asset_b) = (&prices[0], &prices[1]);
+    if prices_asset_a.len() != prices_asset_b.len() {
+        // Leave RustTI to report the mismatched lengths
+        return Ok(ci::bulk::correlate_asset_prices(
+            &prices_asset_a,
+            &prices_asset_b,
+            constant_model_type.into(),
+            deviation_model.into(),
+            period,
+        ));
+    }
+    Ok(crate::windowed_bulk(
+        py,
+        parallel,
+        prices_asset_a.len(),
         period,
+        |start, end| {
+            ci::bulk::correlate_asset_prices(
+                &prices_asset_a[start..end],
+                &prices_asset_b[start..end],
+                constant_model_type.clone().into(),
+                deviation_model.clone().into(),
+                period,
+            )
+        },
     ))
 }
@@ -1,15 +1,29 @@
-use pyo3::exceptions::PyValueError;
+use std::ops::{Deref, Range};
+use std::sync::Arc;
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::PyList;
+use pyo3::IntoPyObjectExt;
 
 use rust_ti::{ConstantModelType, DeviationModel, MovingAverageType, Position};
 
+pub mod bars;
+pub mod cache;
 pub mod candle_indicators;
 pub mod chart_trends;
 pub mod correlation_indicators;
+mod kernels;
 pub mod momentum_indicators;
 pub mod moving_average;
+pub mod normalization;
 pub mod other_indicators;
+#[cfg(feature = "polars")]
+pub mod polars_plugin;
+pub mod shared_memory;
 pub mod standard_indicators;
+pub mod streaming;
 pub mod strength_indicators;
 pub mod trend_indicators;
 pub mod volatility_indicators;
@@ -161,38 +175,525 @@ impl From<PyPosition> for Position {
     }
 }
 
+#[derive(Clone, Copy, PartialEq)]
+pub enum PyNanPolicy {
+    Propagate,
+    Skip,
+    ForwardFill,
+    ResetWindow,
+}
+
+impl PyNanPolicy {
+    pub fn from_string(s: &str) -> PyResult<Self> {
+        match s.to_lowercase().as_str() {
+            "propagate" => Ok(PyNanPolicy::Propagate),
+            "skip" => Ok(PyNanPolicy::Skip),
+            "forward_fill" | "ffill" => Ok(PyNanPolicy::ForwardFill),
+            "reset" | "reset_window" => Ok(PyNanPolicy::ResetWindow),
+            _ => Err(PyValueError::new_err(format!(
+                "Unknown NaN policy: '{}'. Valid options are: 'propagate', 'skip', 'forward_fill', 'reset'",
+                s
+            ))),
+        }
+    }
+}
+
+#[derive(Clone, Copy, PartialEq)]
+pub enum PyNormalization {
+    ZScore,
+    PercentileRank,
+    RobustScale,
+    MinMaxScale,
+}
+
+impl PyNormalization {
+    pub fn from_string(s: &str) -> PyResult<Self> {
+        match s.to_lowercase().as_str() {
+            "z_score" | "zscore" => Ok(PyNormalization::ZScore),
+            "percentile_rank" | "rank" => Ok(PyNormalization::PercentileRank),
+            "robust_scale" | "robust" => Ok(PyNormalization::RobustScale),
+            "min_max_scale" | "min_max" => Ok(PyNormalization::MinMaxScale),
+            _ => Err(PyValueError::new_err(format!(
+                "Unknown normalization: '{}'. Valid options are: 'z_score', 'percentile_rank', 'robust_scale', 'min_max_scale'",
+                s
+            ))),
+        }
+    }
+}
+
+/// A series of prices passed in from Python
+///
+/// Lists (and other sequences) are copied into a `Vec<f64>` as before. Objects exposing a
+/// one-dimensional float64 buffer, such as a `SharedFrame` column, a `memoryview` or a NumPy
+/// array, are copied with a single memcpy rather than converted element by element. Buffers
+/// are never read in place: a read-only view says nothing about the memory behind it, which
+/// `SharedFrame.write`, another process or a writable base array can still change while
+/// indicators run with the GIL released. `Bars` column views share the container's buffer,
+/// which Rust owns and never changes.
+pub enum PriceSeries {
+    Owned(Vec<f64>),
+    Column(Arc<Vec<f64>>, Range<usize>),
+}
+
+impl PriceSeries {
+    /// Returns the prices as an owned `Vec<f64>`, copying shared columns
+    pub fn into_vec(self) -> Vec<f64> {
+        self.into_vec_from(0)
+    }
+
+    /// Returns the prices from index `start` onwards as an owned `Vec<f64>`
+    pub fn into_vec_from(self, start: usize) -> Vec<f64> {
+        match self {
+            PriceSeries::Owned(mut prices) => {
+                prices.drain(..start);
+                prices
+            }
+            PriceSeries::Column(..) => self[start..].to_vec(),
+        }
+    }
+}
+
+impl Deref for PriceSeries {
+    type Target = [f64];
+
+    fn deref(&self) -> &[f64] {
+        match self {
+            PriceSeries::Owned(prices) => prices,
+            PriceSeries::Column(values, range) => &values[range.clone()],
+        }
+    }
+}
+
+impl<'py> FromPyObject<'py> for PriceSeries {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(column) = ob.downcast::<bars::BarsColumn>() {
+            let (values, start, end) = column.get().shared();
+            return Ok(PriceSeries::Column(values, start..end));
+        }
+        if !ob.is_instance_of::<PyList>() {
+            if let Ok(buffer) = PyBuffer::<f64>::get(ob) {
+                if buffer.dimensions() != 1 {
+                    return Err(PyTypeError::new_err(format!(
+                        "Expected a one-dimensional float64 buffer, got {} dimensions",
+                        buffer.dimensions()
+                    )));
+                }
+                return Ok(PriceSeries::Owned(buffer.to_vec(ob.py())?));
+            }
+        }
+        Ok(PriceSeries::Owned(ob.extract()?))
+    }
+}
+
+/// Runs a bulk calculation over inputs that may contain NaN, applying a NaN policy
+///
+/// A bar is missing when any of its columns is NaN. `lag` is the number of bars consumed before
+/// the first output (`period - 1` for windowed indicators), and the output keeps the length and
+/// alignment of the plain bulk call, `len - lag`, with NaN where no value could be calculated.
+///
+/// - **Propagate**: inputs are used as given
+/// - **Skip**: missing bars are removed and the remaining bars calculated as one series
+/// - **ForwardFill**: missing values are replaced by the last value of the same column
+/// - **ResetWindow**: each run of bars between missing bars is calculated separately
+///
+/// Only skip and forward fill change the inputs, they clean a copy in the same pass that
+/// detects missing bars. The other policies read the inputs in place. The returned mask is `true` where a value was calculated for a
+/// bar that was not missing and is not NaN.
+fn apply_nan_policy<F>(
+    policy: PyNanPolicy,
+    columns: &[&[f64]],
+    lag: usize,
+    compute: F,
+) -> PyResult<(Vec<f64>, Vec<bool>)>
+where
+    F: Fn(&[&[f64]]) -> Vec<f64>,
+{
+    let len = columns.first().map_or(0, |column| column.len());
+    if columns.iter().any(|column| column.len() != len) {
+        return Err(PyValueError::new_err(
+            "All input lists must be the same length when using a NaN policy",
+        ));
+    }
+    let out_len = len.saturating_sub(lag);
+    let mut values = vec![f64::NAN; out_len];
+    let mut mask = vec![false; out_len];
+
+    let mut cleaned: Vec<Vec<f64>> = match policy {
+        PyNanPolicy::Skip | PyNanPolicy::ForwardFill => {
+            columns.iter().map(|column| column.to_vec()).collect()
+        }
+        PyNanPolicy::Propagate | PyNanPolicy::ResetWindow => Vec::new(),
+    };
+    let mut observed = Vec::with_capacity(len);
+    let mut positions = Vec::new();
+    let mut kept = 0;
+    for i in 0..len {
+        let present = columns.iter().all(|column| !column[i].is_nan());
+        observed.push(present);
+        match policy {
+            PyNanPolicy::ForwardFill if i > 0 => {
+                for column in cleaned.iter_mut() {
+                    if column[i].is_nan() {
+                        column[i] = column[i - 1];
+                    }
+                }
+            }
+            PyNanPolicy::Skip if present => {
+                for column in cleaned.iter_mut() {
+                    column[kept] = column[i];
+                }
+                positions.push(i);
+                kept += 1;
+            }
+            _ => {}
+        }
+    }
+    if policy == PyNanPolicy::Skip {
+        for column in cleaned.iter_mut() {
+            column.truncate(kept);
+        }
+    }
+    let columns: Vec<&[f64]> = if cleaned.is_empty() {
+        columns.to_vec()
+    } else {
+        cleaned.iter().map(|column| column.as_slice()).collect()
+    };
+
+    let mut ranges = Vec::new();
+    match policy {
+        PyNanPolicy::Propagate => ranges.push((0, len)),
+        PyNanPolicy::ForwardFill => {
+            // Leading bars cannot be filled, start at the first bar with every column present
+            let first = columns
+                .iter()
+                .map(|column| column.iter().position(|v| !v.is_nan()).unwrap_or(len))
+                .max()
+                .unwrap_or(len);
+            ranges.push((first, len));
+        }
+        PyNanPolicy::ResetWindow => {
+            let mut start = 0;
+            for i in 0..=len {
+                if i == len || !observed[i] {
+                    if i > start {
+                        ranges.push((start, i));
+                    }
+                    start = i + 1;
+                }
+            }
+        }
+        PyNanPolicy::Skip => {
+            if kept > lag {
+                for (k, value) in compute(&columns).into_iter().enumerate() {
+                    let position = positions[k + lag] - lag;
+                    values[position] = value;
+                    mask[position] = !value.is_nan();
+                }
+            }
+        }
+    }
+
+    for (start, end) in ranges {
+        if end - start <= lag {
+            continue;
+        }
+        let slices: Vec<&[f64]> = columns.iter().map(|column| &column[start..end]).collect();
+        for (k, value) in compute(&slices).into_iter().enumerate() {
+            let position = start + k;
+            values[position] = value;
+            mask[position] = observed[position + lag] && !value.is_nan();
+        }
+    }
+    Ok((values, mask))
+}
+
+/// Runs a bulk calculation with the optional `nan_policy` and `validity_mask` arguments
+///
+/// Without a NaN policy or mask the calculation runs on the inputs exactly as before, reading
+/// them in place. Otherwise see `apply_nan_policy`, and a `(values, mask)` tuple is returned
+/// when the mask was requested.
+pub(crate) fn bulk_with_nan_policy<F>(
+    py: Python<'_>,
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+    columns: &[&[f64]],
+    lag: usize,
+    compute: F,
+) -> PyResult<PyObject>
+where
+    F: Fn(&[&[f64]]) -> Vec<f64>,
+{
+    let policy = match nan_policy {
+        Some(nan_policy) => PyNanPolicy::from_string(nan_policy)?,
+        None if validity_mask => PyNanPolicy::Propagate,
+        None => return compute(columns).into_py_any(py),
+    };
+    let (values, mask) = apply_nan_policy(policy, columns, lag, compute)?;
+    if validity_mask {
+        (values, mask).into_py_any(py)
+    } else {
+        values.into_py_any(py)
+    }
+}
+
+/// Index of the first input needed for the last `last` outputs of a windowed bulk function
+///
+/// When every output reads `window` consecutive inputs, the last `last` outputs only depend on
+/// the final `last + window - 1` inputs, so that is all that needs to be read. `window` is the
+/// warm-up length documented on each bulk function that accepts `last`.
+pub(crate) fn tail_start(len: usize, window: usize, last: Option<usize>) -> PyResult<usize> {
+    match last {
+        None => Ok(0),
+        Some(0) => Err(PyValueError::new_err("last must be at least 1")),
+        Some(last) => Ok(len.saturating_sub(last.saturating_add(window.saturating_sub(1)))),
+    }
+}
+
+/// Extracts only the inputs needed for the last `last` outputs of a windowed bulk function
+///
+/// Lists are converted from `tail_start` onwards only, so a `last` call on a long history costs
+/// the length of the tail rather than of the history. Other inputs are extracted as usual and
+/// then sliced. Columns of different lengths are extracted in full so RustTI still reports the
+/// mismatch.
+pub(crate) fn extract_tails(
+    columns: &[&Bound<'_, PyAny>],
+    window: usize,
+    last: Option<usize>,
+) -> PyResult<Vec<PriceSeries>> {
+    tail_start(0, window, last)?;
+    let lens = columns
+        .iter()
+        .map(|column| column.len())
+        .collect::<PyResult<Vec<usize>>>();
+    let len = match (last, lens) {
+        (Some(_), Ok(lens)) if lens.windows(2).all(|pair| pair[0] == pair[1]) => {
+            lens.first().copied()
+        }
+        _ => None,
+    };
+    let Some(len) = len else {
+        return columns.iter().map(|column| column.extract()).collect();
+    };
+    let start = tail_start(len, window, last)?;
+    columns
+        .iter()
+        .map(|column| {
+            if let Ok(list) = column.downcast::<PyList>() {
+                return Ok(PriceSeries::Owned(list.get_slice(start, len).extract()?));
+            }
+            let prices: PriceSeries = column.extract()?;
+            if start == 0 {
+                return Ok(prices);
+            }
+            Ok(match prices {
+                PriceSeries::Column(values, range) => {
+                    PriceSeries::Column(values, range.start + start..range.end)
+                }
+                prices => PriceSeries::Owned(prices.into_vec_from(start)),
+            })
+        })
+        .collect()
+}
+
+/// Runs a bulk calculation separately on each segment of the inputs
+///
+/// `segment_starts` are the indices of the first bar of each segment, for example the first bar
+/// of each trading session. `compute(start, end)` must return the outputs of the plain bulk call
+/// on `inputs[start..end]`, so windows and recursive state restart at every boundary. `lag` is
+/// the number of bars consumed before the first output, and the result keeps the length and
+/// alignment of the plain bulk call, `len - lag`, with NaN where an output would need bars from
+/// the previous segment.
+pub(crate) fn bulk_by_segment<F>(
+    len: usize,
+    lag: usize,
+    segment_starts: &[usize],
+    compute: F,
+) -> PyResult<Vec<f64>>
+where
+    F: Fn(usize, usize) -> Vec<f64>,
+{
+    let mut boundaries = Vec::with_capacity(segment_starts.len() + 2);
+    boundaries.push(0);
+    for &start in segment_starts {
+        if start > len {
+            return Err(PyValueError::new_err(format!(
+                "Segment start {} is beyond the end of the inputs ({})",
+                start, len
+            )));
+        }
+        let previous = boundaries[boundaries.len() - 1];
+        if start < previous {
+            return Err(PyValueError::new_err(
+                "segment_starts must be in ascending order",
+            ));
+        }
+        if start > previous {
+            boundaries.push(start);
+        }
+    }
+    boundaries.push(len);
+
+    let mut values = vec![f64::NAN; len.saturating_sub(lag)];
+    for bounds in boundaries.windows(2) {
+        let (start, end) = (bounds[0], bounds[1]);
+        if end <= start + lag {
+            continue;
+        }
+        for (k, value) in compute(start, end).into_iter().enumerate() {
+            values[start + k] = value;
+        }
+    }
+    Ok(values)
+}
+
+/// Checks that the inputs of a segmented bulk call line up
+pub(crate) fn check_segment_lengths(lengths: &[usize]) -> PyResult<()> {
+    if lengths.windows(2).any(|pair| pair[0] != pair[1]) {
+        return Err(PyValueError::new_err(format!(
+            "All inputs must line up when using segment_starts, got lengths {:?}",
+            lengths
+        )));
+    }
+    Ok(())
+}
+
+/// Minimum number of outputs given to each thread when a windowed bulk function runs in parallel
+const MIN_OUTPUTS_PER_THREAD: usize = 1024;
+
+/// Environment variable fixing the number of segments a parallel windowed bulk function uses
+///
+/// Set by the tests so the segments are split and stitched back together whatever the number
+/// of cores, it bypasses `MIN_OUTPUTS_PER_THREAD`.
+const PARALLEL_THREADS_VAR: &str = "PYTI_PARALLEL_THREADS";
+
+/// Runs a windowed bulk calculation, optionally split across all available cores
+///
+/// `compute(start, end)` must return the outputs for the windows fully contained in
+/// `inputs[start..end]`. When `parallel` is set the outputs are split into contiguous segments,
+/// each segment is given the `period - 1` preceding inputs as warm-up, and the segment results
+/// are concatenated in order. Every window is calculated from exactly the same inputs as in the
+/// sequential calculation, so the output is bit-identical.
+pub(crate) fn windowed_bulk<T, F>(
+    py: Python<'_>,
+    parallel: bool,
+    len: usize,
+    period: usize,
+    compute: F,
+) -> Vec<T>
+where
+    T: Send,
+    F: Fn(usize, usize) -> Vec<T> + Sync,
+{
+    if !parallel || period == 0 || period > len {
+        return compute(0, len);
+    }
+    let outputs = len - period + 1;
+    let threads = match std::env::var(PARALLEL_THREADS_VAR)
+        .ok()
+        .and_then(|threads| threads.parse::<usize>().ok())
+    {
+        Some(threads) => threads.min(outputs),
+        None => std::thread::available_parallelism()
+            .map(|n| n.get())
+            .unwrap_or(1)
+            .min(outputs / MIN_OUTPUTS_PER_THREAD),
+    }
+    .max(1);
+    if threads == 1 {
+        return compute(0, len);
+    }
+    let chunk = outputs.div_ceil(threads);
+    py.allow_threads(|| {
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = (0..outputs)
+                .step_by(chunk)
+                .map(|start| {
+                    let end = (start + chunk).min(outputs);
+                    let compute = &compute;
+                    scope.spawn(move || compute(start, end + period - 1))
+                })
+                .collect();
+            handles
+                .into_iter()
+                .flat_map(|handle| {
+                    handle
+                        .join()
+                        .unwrap_or_else(|e| std::panic::resume_unwind(e))
+                })
+                .collect()
+        })
+    })
+}
+
 /// A Python module implemented in Rust.
-#[pymodule]
+#[pymodule(gil_used = false)]
 fn pytechnicalindicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     let momentum_mod = PyModule::new(m.py(), "momentum_indicators")?;
+    momentum_mod.gil_used(false)?;
     let _ = momentum_indicators::momentum_indicators(&momentum_mod)?;
     m.add_submodule(&momentum_mod)?;
     let candle_mod = PyModule::new(m.py(), "candle_indicators")?;
+    candle_mod.gil_used(false)?;
     let _ = candle_indicators::candle_indicators(&candle_mod)?;
     m.add_submodule(&candle_mod)?;
     let trend_mod = PyModule::new(m.py(), "trend_indicators")?;
+    trend_mod.gil_used(false)?;
     let _ = trend_indicators::trend_indicators(&trend_mod)?;
     m.add_submodule(&trend_mod)?;
     let strength_mod = PyModule::new(m.py(), "strength_indicators")?;
+    strength_mod.gil_used(false)?;
     let _ = strength_indicators::strength_indicators(&strength_mod)?;
     m.add_submodule(&strength_mod)?;
     let other_mod = PyModule::new(m.py(), "other_indicators")?;
+    other_mod.gil_used(false)?;
     let _ = other_indicators::other_indicators(&other_mod)?;
     m.add_submodule(&other_mod)?;
     let standard_mod = PyModule::new(m.py(), "standard_indicators")?;
+    standard_mod.gil_used(false)?;
     let _ = standard_indicators::standard_indicators(&standard_mod)?;
     m.add_submodule(&standard_mod)?;
     let chart_mod = PyModule::new(m.py(), "chart_trends")?;
+    chart_mod.gil_used(false)?;
     let _ = chart_trends::chart_trends(&chart_mod)?;
     m.add_submodule(&chart_mod)?;
     let corr_mod = PyModule::new(m.py(), "correlation_indicators")?;
+    corr_mod.gil_used(false)?;
     let _ = correlation_indicators::correlation_indicators(&corr_mod)?;
     m.add_submodule(&corr_mod)?;
     let vol_mod = PyModule::new(m.py(), "volatility_indicators")?;
+    vol_mod.gil_used(false)?;
     let _ = volatility_indicators::volatility_indicators(&vol_mod)?;
     m.add_submodule(&vol_mod)?;
     let ma_mod = PyModule::new(m.py(), "moving_average")?;
+    ma_mod.gil_used(false)?;
     let _ = moving_average::moving_average(&ma_mod)?;
     m.add_submodule(&ma_mod)?;
+    let normalization_mod = PyModule::new(m.py(), "normalization")?;
+    normalization_mod.gil_used(false)?;
+    let _ = normalization::normalization(&normalization_mod)?;
+    m.add_submodule(&normalization_mod)?;
+    let bars_mod = PyModule::new(m.py(), "bars")?;
+    bars_mod.gil_used(false)?;
+    let _ = bars::bars(&bars_mod)?;
+    m.add_submodule(&bars_mod)?;
+    let cache_mod = PyModule::new(m.py(), "cache")?;
+    cache_mod.gil_used(false)?;
+    let _ = cache::cache(&cache_mod)?;
+    m.add_submodule(&cache_mod)?;
+    #[cfg(feature = "polars")]
+    {
+        let polars_mod = PyModule::new(m.py(), "polars_plugin")?;
+        polars_mod.gil_used(false)?;
+        let _ = polars_plugin::polars_plugin(&polars_mod)?;
+        m.add_submodule(&polars_mod)?;
+    }
+    let shared_memory_mod = PyModule::new(m.py(), "shared_memory")?;
+    shared_memory_mod.gil_used(false)?;
+    let _ = shared_memory::shared_memory(&shared_memory_mod)?;
+    m.add_submodule(&shared_memory_mod)?;
+    let streaming_mod = PyModule::new(m.py(), "streaming")?;
+    streaming_mod.gil_used(false)?;
+    let _ = streaming::streaming(&streaming_mod)?;
+    m.add_submodule(&streaming_mod)?;
     Ok(())
 }
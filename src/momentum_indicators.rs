@@ -1,4 +1,6 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
 use rust_ti::momentum_indicators as mi;
 
 /// The `momentum_indicators` module provides functions to measure the speed, strength, and direction of price movements in time series data.
@@ -14,7 +16,7 @@ use rust_ti::momentum_indicators as mi;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn momentum_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -24,6 +26,7 @@ pub fn momentum_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(
         bulk_relative_strength_index,
         &bulk_module
@@ -65,6 +68,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_relative_strength_index,
         &single_module
@@ -118,7 +122,10 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     Relative Strength Index
 #[pyfunction(name = "relative_strength_index")]
-fn single_relative_strength_index(prices: Vec<f64>, constant_model_type: &str) -> PyResult<f64> {
+fn single_relative_strength_index(
+    prices: crate::PriceSeries,
+    constant_model_type: &str,
+) -> PyResult<f64> {
     Ok(mi::single::relative_strength_index(
         &prices,
         crate::PyConstantModelType::from_string(constant_model_type)?.into(),
@@ -132,20 +139,28 @@ fn single_relative_strength_index(prices: Vec<f64>, constant_model_type: &str) -
 ///     constant_model_type: Choice of "simple_moving_average", "smoothed_moving_average",
 ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
 ///     period: Period over which to calculate the RSI
+///     normalize: Tuple of a normalization, "z_score", "percentile_rank", "robust_scale" or
+///         "min_max_scale", and the period to normalize the RSI over (default None)
 ///
 /// Returns:
-///     List of Relative Strength Index
+///     List of Relative Strength Index, normalized when `normalize` is given, in which case
+///     the list is shorter by the normalization period - 1
 #[pyfunction(name = "relative_strength_index")]
+#[pyo3(signature = (prices, constant_model_type, period, normalize=None))]
 fn bulk_relative_strength_index(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
+    normalize: Option<(String, usize)>,
 ) -> PyResult<Vec<f64>> {
-    Ok(mi::bulk::relative_strength_index(
-        &prices,
-        crate::PyConstantModelType::from_string(constant_model_type)?.into(),
-        period,
-    ))
+    crate::normalization::normalize_output(
+        mi::bulk::relative_strength_index(
+            &prices,
+            crate::PyConstantModelType::from_string(constant_model_type)?.into(),
+            period,
+        ),
+        normalize,
+    )
 }
 
 // Stochastic Oscillator
@@ -158,7 +173,7 @@ fn bulk_relative_strength_index(
 /// Returns:
 ///     Stochastic Oscillator
 #[pyfunction(name = "stochastic_oscillator")]
-fn single_stochastic_oscillator(prices: Vec<f64>) -> PyResult<f64> {
+fn single_stochastic_oscillator(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(mi::single::stochastic_oscillator(&prices))
 }
 
@@ -171,7 +186,7 @@ fn single_stochastic_oscillator(prices: Vec<f64>) -> PyResult<f64> {
 /// Returns:
 ///     List of Stochastic Oscillators
 #[pyfunction(name = "stochastic_oscillator")]
-fn bulk_stochastic_oscillator(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn bulk_stochastic_oscillator(prices: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
     Ok(mi::bulk::stochastic_oscillator(&prices, period))
 }
 
@@ -187,7 +202,10 @@ fn bulk_stochastic_oscillator(prices: Vec<f64>, period: usize) -> PyResult<Vec<f
 /// Returns:
 ///     Slow stochastic
 #[pyfunction(name = "slow_stochastic")]
-fn single_slow_stochastic(stochastics: Vec<f64>, constant_model_type: &str) -> PyResult<f64> {
+fn single_slow_stochastic(
+    stochastics: crate::PriceSeries,
+    constant_model_type: &str,
+) -> PyResult<f64> {
     Ok(mi::single::slow_stochastic(
         &stochastics,
         crate::PyConstantModelType::from_string(constant_model_type)?.into(),
@@ -206,7 +224,7 @@ fn single_slow_stochastic(stochastics: Vec<f64>, constant_model_type: &str) -> P
 ///     List of Slow stochastics
 #[pyfunction(name = "slow_stochastic")]
 fn bulk_slow_stochastic(
-    stochastics: Vec<f64>,
+    stochastics: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
 ) -> PyResult<Vec<f64>> {
@@ -230,7 +248,7 @@ fn bulk_slow_stochastic(
 ///     Slowest stochastic
 #[pyfunction(name = "slowest_stochastic")]
 fn single_slowest_stochastic(
-    slow_stochastics: Vec<f64>,
+    slow_stochastics: crate::PriceSeries,
     constant_model_type: &str,
 ) -> PyResult<f64> {
     Ok(mi::single::slowest_stochastic(
@@ -251,7 +269,7 @@ fn single_slowest_stochastic(
 ///     List of lowest stochastic
 #[pyfunction(name = "slowest_stochastic")]
 fn bulk_slowest_stochastic(
-    slow_stochastics: Vec<f64>,
+    slow_stochastics: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
 ) -> PyResult<Vec<f64>> {
@@ -274,7 +292,11 @@ fn bulk_slowest_stochastic(
 /// Returns:
 ///     Williams %R
 #[pyfunction(name = "williams_percent_r")]
-fn single_williams_percent_r(high: Vec<f64>, low: Vec<f64>, close: f64) -> PyResult<f64> {
+fn single_williams_percent_r(
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: f64,
+) -> PyResult<f64> {
     Ok(mi::single::williams_percent_r(&high, &low, close))
 }
 
@@ -290,9 +312,9 @@ fn single_williams_percent_r(high: Vec<f64>, low: Vec<f64>, close: f64) -> PyRes
 ///     List of Williams %R
 #[pyfunction(name = "williams_percent_r")]
 fn bulk_williams_percent_r(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     period: usize,
 ) -> PyResult<Vec<f64>> {
     Ok(mi::bulk::williams_percent_r(&high, &low, &close, period))
@@ -309,7 +331,10 @@ fn bulk_williams_percent_r(
 /// Returns:
 ///     Money Flow Index
 #[pyfunction(name = "money_flow_index")]
-fn single_money_flow_index(prices: Vec<f64>, volume: Vec<f64>) -> PyResult<f64> {
+fn single_money_flow_index(
+    prices: crate::PriceSeries,
+    volume: crate::PriceSeries,
+) -> PyResult<f64> {
     Ok(mi::single::money_flow_index(&prices, &volume))
 }
 
@@ -319,12 +344,30 @@ fn single_money_flow_index(prices: Vec<f64>, volume: Vec<f64>) -> PyResult<f64>
 ///     prices: List of prices
 ///     volume: List of volumes
 ///     period: Period over which to calculate the MFI
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
 ///
 /// Returns:
-///     Money Flow Index
+///     Money Flow Index, or a tuple of the values and the validity mask
 #[pyfunction(name = "money_flow_index")]
-fn bulk_money_flow_index(prices: Vec<f64>, volume: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
-    Ok(mi::bulk::money_flow_index(&prices, &volume, period))
+#[pyo3(signature = (prices, volume, period, nan_policy=None, validity_mask=false))]
+fn bulk_money_flow_index(
+    py: Python<'_>,
+    prices: crate::PriceSeries,
+    volume: crate::PriceSeries,
+    period: usize,
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+) -> PyResult<PyObject> {
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[..], &volume[..]],
+        period.saturating_sub(1),
+        |columns| mi::bulk::money_flow_index(columns[0], columns[1], period),
+    )
 }
 
 // Rate of Change
@@ -350,8 +393,8 @@ fn single_rate_of_change(current_price: f64, previous_price: f64) -> PyResult<f6
 /// Returns:
 ///     List of Rate of Change
 #[pyfunction(name = "rate_of_change")]
-fn bulk_rate_of_change(prices: Vec<f64>) -> PyResult<Vec<f64>> {
-    Ok(mi::bulk::rate_of_change(&prices))
+fn bulk_rate_of_change(prices: crate::PriceSeries) -> PyResult<Vec<f64>> {
+    crate::kernels::rate_of_change(&prices)
 }
 
 // On Balance Volume
@@ -387,20 +430,50 @@ fn single_on_balance_volume(
 ///     prices: List of prices
 ///     volume: List of volumes
 ///     previous_on_balance_volume: use 0.0 if none
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
+///     segment_starts: Indices of the first bar of each segment (e.g. each session open), the
+///         calculation restarts at every segment (default None, one segment)
 ///
 /// Returns:
-///     List of On Balance Volume
+///     List of On Balance Volume, or a tuple of the values and the validity mask. With
+///     `segment_starts` the first bar of each segment has no value and is NaN.
 #[pyfunction(name = "on_balance_volume")]
+#[pyo3(signature = (prices, volume, previous_on_balance_volume, nan_policy=None, validity_mask=false, segment_starts=None))]
 fn bulk_on_balance_volume(
-    prices: Vec<f64>,
-    volume: Vec<f64>,
+    py: Python<'_>,
+    prices: crate::PriceSeries,
+    volume: crate::PriceSeries,
     previous_on_balance_volume: f64,
-) -> PyResult<Vec<f64>> {
-    Ok(mi::bulk::on_balance_volume(
-        &prices,
-        &volume,
-        previous_on_balance_volume,
-    ))
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+    segment_starts: Option<Vec<usize>>,
+) -> PyResult<PyObject> {
+    if let Some(segment_starts) = segment_starts {
+        if nan_policy.is_some() || validity_mask {
+            return Err(PyValueError::new_err(
+                "segment_starts cannot be combined with nan_policy or validity_mask",
+            ));
+        }
+        crate::check_segment_lengths(&[prices.len(), volume.len()])?;
+        return crate::bulk_by_segment(prices.len(), 1, &segment_starts, |start, end| {
+            mi::bulk::on_balance_volume(
+                &prices[start..end],
+                &volume[start..end],
+                previous_on_balance_volume,
+            )
+        })?
+        .into_py_any(py);
+    }
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[..], &volume[..]],
+        1,
+        |columns| mi::bulk::on_balance_volume(columns[0], columns[1], previous_on_balance_volume),
+    )
 }
 
 // Commodity Channel Index
@@ -419,7 +492,7 @@ fn bulk_on_balance_volume(
 ///     Commodity Channel Index
 #[pyfunction(name = "commodity_channel_index")]
 fn single_commodity_channel_index(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     deviation_model: &str,
     constant_multiplier: f64,
@@ -442,24 +515,37 @@ fn single_commodity_channel_index(
 ///         "median_absolute_deviation", "mode_absolute_deviation", "ulcer_index"
 ///     constant_multiplier: Scale factor (normally 0.015)
 ///     period: Period over which to calculate the CCI
+///     parallel: Split the series into segments calculated on all cores (default False)
+///     normalize: Tuple of a normalization, "z_score", "percentile_rank", "robust_scale" or
+///         "min_max_scale", and the period to normalize the CCI over (default None)
 ///
 /// Returns:
-///     Commodity Channel Index
+///     Commodity Channel Index, normalized when `normalize` is given, in which case
+///     the list is shorter by the normalization period - 1
 #[pyfunction(name = "commodity_channel_index")]
+#[pyo3(signature = (prices, constant_model_type, deviation_model, constant_multiplier, period, parallel=false, normalize=None))]
 fn bulk_commodity_channel_index(
-    prices: Vec<f64>,
+    py: Python<'_>,
+    prices: crate::PriceSeries,
     constant_model_type: &str,
     deviation_model: &str,
     constant_multiplier: f64,
     period: usize,
+    parallel: bool,
+    normalize: Option<(String, usize)>,
 ) -> PyResult<Vec<f64>> {
-    Ok(mi::bulk::commodity_channel_index(
-        &prices,
-        crate::PyConstantModelType::from_string(constant_model_type)?.into(),
-        crate::PyDeviationModel::from_string(deviation_model)?.into(),
-        constant_multiplier,
-        period,
-    ))
+    let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+    let deviation_model = crate::PyDeviationModel::from_string(deviation_model)?;
+    let cci = crate::windowed_bulk(py, parallel, prices.len(), period, |start, end| {
+        mi::bulk::commodity_channel_index(
+            &prices[start..end],
+            constant_model_type.clone().into(),
+            deviation_model.clone().into(),
+            constant_multiplier,
+            period,
+        )
+    });
+    crate::normalization::normalize_output(cci, normalize)
 }
 
 // McGinley Dynamic Commodity Channel Index
@@ -477,7 +563,7 @@ fn bulk_commodity_channel_index(
 ///     A tuple with the Commodity Channel Index and McGinley Dynamic
 #[pyfunction(name = "mcginley_dynamic_commodity_channel_index")]
 fn single_mcginley_dynamic_commodity_channel_index(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     previous_mcginley_dynamic: f64,
     deviation_model: &str,
     constant_multiplier: f64,
@@ -504,7 +590,7 @@ fn single_mcginley_dynamic_commodity_channel_index(
 ///     A tuple with the Commodity Channel Index and McGinley Dynamic
 #[pyfunction(name = "mcginley_dynamic_commodity_channel_index")]
 fn bulk_mcginley_dynamic_commodity_channel_index(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     previous_mcginley_dynamic: f64,
     deviation_model: &str,
     constant_multiplier: f64,
@@ -535,7 +621,7 @@ fn bulk_mcginley_dynamic_commodity_channel_index(
 ///     Moving Average Convergence Divergence
 #[pyfunction(name = "macd_line")]
 fn single_macd_line(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     short_period_model: &str,
     long_period_model: &str,
@@ -563,7 +649,7 @@ fn single_macd_line(
 ///     Moving Average Convergence Divergence
 #[pyfunction(name = "macd_line")]
 fn bulk_macd_line(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     short_period_model: &str,
     long_period: usize,
@@ -590,7 +676,7 @@ fn bulk_macd_line(
 /// Returns:
 ///     Signal line point
 #[pyfunction(name = "signal_line")]
-fn single_signal_line(macds: Vec<f64>, constant_model_type: &str) -> PyResult<f64> {
+fn single_signal_line(macds: crate::PriceSeries, constant_model_type: &str) -> PyResult<f64> {
     Ok(mi::single::signal_line(
         &macds,
         crate::PyConstantModelType::from_string(constant_model_type)?.into(),
@@ -609,7 +695,7 @@ fn single_signal_line(macds: Vec<f64>, constant_model_type: &str) -> PyResult<f6
 ///     List Signal line points
 #[pyfunction(name = "signal_line")]
 fn bulk_signal_line(
-    macds: Vec<f64>,
+    macds: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
 ) -> PyResult<Vec<f64>> {
@@ -635,7 +721,7 @@ fn bulk_signal_line(
 ///     dynamic
 #[pyfunction(name = "mcginley_dynamic_macd_line")]
 fn single_mcginley_dynamic_macd_line(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     previous_short_mcginley: f64,
     previous_long_mcginley: f64,
@@ -662,7 +748,7 @@ fn single_mcginley_dynamic_macd_line(
 ///     dynamic
 #[pyfunction(name = "mcginley_dynamic_macd_line")]
 fn bulk_mcginley_dynamic_macd_line(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     previous_short_mcginley: f64,
     long_period: usize,
@@ -697,10 +783,10 @@ fn bulk_mcginley_dynamic_macd_line(
 ///     Tuple of Chaikin Oscillator and Accumulation Distribution
 #[pyfunction(name = "chaikin_oscillator")]
 fn single_chaikin_oscillator(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
+    volume: crate::PriceSeries,
     short_period: usize,
     previous_accumulation_distribution: f64,
     short_period_model: &str,
@@ -737,10 +823,10 @@ fn single_chaikin_oscillator(
 ///     Tuple of Chaikin Oscillator and Accumulation Distribution
 #[pyfunction(name = "chaikin_oscillator")]
 fn bulk_chaikin_oscillator(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
+    volume: crate::PriceSeries,
     short_period: usize,
     long_period: usize,
     previous_accumulation_distribution: f64,
@@ -774,7 +860,7 @@ fn bulk_chaikin_oscillator(
 ///     The Percentage Price Oscillator
 #[pyfunction(name = "percentage_price_oscillator")]
 fn single_percentage_price_oscillator(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     constant_model_type: &str,
 ) -> PyResult<f64> {
@@ -798,7 +884,7 @@ fn single_percentage_price_oscillator(
 ///     List of Percentage Price Oscillator
 #[pyfunction(name = "percentage_price_oscillator")]
 fn bulk_percentage_price_oscillator(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     short_period: usize,
     long_period: usize,
     constant_model_type: &str,
@@ -821,7 +907,7 @@ fn bulk_percentage_price_oscillator(
 /// Returns:
 ///     The Chande Momentum Oscillator
 #[pyfunction(name = "chande_momentum_oscillator")]
-fn single_chande_momentum_oscillator(prices: Vec<f64>) -> PyResult<f64> {
+fn single_chande_momentum_oscillator(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(mi::single::chande_momentum_oscillator(&prices))
 }
 
@@ -834,6 +920,9 @@ fn single_chande_momentum_oscillator(prices: Vec<f64>) -> PyResult<f64> {
 /// Returns:
 ///     List Chande Momentum Oscillator
 #[pyfunction(name = "chande_momentum_oscillator")]
-fn bulk_chande_momentum_oscillator(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn bulk_chande_momentum_oscillator(
+    prices: crate::PriceSeries,
+    period: usize,
+) -> PyResult<Vec<f64>> {
     Ok(mi::bulk::chande_momentum_oscillator(&prices, period))
 }
@@ -1,4 +1,6 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
 use rust_ti::moving_average as ma;
 
 /// The `moving_average` module provides functions for calculating moving averages, a core component of many technical indicators and trading strategies.
@@ -6,7 +8,7 @@ use rust_ti::moving_average as ma;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn moving_average(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -16,6 +18,7 @@ pub fn moving_average(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_moving_average, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_mcginley_dynamic, &bulk_module)?)?;
     parent_module.add_submodule(&bulk_module)?;
@@ -25,6 +28,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(single_moving_average, &single_module)?)?;
     single_module.add_function(wrap_pyfunction!(single_mcginley_dynamic, &single_module)?)?;
     parent_module.add_submodule(&single_module)?;
@@ -40,7 +44,7 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     Moving average
 #[pyfunction(name = "moving_average")]
-fn single_moving_average(prices: Vec<f64>, moving_average_type: &str) -> PyResult<f64> {
+fn single_moving_average(prices: crate::PriceSeries, moving_average_type: &str) -> PyResult<f64> {
     Ok(ma::single::moving_average(
         &prices,
         crate::PyMovingAverageType::from_string(moving_average_type)?.into(),
@@ -53,20 +57,40 @@ fn single_moving_average(prices: Vec<f64>, moving_average_type: &str) -> PyResul
 ///     prices: List of prices
 ///     moving_average_type: Choice of "simple", "smoothed", "exponential"
 ///     period: Period over which to calculate the moving average
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
+///     last: Only calculate the last N values, which reads only the final N + period - 1
+///         inputs, cannot be combined with nan_policy (default None, all values)
 ///
 /// Returns:
-///     List of moving averages
+///     List of moving averages, or a tuple of the values and the validity mask
 #[pyfunction(name = "moving_average")]
+#[pyo3(signature = (prices, moving_average_type, period, nan_policy=None, validity_mask=false, last=None))]
 fn bulk_moving_average(
-    prices: Vec<f64>,
+    py: Python<'_>,
+    prices: &Bound<'_, PyAny>,
     moving_average_type: &str,
     period: usize,
-) -> PyResult<Vec<f64>> {
-    Ok(ma::bulk::moving_average(
-        &prices,
-        crate::PyMovingAverageType::from_string(moving_average_type)?.into(),
-        period,
-    ))
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+    last: Option<usize>,
+) -> PyResult<PyObject> {
+    let moving_average_type = crate::PyMovingAverageType::from_string(moving_average_type)?;
+    if last.is_some() && nan_policy.is_some() {
+        return Err(PyValueError::new_err(
+            "last cannot be combined with nan_policy",
+        ));
+    }
+    let prices = crate::extract_tails(&[prices], period, last)?;
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[0]],
+        period.saturating_sub(1),
+        |columns| ma::bulk::moving_average(columns[0], moving_average_type.clone().into(), period),
+    )
 }
 
 /// Calculates the McGinley dynamic
@@ -97,18 +121,48 @@ fn single_mcginley_dynamic(
 ///     prices: List of prices
 ///     previous_mcginley_dynamic: Previous McGinley dynamic (if none 0.0)
 ///     period: Period over which to calculate the McGinley dynamic
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
+///     segment_starts: Indices of the first bar of each segment (e.g. each session open), the
+///         calculation restarts at every segment (default None, one segment)
 ///
 /// Returns:
-///     List of McGinley dynamics
+///     List of McGinley dynamics, or a tuple of the values and the validity mask. With
+///     `segment_starts` the first `period - 1` bars of each segment have no value and are NaN.
 #[pyfunction(name = "mcginley_dynamic")]
+#[pyo3(signature = (prices, previous_mcginley_dynamic, period, nan_policy=None, validity_mask=false, segment_starts=None))]
 fn bulk_mcginley_dynamic(
-    prices: Vec<f64>,
+    py: Python<'_>,
+    prices: crate::PriceSeries,
     previous_mcginley_dynamic: f64,
     period: usize,
-) -> PyResult<Vec<f64>> {
-    Ok(ma::bulk::mcginley_dynamic(
-        &prices,
-        previous_mcginley_dynamic,
-        period,
-    ))
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+    segment_starts: Option<Vec<usize>>,
+) -> PyResult<PyObject> {
+    if let Some(segment_starts) = segment_starts {
+        if nan_policy.is_some() || validity_mask {
+            return Err(PyValueError::new_err(
+                "segment_starts cannot be combined with nan_policy or validity_mask",
+            ));
+        }
+        return crate::bulk_by_segment(
+            prices.len(),
+            period.saturating_sub(1),
+            &segment_starts,
+            |start, end| {
+                ma::bulk::mcginley_dynamic(&prices[start..end], previous_mcginley_dynamic, period)
+            },
+        )?
+        .into_py_any(py);
+    }
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[..]],
+        period.saturating_sub(1),
+        |columns| ma::bulk::mcginley_dynamic(columns[0], previous_mcginley_dynamic, period),
+    )
 }
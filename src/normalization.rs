@@ -0,0 +1,462 @@
+use std::collections::VecDeque;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+use crate::PyNormalization;
+
+/// The `normalization` module provides rolling normalizers that turn indicator outputs into
+/// scale-free features.
+///
+/// Every window is updated incrementally as it slides, in O(1) for the z-score and min-max
+/// scaling and O(log n) for the rank based normalizers, so normalizing a column costs one
+/// pass in Rust rather than a rolling apply in pandas.
+///
+/// ## When to Use
+/// Use normalization when:
+/// - Indicator outputs are used as model features and need a comparable scale
+/// - Features must only use past values, so a whole-series scaler would leak the future
+///
+/// ## Structure
+/// - **single**: Functions that normalize the last value against a slice of values.
+/// - **bulk**: Functions that normalize each value against the window ending at it.
+///
+/// The `bulk.relative_strength_index` and `bulk.commodity_channel_index` momentum indicators,
+/// `bulk.relative_vigor_index` strength indicator and `bulk.true_strength_index` trend
+/// indicator also take a `normalize` option that applies a normalizer to the indicator
+/// before its values are returned to Python.
+#[pymodule(gil_used = false)]
+pub fn normalization(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    register_bulk_module(m)?;
+    register_single_module(m)?;
+    Ok(())
+}
+
+/// **bulk**: Functions that normalize each value against the window ending at it.
+fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
+    let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
+    bulk_module.add_function(wrap_pyfunction!(bulk_z_score, &bulk_module)?)?;
+    bulk_module.add_function(wrap_pyfunction!(bulk_percentile_rank, &bulk_module)?)?;
+    bulk_module.add_function(wrap_pyfunction!(bulk_robust_scale, &bulk_module)?)?;
+    bulk_module.add_function(wrap_pyfunction!(bulk_min_max_scale, &bulk_module)?)?;
+    parent_module.add_submodule(&bulk_module)?;
+    Ok(())
+}
+
+/// **single**: Functions that normalize the last value against a slice of values.
+fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
+    let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
+    single_module.add_function(wrap_pyfunction!(single_z_score, &single_module)?)?;
+    single_module.add_function(wrap_pyfunction!(single_percentile_rank, &single_module)?)?;
+    single_module.add_function(wrap_pyfunction!(single_robust_scale, &single_module)?)?;
+    single_module.add_function(wrap_pyfunction!(single_min_max_scale, &single_module)?)?;
+    parent_module.add_submodule(&single_module)?;
+    Ok(())
+}
+
+/// Normalizes each value against the `period` values ending at it
+///
+/// Returns `len - period + 1` values. Windows containing NaN give NaN, windows with no
+/// spread give 0.0.
+pub(crate) fn rolling_normalize(
+    values: &[f64],
+    normalization: PyNormalization,
+    period: usize,
+) -> PyResult<Vec<f64>> {
+    if period < 2 {
+        return Err(PyValueError::new_err("period must be at least 2"));
+    }
+    if period > values.len() {
+        return Err(PyValueError::new_err(format!(
+            "period ({}) cannot be longer than values ({})",
+            period,
+            values.len()
+        )));
+    }
+    Ok(match normalization {
+        PyNormalization::ZScore => rolling_z_score(values, period),
+        PyNormalization::PercentileRank => rolling_percentile_rank(values, period),
+        PyNormalization::RobustScale => rolling_robust_scale(values, period),
+        PyNormalization::MinMaxScale => rolling_min_max_scale(values, period),
+    })
+}
+
+/// Applies the `normalize` option of a bulk indicator to its output
+pub(crate) fn normalize_output(
+    values: Vec<f64>,
+    normalize: Option<(String, usize)>,
+) -> PyResult<Vec<f64>> {
+    match normalize {
+        None => Ok(values),
+        Some((normalization, period)) => rolling_normalize(
+            &values,
+            PyNormalization::from_string(&normalization)?,
+            period,
+        ),
+    }
+}
+
+/// Normalizes the last value against all values
+fn normalize_last(values: &[f64], normalization: PyNormalization) -> PyResult<f64> {
+    Ok(rolling_normalize(values, normalization, values.len())?[0])
+}
+
+/// Running sums of a window, offset by `shift` to limit cancellation in the sum of squares
+#[derive(Default)]
+struct WindowMoments {
+    sum: f64,
+    sum_squares: f64,
+    missing: usize,
+}
+
+impl WindowMoments {
+    fn exact(window: &[f64], shift: f64) -> Self {
+        let mut moments = WindowMoments::default();
+        for value in window {
+            moments.add(value - shift);
+        }
+        moments
+    }
+
+    fn add(&mut self, value: f64) {
+        if value.is_nan() {
+            self.missing += 1;
+        } else {
+            self.sum += value;
+            self.sum_squares += value * value;
+        }
+    }
+
+    fn remove(&mut self, value: f64) {
+        if value.is_nan() {
+            self.missing -= 1;
+        } else {
+            self.sum -= value;
+            self.sum_squares -= value * value;
+        }
+    }
+}
+
+/// Rolling z-score from running sums, updated in O(1) per step
+///
+/// The sums are recomputed exactly once every `period` steps so rounding error cannot build
+/// up over long series.
+fn rolling_z_score(values: &[f64], period: usize) -> Vec<f64> {
+    let n = period as f64;
+    let shift = values.iter().copied().find(|v| !v.is_nan()).unwrap_or(0.0);
+    let mut moments = WindowMoments::exact(&values[..period - 1], shift);
+    let mut output = Vec::with_capacity(values.len() - period + 1);
+    for end in period..=values.len() {
+        let value = values[end - 1] - shift;
+        moments.add(value);
+        output.push(if moments.missing > 0 {
+            f64::NAN
+        } else {
+            let mean = moments.sum / n;
+            let mean_squares = moments.sum_squares / n;
+            let variance = mean_squares - mean * mean;
+            // Differences this small are rounding error in the sums, not spread
+            if variance <= mean_squares * f64::EPSILON * n {
+                0.0
+            } else {
+                (value - mean) / variance.sqrt()
+            }
+        });
+        if end % period == 0 {
+            moments = WindowMoments::exact(&values[end - period + 1..end], shift);
+        } else {
+            moments.remove(values[end - period] - shift);
+        }
+    }
+    output
+}
+
+/// Multiset of window values supporting rank and order statistic queries in O(log n)
+///
+/// Values are mapped to their position among the distinct values of the whole series, and a
+/// Fenwick tree counts how many of the window's values sit at each position.
+struct RankWindow {
+    sorted: Vec<f64>,
+    tree: Vec<usize>,
+    len: usize,
+    missing: usize,
+}
+
+impl RankWindow {
+    fn new(values: &[f64]) -> Self {
+        let mut sorted: Vec<f64> = values.iter().copied().filter(|v| !v.is_nan()).collect();
+        sorted.sort_unstable_by(f64::total_cmp);
+        sorted.dedup();
+        let tree = vec![0; sorted.len() + 1];
+        RankWindow {
+            sorted,
+            tree,
+            len: 0,
+            missing: 0,
+        }
+    }
+
+    fn position(&self, value: f64) -> usize {
+        self.sorted.partition_point(|v| *v < value)
+    }
+
+    fn insert(&mut self, value: f64) {
+        if value.is_nan() {
+            self.missing += 1;
+            return;
+        }
+        self.len += 1;
+        let mut i = self.position(value) + 1;
+        while i < self.tree.len() {
+            self.tree[i] += 1;
+            i += i & i.wrapping_neg();
+        }
+    }
+
+    fn remove(&mut self, value: f64) {
+        if value.is_nan() {
+            self.missing -= 1;
+            return;
+        }
+        self.len -= 1;
+        let mut i = self.position(value) + 1;
+        while i < self.tree.len() {
+            self.tree[i] -= 1;
+            i += i & i.wrapping_neg();
+        }
+    }
+
+    /// Number of window values less than or equal to `value`
+    fn count_at_most(&self, value: f64) -> usize {
+        let mut count = 0;
+        let mut i = self.position(value) + 1;
+        while i > 0 {
+            count += self.tree[i];
+            i -= i & i.wrapping_neg();
+        }
+        count
+    }
+
+    /// The `k`th smallest window value, counting from 0
+    fn nth(&self, k: usize) -> f64 {
+        let mut position = 0;
+        let mut remaining = k + 1;
+        let mut step = (self.tree.len() - 1).next_power_of_two();
+        while step > 0 {
+            let next = position + step;
+            if next < self.tree.len() && self.tree[next] < remaining {
+                position = next;
+                remaining -= self.tree[next];
+            }
+            step >>= 1;
+        }
+        self.sorted[position]
+    }
+
+    /// Quantile of the window values, linearly interpolated between order statistics
+    fn quantile(&self, q: f64) -> f64 {
+        let h = (self.len - 1) as f64 * q;
+        let lower = h.floor() as usize;
+        let fraction = h - lower as f64;
+        let low = self.nth(lower);
+        if fraction == 0.0 {
+            low
+        } else {
+            low + fraction * (self.nth(lower + 1) - low)
+        }
+    }
+}
+
+/// Slides a `RankWindow` over the values, calling `f` with the window and its last value
+fn rolling_ranked<F: Fn(&RankWindow, f64) -> f64>(values: &[f64], period: usize, f: F) -> Vec<f64> {
+    let mut window = RankWindow::new(values);
+    for value in &values[..period - 1] {
+        window.insert(*value);
+    }
+    let mut output = Vec::with_capacity(values.len() - period + 1);
+    for end in period..=values.len() {
+        let value = values[end - 1];
+        window.insert(value);
+        output.push(if window.missing > 0 {
+            f64::NAN
+        } else {
+            f(&window, value)
+        });
+        window.remove(values[end - period]);
+    }
+    output
+}
+
+/// Rolling percentile rank, the share of the window at or below the last value
+fn rolling_percentile_rank(values: &[f64], period: usize) -> Vec<f64> {
+    rolling_ranked(values, period, |window, value| {
+        window.count_at_most(value) as f64 / window.len as f64
+    })
+}
+
+/// Rolling robust scaling, the distance from the median in interquartile ranges
+fn rolling_robust_scale(values: &[f64], period: usize) -> Vec<f64> {
+    rolling_ranked(values, period, |window, value| {
+        let interquartile_range = window.quantile(0.75) - window.quantile(0.25);
+        if interquartile_range == 0.0 {
+            0.0
+        } else {
+            (value - window.quantile(0.5)) / interquartile_range
+        }
+    })
+}
+
+/// Rolling min-max scaling, with the window extremes kept in monotonic deques
+///
+/// Each value enters and leaves each deque once, so updates are amortized O(1).
+fn rolling_min_max_scale(values: &[f64], period: usize) -> Vec<f64> {
+    let mut maxima: VecDeque<usize> = VecDeque::with_capacity(period);
+    let mut minima: VecDeque<usize> = VecDeque::with_capacity(period);
+    let mut last_missing = None;
+    let mut output = Vec::with_capacity(values.len() - period + 1);
+    for (i, value) in values.iter().enumerate() {
+        if value.is_nan() {
+            last_missing = Some(i);
+        } else {
+            while maxima.back().is_some_and(|&j| values[j] <= *value) {
+                maxima.pop_back();
+            }
+            maxima.push_back(i);
+            while minima.back().is_some_and(|&j| values[j] >= *value) {
+                minima.pop_back();
+            }
+            minima.push_back(i);
+        }
+        if i + 1 < period {
+            continue;
+        }
+        let start = i + 1 - period;
+        while maxima.front().is_some_and(|&j| j < start) {
+            maxima.pop_front();
+        }
+        while minima.front().is_some_and(|&j| j < start) {
+            minima.pop_front();
+        }
+        if last_missing.is_some_and(|j| j >= start) {
+            output.push(f64::NAN);
+            continue;
+        }
+        let (max, min) = (values[maxima[0]], values[minima[0]]);
+        output.push(if max == min {
+            0.0
+        } else {
+            (value - min) / (max - min)
+        });
+    }
+    output
+}
+
+// Z-Score
+
+/// Calculates the z-score of the last value
+///
+/// Args:
+///     values: List of values
+///
+/// Returns:
+///     Number of standard deviations the last value is from the mean
+#[pyfunction(name = "z_score")]
+fn single_z_score(values: crate::PriceSeries) -> PyResult<f64> {
+    normalize_last(&values, PyNormalization::ZScore)
+}
+
+/// Calculates the rolling z-score
+///
+/// Args:
+///     values: List of values, such as the output of a bulk indicator
+///     period: Number of values in each window (at least 2)
+///
+/// Returns:
+///     List of z-scores, NaN for windows containing NaN
+#[pyfunction(name = "z_score")]
+fn bulk_z_score(values: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
+    rolling_normalize(&values, PyNormalization::ZScore, period)
+}
+
+// Percentile Rank
+
+/// Calculates the percentile rank of the last value
+///
+/// Args:
+///     values: List of values
+///
+/// Returns:
+///     Share of the values less than or equal to the last value, between 0 and 1
+#[pyfunction(name = "percentile_rank")]
+fn single_percentile_rank(values: crate::PriceSeries) -> PyResult<f64> {
+    normalize_last(&values, PyNormalization::PercentileRank)
+}
+
+/// Calculates the rolling percentile rank
+///
+/// Args:
+///     values: List of values, such as the output of a bulk indicator
+///     period: Number of values in each window (at least 2)
+///
+/// Returns:
+///     List of percentile ranks between 0 and 1, NaN for windows containing NaN
+#[pyfunction(name = "percentile_rank")]
+fn bulk_percentile_rank(values: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
+    rolling_normalize(&values, PyNormalization::PercentileRank, period)
+}
+
+// Robust Scale
+
+/// Scales the last value by the median and interquartile range
+///
+/// Args:
+///     values: List of values
+///
+/// Returns:
+///     Distance of the last value from the median, in interquartile ranges
+#[pyfunction(name = "robust_scale")]
+fn single_robust_scale(values: crate::PriceSeries) -> PyResult<f64> {
+    normalize_last(&values, PyNormalization::RobustScale)
+}
+
+/// Calculates the rolling robust scaling by the median and interquartile range
+///
+/// Args:
+///     values: List of values, such as the output of a bulk indicator
+///     period: Number of values in each window (at least 2)
+///
+/// Returns:
+///     List of robust scaled values, NaN for windows containing NaN
+#[pyfunction(name = "robust_scale")]
+fn bulk_robust_scale(values: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
+    rolling_normalize(&values, PyNormalization::RobustScale, period)
+}
+
+// Min-Max Scale
+
+/// Scales the last value by the minimum and maximum
+///
+/// Args:
+///     values: List of values
+///
+/// Returns:
+///     Position of the last value between the minimum (0) and maximum (1)
+#[pyfunction(name = "min_max_scale")]
+fn single_min_max_scale(values: crate::PriceSeries) -> PyResult<f64> {
+    normalize_last(&values, PyNormalization::MinMaxScale)
+}
+
+/// Calculates the rolling min-max scaling
+///
+/// Args:
+///     values: List of values, such as the output of a bulk indicator
+///     period: Number of values in each window (at least 2)
+///
+/// Returns:
+///     List of values scaled between 0 and 1, NaN for windows containing NaN
+#[pyfunction(name = "min_max_scale")]
+fn bulk_min_max_scale(values: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
+    rolling_normalize(&values, PyNormalization::MinMaxScale, period)
+}
@@ -15,7 +15,7 @@ use rust_ti::other_indicators as oi;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn other_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -25,6 +25,7 @@ pub fn other_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_return_on_investment, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_true_range, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_average_true_range, &bulk_module)?)?;
@@ -37,6 +38,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_return_on_investment,
         &single_module
@@ -84,7 +86,10 @@ fn single_return_on_investment(
 /// Returns:
 ///     List of tuples containing (final investment value, percentage return)
 #[pyfunction(name = "return_on_investment")]
-fn bulk_return_on_investment(prices: Vec<f64>, investment: f64) -> PyResult<Vec<(f64, f64)>> {
+fn bulk_return_on_investment(
+    prices: crate::PriceSeries,
+    investment: f64,
+) -> PyResult<Vec<(f64, f64)>> {
     Ok(oi::bulk::return_on_investment(&prices, investment))
 }
 
@@ -114,8 +119,12 @@ fn single_true_range(close: f64, high: f64, low: f64) -> PyResult<f64> {
 /// Returns:
 ///     List of True Range values
 #[pyfunction(name = "true_range")]
-fn bulk_true_range(close: Vec<f64>, high: Vec<f64>, low: Vec<f64>) -> PyResult<Vec<f64>> {
-    Ok(oi::bulk::true_range(&close, &high, &low))
+fn bulk_true_range(
+    close: crate::PriceSeries,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+) -> PyResult<Vec<f64>> {
+    crate::kernels::true_range(&close, &high, &low)
 }
 
 // Average True Range
@@ -133,9 +142,9 @@ fn bulk_true_range(close: Vec<f64>, high: Vec<f64>, low: Vec<f64>) -> PyResult<V
 ///     Average True Range value
 #[pyfunction(name = "average_true_range")]
 fn single_average_true_range(
-    close: Vec<f64>,
-    high: Vec<f64>,
-    low: Vec<f64>,
+    close: crate::PriceSeries,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
     constant_model_type: &str,
 ) -> PyResult<f64> {
     Ok(oi::single::average_true_range(
@@ -160,9 +169,9 @@ fn single_average_true_range(
 ///     List of Average True Range values
 #[pyfunction(name = "average_true_range")]
 fn bulk_average_true_range(
-    close: Vec<f64>,
-    high: Vec<f64>,
-    low: Vec<f64>,
+    close: crate::PriceSeries,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
 ) -> PyResult<Vec<f64>> {
@@ -202,11 +211,11 @@ fn single_internal_bar_strength(high: f64, low: f64, close: f64) -> PyResult<f64
 ///     List of internal bar strength values
 #[pyfunction(name = "internal_bar_strength")]
 fn bulk_internal_bar_strength(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
 ) -> PyResult<Vec<f64>> {
-    Ok(oi::bulk::internal_bar_strength(&high, &low, &close))
+    crate::kernels::internal_bar_strength(&high, &low, &close)
 }
 
 // Positivity Indicator
@@ -224,8 +233,8 @@ fn bulk_internal_bar_strength(
 ///     List of tuples containing (positivity indicator, signal line)
 #[pyfunction(name = "positivity_indicator")]
 fn bulk_positivity_indicator(
-    open: Vec<f64>,
-    previous_close: Vec<f64>,
+    open: crate::PriceSeries,
+    previous_close: crate::PriceSeries,
     signal_period: usize,
     constant_model_type: &str,
 ) -> PyResult<Vec<(f64, f64)>> {
@@ -0,0 +1,439 @@
+use polars::prelude::{
+    polars_err, DataType, Field, Float64Chunked, IntoSeries, NewChunkedArray, PlSmallStr,
+    PolarsResult, Series, StructChunked,
+};
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use pyo3_polars::derive::polars_expr;
+use pyo3_polars::PolarsAllocator;
+use rust_ti::{
+    candle_indicators as ci, momentum_indicators as mi, moving_average as ma,
+    trend_indicators as ti, volatility_indicators as vi,
+};
+use serde::Deserialize;
+
+// Series handed back to Polars are freed by Polars, so both must use the same allocator
+#[global_allocator]
+static ALLOC: PolarsAllocator = PolarsAllocator::new();
+
+/// The `polars_plugin` module runs the indicators natively inside Polars expressions.
+///
+/// The indicators are compiled as a Polars expression plugin, so they run inside the Polars
+/// engine on the column buffers, in parallel across groups and without converting to Python
+/// lists. Only available when the package is built with the `polars` feature.
+///
+/// ## When to Use
+/// Use the plugin when:
+/// - Indicators are part of (lazy) Polars queries
+/// - Indicators are calculated per symbol with `.over("symbol")` or inside `group_by`
+///
+/// The indicators depend on earlier rows, so Polars evaluates each expression on whole columns
+/// or groups. In streaming mode the query still runs, with these expressions evaluated on the
+/// full column rather than chunk by chunk.
+///
+/// ## Structure
+/// - **register_namespace**: Adds the `ti` namespace to `polars.Expr`.
+/// - **IndicatorNamespace**: The namespace, `pl.col("close").ti.relative_strength_index(14)`.
+#[pymodule(gil_used = false)]
+pub fn polars_plugin(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(register_namespace, m)?)?;
+    m.add_class::<IndicatorNamespace>()?;
+    Ok(())
+}
+
+/// Registers the indicator namespace on `polars.Expr`
+///
+/// Args:
+///     name: Name of the namespace (default "ti")
+///
+/// Example:
+///     polars_plugin.register_namespace()
+///     df.with_columns(pl.col("close").ti.relative_strength_index(14, "smoothed").over("symbol"))
+#[pyfunction]
+#[pyo3(signature = (name = "ti"))]
+fn register_namespace(py: Python<'_>, name: &str) -> PyResult<()> {
+    py.import("polars.api")?
+        .call_method1("register_expr_namespace", (name,))?
+        .call1((py.get_type::<IndicatorNamespace>(),))?;
+    Ok(())
+}
+
+/// Indicator expressions of a Polars expression
+///
+/// Outputs have the same length as the input, with null for the rows before the first full
+/// window. Model names accept the same values as the matching bulk functions.
+#[pyclass(module = "pytechnicalindicators.polars_plugin")]
+pub struct IndicatorNamespace {
+    expr: PyObject,
+}
+
+impl IndicatorNamespace {
+    fn plugin<'py>(
+        &self,
+        py: Python<'py>,
+        function_name: &str,
+        args: Vec<PyObject>,
+        kwargs: Bound<'py, PyDict>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let plugin_path = py.import("pytechnicalindicators")?.getattr("__file__")?;
+        let mut inputs = vec![self.expr.clone_ref(py)];
+        inputs.extend(args);
+        let options = PyDict::new(py);
+        options.set_item("plugin_path", plugin_path)?;
+        options.set_item("function_name", function_name)?;
+        options.set_item("args", inputs)?;
+        options.set_item("kwargs", kwargs)?;
+        options.set_item("is_elementwise", false)?;
+        py.import("polars.plugins")?
+            .getattr("register_plugin_function")?
+            .call((), Some(&options))
+    }
+}
+
+#[pymethods]
+impl IndicatorNamespace {
+    #[new]
+    fn new(expr: PyObject) -> Self {
+        IndicatorNamespace { expr }
+    }
+
+    /// Moving average, see `moving_average.bulk.moving_average`
+    ///
+    /// Args:
+    ///     period: Period over which to calculate the moving average
+    ///     moving_average_type: Choice of "simple", "smoothed", "exponential" (default "simple")
+    #[pyo3(signature = (period, moving_average_type = "simple"))]
+    fn moving_average<'py>(
+        &self,
+        py: Python<'py>,
+        period: usize,
+        moving_average_type: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::PyMovingAverageType::from_string(moving_average_type)?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("period", period)?;
+        kwargs.set_item("model", moving_average_type)?;
+        self.plugin(py, "moving_average", Vec::new(), kwargs)
+    }
+
+    /// McGinley dynamic, see `moving_average.bulk.mcginley_dynamic`
+    ///
+    /// Args:
+    ///     period: Period over which to calculate the McGinley dynamic
+    ///     previous_mcginley_dynamic: Previous McGinley dynamic (default 0.0, none)
+    #[pyo3(signature = (period, previous_mcginley_dynamic = 0.0))]
+    fn mcginley_dynamic<'py>(
+        &self,
+        py: Python<'py>,
+        period: usize,
+        previous_mcginley_dynamic: f64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("period", period)?;
+        kwargs.set_item("previous", previous_mcginley_dynamic)?;
+        self.plugin(py, "mcginley_dynamic", Vec::new(), kwargs)
+    }
+
+    /// Relative strength index, see `momentum_indicators.bulk.relative_strength_index`
+    ///
+    /// Args:
+    ///     period: Period over which to calculate the RSI
+    ///     constant_model_type: Choice of "simple", "smoothed", "exponential", "median", "mode"
+    ///         (default "smoothed")
+    #[pyo3(signature = (period, constant_model_type = "smoothed"))]
+    fn relative_strength_index<'py>(
+        &self,
+        py: Python<'py>,
+        period: usize,
+        constant_model_type: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::PyConstantModelType::from_string(constant_model_type)?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("period", period)?;
+        kwargs.set_item("model", constant_model_type)?;
+        self.plugin(py, "relative_strength_index", Vec::new(), kwargs)
+    }
+
+    /// MACD line, see `momentum_indicators.bulk.macd_line`
+    ///
+    /// Args:
+    ///     short_period: Period for the short model
+    ///     long_period: Period for the long model
+    ///     short_period_model: Constant model for the short period (default "exponential")
+    ///     long_period_model: Constant model for the long period (default "exponential")
+    #[pyo3(signature = (short_period, long_period, short_period_model = "exponential", long_period_model = "exponential"))]
+    fn macd_line<'py>(
+        &self,
+        py: Python<'py>,
+        short_period: usize,
+        long_period: usize,
+        short_period_model: &str,
+        long_period_model: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::PyConstantModelType::from_string(short_period_model)?;
+        crate::PyConstantModelType::from_string(long_period_model)?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("short_period", short_period)?;
+        kwargs.set_item("short_model", short_period_model)?;
+        kwargs.set_item("long_period", long_period)?;
+        kwargs.set_item("long_model", long_period_model)?;
+        self.plugin(py, "macd_line", Vec::new(), kwargs)
+    }
+
+    /// True strength index, see `trend_indicators.bulk.true_strength_index`
+    ///
+    /// Args:
+    ///     first_period: Period for the first smoothing
+    ///     second_period: Period for the second smoothing
+    ///     first_constant_model: Constant model for the first smoothing (default "exponential")
+    ///     second_constant_model: Constant model for the second smoothing (default "exponential")
+    #[pyo3(signature = (first_period, second_period, first_constant_model = "exponential", second_constant_model = "exponential"))]
+    fn true_strength_index<'py>(
+        &self,
+        py: Python<'py>,
+        first_period: usize,
+        second_period: usize,
+        first_constant_model: &str,
+        second_constant_model: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::PyConstantModelType::from_string(first_constant_model)?;
+        crate::PyConstantModelType::from_string(second_constant_model)?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("first_period", first_period)?;
+        kwargs.set_item("first_model", first_constant_model)?;
+        kwargs.set_item("second_period", second_period)?;
+        kwargs.set_item("second_model", second_constant_model)?;
+        self.plugin(py, "true_strength_index", Vec::new(), kwargs)
+    }
+
+    /// Moving constant bands, see `candle_indicators.bulk.moving_constant_bands`
+    ///
+    /// Args:
+    ///     period: Period over which to calculate the bands
+    ///     constant_model_type: Choice of "simple", "smoothed", "exponential", "median", "mode"
+    ///     deviation_model: Choice of "standard", "mean", "median", "mode", "ulcer", "log",
+    ///         "laplace", "cauchy"
+    ///     deviation_multiplier: Price deviation multiplier
+    ///
+    /// Returns:
+    ///     Struct expression with "lower", "middle" and "upper" fields
+    fn moving_constant_bands<'py>(
+        &self,
+        py: Python<'py>,
+        period: usize,
+        constant_model_type: &str,
+        deviation_model: &str,
+        deviation_multiplier: f64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::PyConstantModelType::from_string(constant_model_type)?;
+        crate::PyDeviationModel::from_string(deviation_model)?;
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("period", period)?;
+        kwargs.set_item("model", constant_model_type)?;
+        kwargs.set_item("deviation_model", deviation_model)?;
+        kwargs.set_item("deviation_multiplier", deviation_multiplier)?;
+        self.plugin(py, "moving_constant_bands", Vec::new(), kwargs)
+    }
+
+    /// Ulcer index, see `volatility_indicators.bulk.ulcer_index`
+    ///
+    /// Args:
+    ///     period: Period over which to calculate the ulcer index
+    fn ulcer_index<'py>(&self, py: Python<'py>, period: usize) -> PyResult<Bound<'py, PyAny>> {
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("period", period)?;
+        self.plugin(py, "ulcer_index", Vec::new(), kwargs)
+    }
+}
+
+#[derive(Deserialize)]
+struct PeriodKwargs {
+    period: usize,
+}
+
+#[derive(Deserialize)]
+struct ModelKwargs {
+    period: usize,
+    model: String,
+}
+
+#[derive(Deserialize)]
+struct McGinleyKwargs {
+    period: usize,
+    previous: f64,
+}
+
+#[derive(Deserialize)]
+struct TwoModelKwargs {
+    #[serde(alias = "short_period")]
+    first_period: usize,
+    #[serde(alias = "short_model")]
+    first_model: String,
+    #[serde(alias = "long_period")]
+    second_period: usize,
+    #[serde(alias = "long_model")]
+    second_model: String,
+}
+
+#[derive(Deserialize)]
+struct BandsKwargs {
+    period: usize,
+    model: String,
+    deviation_model: String,
+    deviation_multiplier: f64,
+}
+
+/// Reads the first input as float64 values, nulls become NaN
+fn input_prices(inputs: &[Series]) -> PolarsResult<Vec<f64>> {
+    let prices = inputs[0].cast(&DataType::Float64)?;
+    let prices = prices.f64()?;
+    Ok(match prices.cont_slice() {
+        Ok(slice) => slice.to_vec(),
+        Err(_) => prices.iter().map(|v| v.unwrap_or(f64::NAN)).collect(),
+    })
+}
+
+/// Right aligns bulk outputs with the input rows, padding the start with nulls
+fn aligned(name: PlSmallStr, len: usize, values: Vec<f64>) -> Series {
+    let lag = len - values.len();
+    Float64Chunked::from_iter_options(
+        name,
+        std::iter::repeat_n(None, lag).chain(values.into_iter().map(Some)),
+    )
+    .into_series()
+}
+
+fn model_error(kind: &str, model: &str) -> polars::prelude::PolarsError {
+    polars_err!(InvalidOperation: "Unknown {}: '{}'", kind, model)
+}
+
+fn constant_model(model: &str) -> PolarsResult<rust_ti::ConstantModelType> {
+    Ok(crate::PyConstantModelType::from_string(model)
+        .map_err(|_| model_error("constant model type", model))?
+        .into())
+}
+
+#[polars_expr(output_type = Float64)]
+fn moving_average(inputs: &[Series], kwargs: ModelKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let model = crate::PyMovingAverageType::from_string(&kwargs.model)
+        .map_err(|_| model_error("moving average type", &kwargs.model))?;
+    let values = if kwargs.period == 0 || kwargs.period > prices.len() {
+        Vec::new()
+    } else {
+        ma::bulk::moving_average(&prices, model.into(), kwargs.period)
+    };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
+
+#[polars_expr(output_type = Float64)]
+fn mcginley_dynamic(inputs: &[Series], kwargs: McGinleyKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let values = if kwargs.period == 0 || kwargs.period > prices.len() {
+        Vec::new()
+    } else {
+        ma::bulk::mcginley_dynamic(&prices, kwargs.previous, kwargs.period)
+    };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
+
+#[polars_expr(output_type = Float64)]
+fn relative_strength_index(inputs: &[Series], kwargs: ModelKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let model = constant_model(&kwargs.model)?;
+    let values = if kwargs.period == 0 || kwargs.period > prices.len() {
+        Vec::new()
+    } else {
+        mi::bulk::relative_strength_index(&prices, model, kwargs.period)
+    };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
+
+#[polars_expr(output_type = Float64)]
+fn macd_line(inputs: &[Series], kwargs: TwoModelKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let short_model = constant_model(&kwargs.first_model)?;
+    let long_model = constant_model(&kwargs.second_model)?;
+    let values =
+        if kwargs.first_period >= kwargs.second_period || kwargs.second_period > prices.len() {
+            Vec::new()
+        } else {
+            mi::bulk::macd_line(
+                &prices,
+                kwargs.first_period,
+                short_model,
+                kwargs.second_period,
+                long_model,
+            )
+        };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
+
+#[polars_expr(output_type = Float64)]
+fn true_strength_index(inputs: &[Series], kwargs: TwoModelKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let first_model = constant_model(&kwargs.first_model)?;
+    let second_model = constant_model(&kwargs.second_model)?;
+    let warm_up = kwargs.first_period + kwargs.second_period;
+    let values = if kwargs.first_period == 0 || kwargs.second_period == 0 || warm_up > prices.len()
+    {
+        Vec::new()
+    } else {
+        ti::bulk::true_strength_index(
+            &prices,
+            first_model,
+            kwargs.first_period,
+            second_model,
+            kwargs.second_period,
+        )
+    };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
+
+fn bands_output(input_fields: &[Field]) -> PolarsResult<Field> {
+    Ok(Field::new(
+        input_fields[0].name().clone(),
+        DataType::Struct(vec![
+            Field::new("lower".into(), DataType::Float64),
+            Field::new("middle".into(), DataType::Float64),
+            Field::new("upper".into(), DataType::Float64),
+        ]),
+    ))
+}
+
+#[polars_expr(output_type_func = bands_output)]
+fn moving_constant_bands(inputs: &[Series], kwargs: BandsKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let model = constant_model(&kwargs.model)?;
+    let deviation_model = crate::PyDeviationModel::from_string(&kwargs.deviation_model)
+        .map_err(|_| model_error("deviation model", &kwargs.deviation_model))?;
+    let bands = if kwargs.period == 0 || kwargs.period > prices.len() {
+        Vec::new()
+    } else {
+        ci::bulk::moving_constant_bands(
+            &prices,
+            model,
+            deviation_model.into(),
+            kwargs.deviation_multiplier,
+            kwargs.period,
+        )
+    };
+    let len = prices.len();
+    let fields = [
+        aligned("lower".into(), len, bands.iter().map(|b| b.0).collect()),
+        aligned("middle".into(), len, bands.iter().map(|b| b.1).collect()),
+        aligned("upper".into(), len, bands.iter().map(|b| b.2).collect()),
+    ];
+    Ok(StructChunked::from_series(inputs[0].name().clone(), len, fields.iter())?.into_series())
+}
+
+#[polars_expr(output_type = Float64)]
+fn ulcer_index(inputs: &[Series], kwargs: PeriodKwargs) -> PolarsResult<Series> {
+    let prices = input_prices(inputs)?;
+    let values = if kwargs.period == 0 || kwargs.period > prices.len() {
+        Vec::new()
+    } else {
+        vi::bulk::ulcer_index(&prices, kwargs.period)
+    };
+    Ok(aligned(inputs[0].name().clone(), prices.len(), values))
+}
@@ -0,0 +1,294 @@
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyKeyError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PySlice, PyTuple};
+
+/// The `shared_memory` module lets multiprocessing workers share OHLCV data without pickling it.
+///
+/// A frame is published once into a named `multiprocessing.shared_memory` block. Pickling the
+/// frame only sends its name and layout, so handing it to pool workers serializes no price data.
+/// Workers pass its columns straight to the bulk functions, which copy them with a single
+/// memcpy, and can write their results back into output columns of the same block.
+///
+/// ## When to Use
+/// Use shared memory when:
+/// - Indicator work on large series is fanned out across a `multiprocessing` pool
+/// - Several workers need the same inputs, or the parent needs their outputs without pickling
+///
+/// ## Structure
+/// - **SharedFrame**: Named float64 columns stored in one shared memory block.
+#[pymodule(gil_used = false)]
+pub fn shared_memory(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<SharedFrame>()?;
+    // Pickle finds `SharedFrame.attach` by importing this module, which is only importable
+    // once it is registered in `sys.modules`
+    m.py()
+        .import("sys")?
+        .getattr("modules")?
+        .set_item("pytechnicalindicators.shared_memory", m)?;
+    Ok(())
+}
+
+const ITEM_SIZE: usize = std::mem::size_of::<f64>();
+
+/// Named float64 columns of equal length stored in a `multiprocessing.shared_memory` block
+///
+/// Columns are laid out one after another in the block. Each column is exposed as a read-only
+/// float64 `memoryview`, which every bulk and single function accepts in place of a list and
+/// copies with a single memcpy, since `write` or another process can change the block while
+/// an indicator runs. Results are written with `write`.
+///
+/// The process that publishes a frame owns the block and should `unlink` it once all workers
+/// are done. A frame used as a context manager closes the block on exit and, if it owns it,
+/// unlinks it.
+///
+/// Example:
+///     with shared_memory.SharedFrame.publish({"high": high, "low": low, "close": close}, outputs=["atr"]) as frame:
+///         pool.map(worker, [frame] * n_tasks)
+///
+///     def worker(frame):
+///         atr = other_indicators.bulk.average_true_range(frame.column("close"), frame.column("high"), frame.column("low"), "simple", 14)
+///         frame.write("atr", atr)
+#[pyclass(module = "pytechnicalindicators.shared_memory")]
+pub struct SharedFrame {
+    block: PyObject,
+    names: Vec<String>,
+    length: usize,
+    owner: bool,
+}
+
+impl SharedFrame {
+    fn position(&self, name: &str) -> PyResult<usize> {
+        self.names
+            .iter()
+            .position(|n| n == name)
+            .ok_or_else(|| PyKeyError::new_err(format!("Unknown column: '{}'", name)))
+    }
+
+    fn view<'py>(
+        &self,
+        py: Python<'py>,
+        index: usize,
+        start: usize,
+        end: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let offset = index * self.length * ITEM_SIZE;
+        let slice = PySlice::new(
+            py,
+            (offset + start * ITEM_SIZE) as isize,
+            (offset + end * ITEM_SIZE) as isize,
+            1,
+        );
+        self.block
+            .bind(py)
+            .getattr("buf")?
+            .get_item(slice)?
+            .call_method1("cast", ("d",))
+    }
+}
+
+fn shared_memory_class(py: Python<'_>) -> PyResult<Bound<'_, PyAny>> {
+    py.import("multiprocessing.shared_memory")?
+        .getattr("SharedMemory")
+}
+
+#[pymethods]
+impl SharedFrame {
+    /// Copies columns into a new shared memory block
+    ///
+    /// Args:
+    ///     columns: Dictionary of column name to list of values (or any float64 buffer)
+    ///     outputs: Names of extra columns, filled with NaN, for workers to write results to
+    ///
+    /// Returns:
+    ///     SharedFrame owning the new block
+    #[staticmethod]
+    #[pyo3(signature = (columns, outputs = Vec::new()))]
+    fn publish(
+        py: Python<'_>,
+        columns: &Bound<'_, PyDict>,
+        outputs: Vec<String>,
+    ) -> PyResult<Self> {
+        let mut names = Vec::with_capacity(columns.len() + outputs.len());
+        let mut values = Vec::with_capacity(columns.len());
+        for (name, column) in columns.iter() {
+            names.push(name.extract::<String>()?);
+            values.push(column.extract::<crate::PriceSeries>()?);
+        }
+        let length = values.first().map_or(0, |column| column.len());
+        if values.iter().any(|column| column.len() != length) {
+            return Err(PyValueError::new_err("All columns must be the same length"));
+        }
+        for name in outputs {
+            if names.contains(&name) {
+                return Err(PyValueError::new_err(format!(
+                    "Duplicate column name: '{}'",
+                    name
+                )));
+            }
+            names.push(name);
+        }
+        if length == 0 || names.is_empty() {
+            return Err(PyValueError::new_err(
+                "A shared frame needs at least one non-empty column",
+            ));
+        }
+
+        let kwargs = PyDict::new(py);
+        kwargs.set_item("create", true)?;
+        kwargs.set_item("size", names.len() * length * ITEM_SIZE)?;
+        let block = shared_memory_class(py)?.call((), Some(&kwargs))?;
+        let frame = SharedFrame {
+            block: block.unbind(),
+            names,
+            length,
+            owner: true,
+        };
+        let nan = vec![f64::NAN; length];
+        for index in 0..frame.names.len() {
+            let column = values
+                .get(index)
+                .map_or(nan.as_slice(), |column| &column[..]);
+            let buffer = PyBuffer::<f64>::get(&frame.view(py, index, 0, length)?)?;
+            buffer.copy_from_slice(py, column)?;
+        }
+        Ok(frame)
+    }
+
+    /// Attaches to a block published by another process
+    ///
+    /// This is what unpickling a `SharedFrame` calls, it rarely needs calling directly.
+    ///
+    /// Args:
+    ///     name: Name of the shared memory block
+    ///     columns: Column names in the order they are laid out
+    ///     length: Number of values in each column
+    ///
+    /// Returns:
+    ///     SharedFrame attached to the block
+    #[staticmethod]
+    fn attach(py: Python<'_>, name: &str, columns: Vec<String>, length: usize) -> PyResult<Self> {
+        let block = shared_memory_class(py)?.call1((name,))?;
+        let size: usize = block.getattr("size")?.extract()?;
+        if size < columns.len() * length * ITEM_SIZE {
+            return Err(PyValueError::new_err(format!(
+                "Shared memory block '{}' is too small for {} columns of length {}",
+                name,
+                columns.len(),
+                length
+            )));
+        }
+        Ok(SharedFrame {
+            block: block.unbind(),
+            names: columns,
+            length,
+            owner: false,
+        })
+    }
+
+    /// Returns a column as a read-only float64 memoryview over the shared block
+    ///
+    /// Args:
+    ///     name: Column name
+    ///
+    /// Returns:
+    ///     memoryview of the column
+    fn column<'py>(&self, py: Python<'py>, name: &str) -> PyResult<Bound<'py, PyAny>> {
+        let index = self.position(name)?;
+        self.view(py, index, 0, self.length)?
+            .call_method0("toreadonly")
+    }
+
+    /// Writes values into a column of the shared block
+    ///
+    /// Bulk functions return fewer values than they are given, so by default the values are
+    /// written to the end of the column, lining each one up with the bar it was calculated on.
+    ///
+    /// Args:
+    ///     name: Column name
+    ///     values: Values to write
+    ///     offset: Index of the first value in the column (default right aligned)
+    #[pyo3(signature = (name, values, offset = None))]
+    fn write(
+        &self,
+        py: Python<'_>,
+        name: &str,
+        values: crate::PriceSeries,
+        offset: Option<usize>,
+    ) -> PyResult<()> {
+        let index = self.position(name)?;
+        if values.len() > self.length {
+            return Err(PyValueError::new_err(format!(
+                "Cannot write {} values to a column of length {}",
+                values.len(),
+                self.length
+            )));
+        }
+        let start = offset.unwrap_or(self.length - values.len());
+        if start + values.len() > self.length {
+            return Err(PyValueError::new_err(format!(
+                "Writing {} values at offset {} overruns a column of length {}",
+                values.len(),
+                start,
+                self.length
+            )));
+        }
+        let buffer = PyBuffer::<f64>::get(&self.view(py, index, start, start + values.len())?)?;
+        buffer.copy_from_slice(py, &values)
+    }
+
+    /// Closes this process's access to the block
+    ///
+    /// Column memoryviews must be released before closing.
+    fn close(&self, py: Python<'_>) -> PyResult<()> {
+        self.block.call_method0(py, "close")?;
+        Ok(())
+    }
+
+    /// Destroys the block, once every process has closed it
+    fn unlink(&self, py: Python<'_>) -> PyResult<()> {
+        self.block.call_method0(py, "unlink")?;
+        Ok(())
+    }
+
+    /// Name of the shared memory block
+    #[getter]
+    fn name(&self, py: Python<'_>) -> PyResult<String> {
+        self.block.getattr(py, "name")?.extract(py)
+    }
+
+    /// Column names in the order they are laid out
+    #[getter]
+    fn columns(&self) -> Vec<String> {
+        self.names.clone()
+    }
+
+    /// Number of values in each column
+    #[getter]
+    fn length(&self) -> usize {
+        self.length
+    }
+
+    fn __len__(&self) -> usize {
+        self.length
+    }
+
+    fn __reduce__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let attach = py.get_type::<SharedFrame>().getattr("attach")?;
+        let args = (self.name(py)?, self.names.clone(), self.length);
+        PyTuple::new(py, [attach, args.into_pyobject(py)?.into_any()])
+    }
+
+    fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    #[pyo3(signature = (*_args))]
+    fn __exit__(&self, py: Python<'_>, _args: &Bound<'_, PyTuple>) -> PyResult<bool> {
+        self.close(py)?;
+        if self.owner {
+            self.unlink(py)?;
+        }
+        Ok(false)
+    }
+}
@@ -1,3 +1,4 @@
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use rust_ti::standard_indicators as si;
 
@@ -13,7 +14,7 @@ use rust_ti::standard_indicators as si;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn standard_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -23,6 +24,7 @@ pub fn standard_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_simple_moving_average, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(
         bulk_smoothed_moving_average,
@@ -42,6 +44,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_simple_moving_average,
         &single_module
@@ -71,7 +74,7 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     Simple moving average
 #[pyfunction(name = "simple_moving_average")]
-fn single_simple_moving_average(prices: Vec<f64>) -> PyResult<f64> {
+fn single_simple_moving_average(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(si::single::simple_moving_average(&prices))
 }
 
@@ -80,12 +83,29 @@ fn single_simple_moving_average(prices: Vec<f64>) -> PyResult<f64> {
 /// Args:
 ///     prices: List of prices
 ///     period: Period over which to calculate the moving average
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
 ///
 /// Returns:
-///     List of simple moving averages
+///     List of simple moving averages, or a tuple of the values and the validity mask
 #[pyfunction(name = "simple_moving_average")]
-fn bulk_simple_moving_average(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
-    Ok(si::bulk::simple_moving_average(&prices, period))
+#[pyo3(signature = (prices, period, nan_policy=None, validity_mask=false))]
+fn bulk_simple_moving_average(
+    py: Python<'_>,
+    prices: crate::PriceSeries,
+    period: usize,
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+) -> PyResult<PyObject> {
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[..]],
+        period.saturating_sub(1),
+        |columns| si::bulk::simple_moving_average(columns[0], period),
+    )
 }
 
 // Smoothed Moving Average
@@ -98,7 +118,7 @@ fn bulk_simple_moving_average(prices: Vec<f64>, period: usize) -> PyResult<Vec<f
 /// Returns:
 ///     Smoothed moving average
 #[pyfunction(name = "smoothed_moving_average")]
-fn single_smoothed_moving_average(prices: Vec<f64>) -> PyResult<f64> {
+fn single_smoothed_moving_average(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(si::single::smoothed_moving_average(&prices))
 }
 
@@ -107,12 +127,29 @@ fn single_smoothed_moving_average(prices: Vec<f64>) -> PyResult<f64> {
 /// Args:
 ///     prices: List of prices
 ///     period: Period over which to calculate the moving average
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
 ///
 /// Returns:
-///     List of smoothed moving averages
+///     List of smoothed moving averages, or a tuple of the values and the validity mask
 #[pyfunction(name = "smoothed_moving_average")]
-fn bulk_smoothed_moving_average(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
-    Ok(si::bulk::smoothed_moving_average(&prices, period))
+#[pyo3(signature = (prices, period, nan_policy=None, validity_mask=false))]
+fn bulk_smoothed_moving_average(
+    py: Python<'_>,
+    prices: crate::PriceSeries,
+    period: usize,
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+) -> PyResult<PyObject> {
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[..]],
+        period.saturating_sub(1),
+        |columns| si::bulk::smoothed_moving_average(columns[0], period),
+    )
 }
 
 // Exponential Moving Average
@@ -125,7 +162,7 @@ fn bulk_smoothed_moving_average(prices: Vec<f64>, period: usize) -> PyResult<Vec
 /// Returns:
 ///     Exponential moving average
 #[pyfunction(name = "exponential_moving_average")]
-fn single_exponential_moving_average(prices: Vec<f64>) -> PyResult<f64> {
+fn single_exponential_moving_average(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(si::single::exponential_moving_average(&prices))
 }
 
@@ -134,12 +171,39 @@ fn single_exponential_moving_average(prices: Vec<f64>) -> PyResult<f64> {
 /// Args:
 ///     prices: List of prices
 ///     period: Period over which to calculate the moving average
+///     nan_policy: How to handle NaN inputs, choice of "propagate", "skip", "forward_fill",
+///         or "reset" (default None, inputs used as given)
+///     validity_mask: Also return a list flagging which outputs are valid (default False)
+///     last: Only calculate the last N values, each value weights the `period` prices of its
+///         window so only the final N + period - 1 prices are read, cannot be combined with
+///         nan_policy (default None, all values)
 ///
 /// Returns:
-///     List of exponential moving averages
+///     List of exponential moving averages, or a tuple of the values and the validity mask
 #[pyfunction(name = "exponential_moving_average")]
-fn bulk_exponential_moving_average(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
-    Ok(si::bulk::exponential_moving_average(&prices, period))
+#[pyo3(signature = (prices, period, nan_policy=None, validity_mask=false, last=None))]
+fn bulk_exponential_moving_average(
+    py: Python<'_>,
+    prices: &Bound<'_, PyAny>,
+    period: usize,
+    nan_policy: Option<&str>,
+    validity_mask: bool,
+    last: Option<usize>,
+) -> PyResult<PyObject> {
+    if last.is_some() && nan_policy.is_some() {
+        return Err(PyValueError::new_err(
+            "last cannot be combined with nan_policy",
+        ));
+    }
+    let prices = crate::extract_tails(&[prices], period, last)?;
+    crate::bulk_with_nan_policy(
+        py,
+        nan_policy,
+        validity_mask,
+        &[&prices[0]],
+        period.saturating_sub(1),
+        |columns| si::bulk::exponential_moving_average(columns[0], period),
+    )
 }
 
 // Bollinger Bands
@@ -152,7 +216,7 @@ fn bulk_exponential_moving_average(prices: Vec<f64>, period: usize) -> PyResult<
 /// Returns:
 ///     Bollinger band tuple (lower band, MA, upper band)
 #[pyfunction(name = "bollinger_bands")]
-fn single_bollinger_bands(prices: Vec<f64>) -> PyResult<(f64, f64, f64)> {
+fn single_bollinger_bands(prices: crate::PriceSeries) -> PyResult<(f64, f64, f64)> {
     Ok(si::single::bollinger_bands(&prices))
 }
 
@@ -164,7 +228,7 @@ fn single_bollinger_bands(prices: Vec<f64>) -> PyResult<(f64, f64, f64)> {
 /// Returns:
 ///     List of Bollinger band tuples (lower band, MA, upper band)
 #[pyfunction(name = "bollinger_bands")]
-fn bulk_bollinger_bands(prices: Vec<f64>) -> PyResult<Vec<(f64, f64, f64)>> {
+fn bulk_bollinger_bands(prices: crate::PriceSeries) -> PyResult<Vec<(f64, f64, f64)>> {
     Ok(si::bulk::bollinger_bands(&prices))
 }
 
@@ -178,7 +242,7 @@ fn bulk_bollinger_bands(prices: Vec<f64>) -> PyResult<Vec<(f64, f64, f64)>> {
 /// Returns:
 ///     MACD tuple (MACD, Signal Line, Histogram)
 #[pyfunction(name = "macd")]
-fn single_macd(prices: Vec<f64>) -> PyResult<(f64, f64, f64)> {
+fn single_macd(prices: crate::PriceSeries) -> PyResult<(f64, f64, f64)> {
     Ok(si::single::macd(&prices))
 }
 
@@ -191,7 +255,7 @@ fn single_macd(prices: Vec<f64>) -> PyResult<(f64, f64, f64)> {
 ///     List of MACD tuple (MACD, Signal Line, Histogram)
 
 #[pyfunction(name = "macd")]
-fn bulk_macd(prices: Vec<f64>) -> PyResult<Vec<(f64, f64, f64)>> {
+fn bulk_macd(prices: crate::PriceSeries) -> PyResult<Vec<(f64, f64, f64)>> {
     Ok(si::bulk::macd(&prices))
 }
 
@@ -205,7 +269,7 @@ fn bulk_macd(prices: Vec<f64>) -> PyResult<Vec<(f64, f64, f64)>> {
 /// Returns:
 ///     Relative Strength Index
 #[pyfunction(name = "rsi")]
-fn single_rsi(prices: Vec<f64>) -> PyResult<f64> {
+fn single_rsi(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(si::single::rsi(&prices))
 }
 
@@ -217,6 +281,6 @@ fn single_rsi(prices: Vec<f64>) -> PyResult<f64> {
 /// Returns:
 ///     List of Relative Strength Index
 #[pyfunction(name = "rsi")]
-fn bulk_rsi(prices: Vec<f64>) -> PyResult<Vec<f64>> {
+fn bulk_rsi(prices: crate::PriceSeries) -> PyResult<Vec<f64>> {
     Ok(si::bulk::rsi(&prices))
 }
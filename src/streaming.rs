@@ -0,0 +1,528 @@
+use std::collections::VecDeque;
+use std::sync::{Mutex, MutexGuard};
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rust_ti::candle_indicators as cai;
+use rust_ti::momentum_indicators as mi;
+use rust_ti::other_indicators as oi;
+use rust_ti::trend_indicators as ti;
+
+/// The `streaming` module keeps indicator state for many symbols in Rust and updates it from
+/// batches of ticks.
+///
+/// Each configured indicator is calculated with the same RustTI `single` function as its
+/// `single` binding, over the most recent bars held for each symbol.
+///
+/// ## When to Use
+/// Use the streaming engine when:
+/// - Indicators are maintained live for many symbols at once
+/// - A Python call per symbol, per indicator, per tick is too slow
+///
+/// ## Structure
+/// - **StreamingEngine**: Owns the bar history and indicator values of every symbol.
+#[pymodule(gil_used = false)]
+pub fn streaming(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<StreamingEngine>()?;
+    Ok(())
+}
+
+enum Indicator {
+    RelativeStrengthIndex {
+        constant_model_type: crate::PyConstantModelType,
+        period: usize,
+    },
+    MacdLine {
+        short_period: usize,
+        short_period_model: crate::PyConstantModelType,
+        long_period: usize,
+        long_period_model: crate::PyConstantModelType,
+    },
+    AverageTrueRange {
+        constant_model_type: crate::PyConstantModelType,
+        period: usize,
+    },
+    Supertrend {
+        constant_model_type: crate::PyConstantModelType,
+        multiplier: f64,
+        period: usize,
+    },
+    ParabolicTimePriceSystem {
+        af_start: f64,
+        af_step: f64,
+        af_max: f64,
+        position: crate::PyPosition,
+    },
+}
+
+impl Indicator {
+    fn window(&self) -> usize {
+        match self {
+            Indicator::RelativeStrengthIndex { period, .. } => *period,
+            Indicator::MacdLine { long_period, .. } => *long_period,
+            Indicator::AverageTrueRange { period, .. } => *period,
+            Indicator::Supertrend { period, .. } => *period,
+            Indicator::ParabolicTimePriceSystem { .. } => 2,
+        }
+    }
+}
+
+#[derive(Clone)]
+struct ParabolicState {
+    position: crate::PyPosition,
+    sar: f64,
+    extreme_point: f64,
+    af: f64,
+}
+
+#[derive(Default)]
+struct SymbolState {
+    high: VecDeque<f64>,
+    low: VecDeque<f64>,
+    close: VecDeque<f64>,
+    parabolic: Vec<Option<ParabolicState>>,
+    latest: Vec<f64>,
+}
+
+#[derive(Default)]
+struct EngineState {
+    indicators: Vec<Indicator>,
+    window: usize,
+    symbols: Vec<SymbolState>,
+    started: bool,
+}
+
+impl EngineState {
+    fn add(&mut self, indicator: Indicator) -> PyResult<usize> {
+        if self.started {
+            return Err(PyValueError::new_err(
+                "Indicators must be added before the first update",
+            ));
+        }
+        if indicator.window() == 0 {
+            return Err(PyValueError::new_err("period must be greater than 0"));
+        }
+        self.window = self.window.max(indicator.window()).max(2);
+        self.indicators.push(indicator);
+        Ok(self.indicators.len() - 1)
+    }
+
+    fn update(
+        &mut self,
+        symbol_ids: &[usize],
+        high: &[f64],
+        low: &[f64],
+        close: &[f64],
+    ) -> PyResult<Vec<Vec<f64>>> {
+        if high.len() != symbol_ids.len()
+            || low.len() != symbol_ids.len()
+            || close.len() != symbol_ids.len()
+        {
+            return Err(PyValueError::new_err(
+                "symbol_ids, high, low and close must be the same length",
+            ));
+        }
+        if let Some(symbol_id) = symbol_ids.iter().find(|&&id| id >= self.symbols.len()) {
+            return Err(PyValueError::new_err(format!(
+                "symbol_id {} is out of range for {} symbols",
+                symbol_id,
+                self.symbols.len()
+            )));
+        }
+        if !self.started {
+            let n_indicators = self.indicators.len();
+            for symbol in self.symbols.iter_mut() {
+                symbol.parabolic = vec![None; n_indicators];
+                symbol.latest = vec![f64::NAN; n_indicators];
+            }
+            self.started = true;
+        }
+
+        let mut rows = Vec::with_capacity(symbol_ids.len());
+        for (i, &symbol_id) in symbol_ids.iter().enumerate() {
+            let symbol = &mut self.symbols[symbol_id];
+            push_bounded(&mut symbol.high, high[i], self.window);
+            push_bounded(&mut symbol.low, low[i], self.window);
+            push_bounded(&mut symbol.close, close[i], self.window);
+            let highs = symbol.high.make_contiguous();
+            let lows = symbol.low.make_contiguous();
+            let closes = symbol.close.make_contiguous();
+            let bars = closes.len();
+
+            for (j, indicator) in self.indicators.iter().enumerate() {
+                let start = bars.saturating_sub(indicator.window());
+                let ready = bars >= indicator.window();
+                symbol.latest[j] = match indicator {
+                    Indicator::RelativeStrengthIndex {
+                        constant_model_type,
+                        ..
+                    } if ready => mi::single::relative_strength_index(
+                        &closes[start..],
+                        constant_model_type.clone().into(),
+                    ),
+                    Indicator::MacdLine {
+                        short_period,
+                        short_period_model,
+                        long_period_model,
+                        ..
+                    } if ready => mi::single::macd_line(
+                        &closes[start..],
+                        *short_period,
+                        short_period_model.clone().into(),
+                        long_period_model.clone().into(),
+                    ),
+                    Indicator::AverageTrueRange {
+                        constant_model_type,
+                        ..
+                    } if ready => oi::single::average_true_range(
+                        &closes[start..],
+                        &highs[start..],
+                        &lows[start..],
+                        constant_model_type.clone().into(),
+                    ),
+                    Indicator::Supertrend {
+                        constant_model_type,
+                        multiplier,
+                        ..
+                    } if ready => cai::single::supertrend(
+                        &highs[start..],
+                        &lows[start..],
+                        &closes[start..],
+                        constant_model_type.clone().into(),
+                        *multiplier,
+                    ),
+                    Indicator::ParabolicTimePriceSystem {
+                        af_start,
+                        af_step,
+                        af_max,
+                        position,
+                    } => {
+                        let state = step_parabolic(
+                            symbol.parabolic[j].take(),
+                            highs,
+                            lows,
+                            *af_start,
+                            *af_max,
+                            *af_step,
+                            position,
+                        );
+                        let sar = state.sar;
+                        symbol.parabolic[j] = Some(state);
+                        sar
+                    }
+                    _ => f64::NAN,
+                };
+            }
+            rows.push(symbol.latest.clone());
+        }
+        Ok(rows)
+    }
+}
+
+fn push_bounded(buffer: &mut VecDeque<f64>, value: f64, capacity: usize) {
+    if buffer.len() == capacity {
+        buffer.pop_front();
+    }
+    buffer.push_back(value);
+}
+
+/// Advances the SaR by one bar using Wilder's reversal rules
+///
+/// The new SaR is clamped to the previous bar's low (long) or high (short) only, and the
+/// position reverses when the current bar crosses it, as in `bulk.parabolic_time_price_system`.
+/// The acceleration factor grows by `af_step` on each new extreme point, up to `af_max`.
+/// `highs` and `lows` end with the current bar.
+fn step_parabolic(
+    state: Option<ParabolicState>,
+    highs: &[f64],
+    lows: &[f64],
+    af_start: f64,
+    af_max: f64,
+    af_step: f64,
+    position: &crate::PyPosition,
+) -> ParabolicState {
+    let n = highs.len();
+    let (high, low) = (highs[n - 1], lows[n - 1]);
+    let Some(mut state) = state else {
+        return match position {
+            crate::PyPosition::Long => ParabolicState {
+                position: crate::PyPosition::Long,
+                sar: low,
+                extreme_point: high,
+                af: af_start,
+            },
+            crate::PyPosition::Short => ParabolicState {
+                position: crate::PyPosition::Short,
+                sar: high,
+                extreme_point: low,
+                af: af_start,
+            },
+        };
+    };
+    let (previous_high, previous_low) = (highs[n - 2], lows[n - 2]);
+    match state.position {
+        crate::PyPosition::Long => {
+            let sar = ti::single::long_parabolic_time_price_system(
+                state.sar,
+                state.extreme_point,
+                state.af,
+                previous_low,
+            );
+            if low < sar {
+                state = ParabolicState {
+                    position: crate::PyPosition::Short,
+                    sar: state.extreme_point,
+                    extreme_point: low,
+                    af: af_start,
+                };
+            } else {
+                state.sar = sar;
+                if high > state.extreme_point {
+                    state.extreme_point = high;
+                    state.af = (state.af + af_step).min(af_max);
+                }
+            }
+        }
+        crate::PyPosition::Short => {
+            let sar = ti::single::short_parabolic_time_price_system(
+                state.sar,
+                state.extreme_point,
+                state.af,
+                previous_high,
+            );
+            if high > sar {
+                state = ParabolicState {
+                    position: crate::PyPosition::Long,
+                    sar: state.extreme_point,
+                    extreme_point: high,
+                    af: af_start,
+                };
+            } else {
+                state.sar = sar;
+                if low < state.extreme_point {
+                    state.extreme_point = low;
+                    state.af = (state.af + af_step).min(af_max);
+                }
+            }
+        }
+    }
+    state
+}
+
+/// Multi-symbol streaming indicator engine
+///
+/// Holds the recent bars and latest indicator values for `n_symbols` symbols. Indicators are
+/// configured with the `add_*` methods before the first update, each one adding a column to
+/// the output. Values are NaN until a symbol has received enough bars for the indicator.
+///
+/// Args:
+///     n_symbols: Number of symbols, updates refer to symbols by id in `0..n_symbols`
+///
+/// Example:
+///     engine = streaming.StreamingEngine(5000)
+///     engine.add_relative_strength_index("smoothed", 14)
+///     engine.add_average_true_range("simple", 14)
+///     rows = engine.update(symbol_ids, high, low, close)
+#[pyclass(module = "pytechnicalindicators.streaming")]
+pub struct StreamingEngine {
+    state: Mutex<EngineState>,
+}
+
+impl StreamingEngine {
+    fn state(&self) -> MutexGuard<'_, EngineState> {
+        self.state.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+#[pymethods]
+impl StreamingEngine {
+    #[new]
+    fn new(n_symbols: usize) -> Self {
+        let mut state = EngineState::default();
+        state.symbols.resize_with(n_symbols, SymbolState::default);
+        StreamingEngine {
+            state: Mutex::new(state),
+        }
+    }
+
+    /// Adds the Relative Strength Index (RSI)
+    ///
+    /// Args:
+    ///     constant_model_type: Choice of "simple_moving_average", "smoothed_moving_average",
+    ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
+    ///     period: Period over which to calculate the RSI
+    ///
+    /// Returns:
+    ///     Column index of the indicator
+    fn add_relative_strength_index(
+        &self,
+        constant_model_type: &str,
+        period: usize,
+    ) -> PyResult<usize> {
+        let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+        self.state().add(Indicator::RelativeStrengthIndex {
+            constant_model_type,
+            period,
+        })
+    }
+
+    /// Adds the Moving Average Convergence Divergence (MACD) line
+    ///
+    /// Args:
+    ///     short_period: Length of the short period
+    ///     short_period_model: Choice of "simple_moving_average", "smoothed_moving_average",
+    ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
+    ///     long_period: Length of the long period
+    ///     long_period_model: Choice of "simple_moving_average", "smoothed_moving_average",
+    ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
+    ///
+    /// Returns:
+    ///     Column index of the indicator
+    fn add_macd_line(
+        &self,
+        short_period: usize,
+        short_period_model: &str,
+        long_period: usize,
+        long_period_model: &str,
+    ) -> PyResult<usize> {
+        let short_period_model = crate::PyConstantModelType::from_string(short_period_model)?;
+        let long_period_model = crate::PyConstantModelType::from_string(long_period_model)?;
+        if short_period >= long_period {
+            return Err(PyValueError::new_err(
+                "short_period must be less than long_period",
+            ));
+        }
+        self.state().add(Indicator::MacdLine {
+            short_period,
+            short_period_model,
+            long_period,
+            long_period_model,
+        })
+    }
+
+    /// Adds the Average True Range (ATR)
+    ///
+    /// Args:
+    ///     constant_model_type: Choice of "simple_moving_average", "smoothed_moving_average",
+    ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
+    ///     period: Period over which to calculate the ATR
+    ///
+    /// Returns:
+    ///     Column index of the indicator
+    fn add_average_true_range(&self, constant_model_type: &str, period: usize) -> PyResult<usize> {
+        let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+        self.state().add(Indicator::AverageTrueRange {
+            constant_model_type,
+            period,
+        })
+    }
+
+    /// Adds the Super Trend indicator
+    ///
+    /// Args:
+    ///     constant_model_type: Choice of "simple_moving_average", "smoothed_moving_average",
+    ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
+    ///     multiplier: Multiplier for the ATR
+    ///     period: Period over which to calculate the supertrend
+    ///
+    /// Returns:
+    ///     Column index of the indicator
+    fn add_supertrend(
+        &self,
+        constant_model_type: &str,
+        multiplier: f64,
+        period: usize,
+    ) -> PyResult<usize> {
+        let constant_model_type = crate::PyConstantModelType::from_string(constant_model_type)?;
+        self.state().add(Indicator::Supertrend {
+            constant_model_type,
+            multiplier,
+            period,
+        })
+    }
+
+    /// Adds the Parabolic Time Price System (SaR)
+    ///
+    /// The first bar of a symbol starts the SaR at its low (long) or high (short). Each later
+    /// bar is calculated with the long or short `single` SaR function and reverses the position
+    /// when price crosses the SaR.
+    ///
+    /// Args:
+    ///     af_start: Initial acceleration factor
+    ///     af_step: Acceleration factor increment (default 0.02)
+    ///     af_max: Maximum acceleration factor (default 0.2)
+    ///     position: Starting position, "long" or "short"
+    ///
+    /// Returns:
+    ///     Column index of the indicator
+    fn add_parabolic_time_price_system(
+        &self,
+        af_start: f64,
+        af_step: f64,
+        af_max: f64,
+        position: &str,
+    ) -> PyResult<usize> {
+        let position = crate::PyPosition::from_string(position)?;
+        self.state().add(Indicator::ParabolicTimePriceSystem {
+            af_start,
+            af_step,
+            af_max,
+            position,
+        })
+    }
+
+    /// Ingests a batch of bars and updates the indicators of the symbols in the batch
+    ///
+    /// Bars are applied in order, so a symbol may appear more than once in a batch.
+    ///
+    /// Args:
+    ///     symbol_ids: List of symbol ids, one per bar
+    ///     high: List of highs
+    ///     low: List of lows
+    ///     close: List of closing prices
+    ///
+    /// Returns:
+    ///     List of rows, one per bar, holding each indicator value after that bar
+    fn update(
+        &self,
+        py: Python<'_>,
+        symbol_ids: Vec<usize>,
+        high: Vec<f64>,
+        low: Vec<f64>,
+        close: Vec<f64>,
+    ) -> PyResult<Vec<Vec<f64>>> {
+        py.allow_threads(|| self.state().update(&symbol_ids, &high, &low, &close))
+    }
+
+    /// Returns the latest indicator values of every symbol
+    ///
+    /// Returns:
+    ///     List of `n_symbols` rows, each holding one value per indicator
+    fn latest(&self) -> Vec<Vec<f64>> {
+        let state = self.state();
+        let n_indicators = state.indicators.len();
+        state
+            .symbols
+            .iter()
+            .map(|symbol| {
+                if symbol.latest.is_empty() {
+                    vec![f64::NAN; n_indicators]
+                } else {
+                    symbol.latest.clone()
+                }
+            })
+            .collect()
+    }
+
+    /// Number of symbols held by the engine
+    #[getter]
+    fn n_symbols(&self) -> usize {
+        self.state().symbols.len()
+    }
+
+    /// Number of configured indicators
+    #[getter]
+    fn n_indicators(&self) -> usize {
+        self.state().indicators.len()
+    }
+}
@@ -13,7 +13,7 @@ use rust_ti::strength_indicators as si;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn strength_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -23,10 +23,12 @@ pub fn strength_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(
         bulk_accumulation_distribution,
         &bulk_module
     )?)?;
+    bulk_module.add_function(wrap_pyfunction!(bulk_volume_index, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_positive_volume_index, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_negative_volume_index, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_relative_vigor_index, &bulk_module)?)?;
@@ -37,6 +39,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(
         single_accumulation_distribution,
         &single_module
@@ -93,10 +96,10 @@ fn single_accumulation_distribution(
 ///     List of Accumulation Distribution values
 #[pyfunction(name = "accumulation_distribution")]
 fn bulk_accumulation_distribution(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
+    volume: crate::PriceSeries,
     previous_accumulation_distribution: f64,
 ) -> PyResult<Vec<f64>> {
     Ok(si::bulk::accumulation_distribution(
@@ -132,6 +135,26 @@ fn single_volume_index(
     ))
 }
 
+/// Calculates the generic volume index for a series of closing prices
+///
+/// Args:
+///     close: List of closing prices
+///     previous_volume_index: Previous volume index value (0.0 if none)
+///
+/// Returns:
+///     List of Volume Index values, one for each close after the first
+#[pyfunction(name = "volume_index")]
+fn bulk_volume_index(close: crate::PriceSeries, previous_volume_index: f64) -> PyResult<Vec<f64>> {
+    let mut volume_index = previous_volume_index;
+    Ok(close
+        .windows(2)
+        .map(|pair| {
+            volume_index = si::single::volume_index(pair[1], pair[0], volume_index);
+            volume_index
+        })
+        .collect())
+}
+
 /// Calculates the Positive Volume Index (PVI)
 ///
 /// Args:
@@ -143,8 +166,8 @@ fn single_volume_index(
 ///     List of Positive Volume Index values
 #[pyfunction(name = "positive_volume_index")]
 fn bulk_positive_volume_index(
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    close: crate::PriceSeries,
+    volume: crate::PriceSeries,
     previous_volume_index: f64,
 ) -> PyResult<Vec<f64>> {
     Ok(si::bulk::positive_volume_index(
@@ -165,8 +188,8 @@ fn bulk_positive_volume_index(
 ///     List of Negative Volume Index values
 #[pyfunction(name = "negative_volume_index")]
 fn bulk_negative_volume_index(
-    close: Vec<f64>,
-    volume: Vec<f64>,
+    close: crate::PriceSeries,
+    volume: crate::PriceSeries,
     previous_volume_index: f64,
 ) -> PyResult<Vec<f64>> {
     Ok(si::bulk::negative_volume_index(
@@ -192,10 +215,10 @@ fn bulk_negative_volume_index(
 ///     Relative Vigor Index value
 #[pyfunction(name = "relative_vigor_index")]
 fn single_relative_vigor_index(
-    open: Vec<f64>,
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    open: crate::PriceSeries,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     constant_model_type: &str,
 ) -> PyResult<f64> {
     Ok(si::single::relative_vigor_index(
@@ -217,24 +240,32 @@ fn single_relative_vigor_index(
 ///     constant_model_type: Choice of "simple_moving_average", "smoothed_moving_average",
 ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
 ///     period: Period over which to calculate the RVI
+///     normalize: Tuple of a normalization, "z_score", "percentile_rank", "robust_scale" or
+///         "min_max_scale", and the period to normalize the RVI over (default None)
 ///
 /// Returns:
-///     List of Relative Vigor Index values
+///     List of Relative Vigor Index values, normalized when `normalize` is given, in which case
+///     the list is shorter by the normalization period - 1
 #[pyfunction(name = "relative_vigor_index")]
+#[pyo3(signature = (open, high, low, close, constant_model_type, period, normalize=None))]
 fn bulk_relative_vigor_index(
-    open: Vec<f64>,
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    open: crate::PriceSeries,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     constant_model_type: &str,
     period: usize,
+    normalize: Option<(String, usize)>,
 ) -> PyResult<Vec<f64>> {
-    Ok(si::bulk::relative_vigor_index(
-        &open,
-        &high,
-        &low,
-        &close,
-        crate::PyConstantModelType::from_string(constant_model_type)?.into(),
-        period,
-    ))
+    crate::normalization::normalize_output(
+        si::bulk::relative_vigor_index(
+            &open,
+            &high,
+            &low,
+            &close,
+            crate::PyConstantModelType::from_string(constant_model_type)?.into(),
+            period,
+        ),
+        normalize,
+    )
 }
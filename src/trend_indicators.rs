@@ -14,7 +14,7 @@ use rust_ti::trend_indicators as ti;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn trend_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -24,6 +24,7 @@ pub fn trend_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_aroon_up, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_aroon_down, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_aroon_oscillator, &bulk_module)?)?;
@@ -45,6 +46,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(single_aroon_up, &single_module)?)?;
     single_module.add_function(wrap_pyfunction!(single_aroon_down, &single_module)?)?;
     single_module.add_function(wrap_pyfunction!(single_aroon_oscillator, &single_module)?)?;
@@ -76,7 +78,7 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     Aroon Up value
 #[pyfunction(name = "aroon_up")]
-fn single_aroon_up(highs: Vec<f64>) -> PyResult<f64> {
+fn single_aroon_up(highs: crate::PriceSeries) -> PyResult<f64> {
     Ok(ti::single::aroon_up(&highs))
 }
 
@@ -89,7 +91,7 @@ fn single_aroon_up(highs: Vec<f64>) -> PyResult<f64> {
 /// Returns:
 ///     List of Aroon Up values
 #[pyfunction(name = "aroon_up")]
-fn bulk_aroon_up(highs: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn bulk_aroon_up(highs: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
     Ok(ti::bulk::aroon_up(&highs, period))
 }
 
@@ -103,7 +105,7 @@ fn bulk_aroon_up(highs: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
 /// Returns:
 ///     Aroon Down value
 #[pyfunction(name = "aroon_down")]
-fn single_aroon_down(lows: Vec<f64>) -> PyResult<f64> {
+fn single_aroon_down(lows: crate::PriceSeries) -> PyResult<f64> {
     Ok(ti::single::aroon_down(&lows))
 }
 
@@ -116,7 +118,7 @@ fn single_aroon_down(lows: Vec<f64>) -> PyResult<f64> {
 /// Returns:
 ///     List of Aroon Down values
 #[pyfunction(name = "aroon_down")]
-fn bulk_aroon_down(lows: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
+fn bulk_aroon_down(lows: crate::PriceSeries, period: usize) -> PyResult<Vec<f64>> {
     Ok(ti::bulk::aroon_down(&lows, period))
 }
 
@@ -144,8 +146,11 @@ fn single_aroon_oscillator(aroon_up: f64, aroon_down: f64) -> PyResult<f64> {
 /// Returns:
 ///     List of Aroon Oscillator values
 #[pyfunction(name = "aroon_oscillator")]
-fn bulk_aroon_oscillator(aroon_up: Vec<f64>, aroon_down: Vec<f64>) -> PyResult<Vec<f64>> {
-    Ok(ti::bulk::aroon_oscillator(&aroon_up, &aroon_down))
+fn bulk_aroon_oscillator(
+    aroon_up: crate::PriceSeries,
+    aroon_down: crate::PriceSeries,
+) -> PyResult<Vec<f64>> {
+    crate::kernels::aroon_oscillator(&aroon_up, &aroon_down)
 }
 
 // Aroon Indidcator
@@ -159,7 +164,10 @@ fn bulk_aroon_oscillator(aroon_up: Vec<f64>, aroon_down: Vec<f64>) -> PyResult<V
 /// Returns:
 ///     Aroon indicator tuple (Aroon Up, Aroon Down, Aroon Oscillator)
 #[pyfunction(name = "aroon_indicator")]
-fn single_aroon_indicator(highs: Vec<f64>, lows: Vec<f64>) -> PyResult<(f64, f64, f64)> {
+fn single_aroon_indicator(
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+) -> PyResult<(f64, f64, f64)> {
     Ok(ti::single::aroon_indicator(&highs, &lows))
 }
 
@@ -174,8 +182,8 @@ fn single_aroon_indicator(highs: Vec<f64>, lows: Vec<f64>) -> PyResult<(f64, f64
 ///     List of  Aroon indicator tuples (Aroon Up, Aroon Down, Aroon Oscillator)
 #[pyfunction(name = "aroon_indicator")]
 fn bulk_aroon_indicator(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
     period: usize,
 ) -> PyResult<Vec<(f64, f64, f64)>> {
     Ok(ti::bulk::aroon_indicator(&highs, &lows, period))
@@ -243,26 +251,46 @@ fn single_short_parabolic_time_price_system(
 ///     af_max: Maximum acceleration factor (default 0.2)
 ///     position: "long" or "short"
 ///     previous_sar: Previous SaR (0.0 if none)
+///     segment_starts: Indices of the first bar of each segment (e.g. each session open), every
+///         segment restarts from `position` and `previous_sar`, so use 0.0 for `previous_sar` to
+///         seed each segment from its own bars (default None, one segment)
 ///
 /// Returns:
 ///     List of SAR values
 #[pyfunction(name = "parabolic_time_price_system")]
+#[pyo3(signature = (highs, lows, af_start, af_step, af_max, position, previous_sar, segment_starts=None))]
 fn bulk_parabolic_time_price_system(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
     af_start: f64,
     af_step: f64,
     af_max: f64,
     position: &str,
     previous_sar: f64,
+    segment_starts: Option<Vec<usize>>,
 ) -> PyResult<Vec<f64>> {
+    let position = crate::PyPosition::from_string(position)?;
+    if let Some(segment_starts) = segment_starts {
+        crate::check_segment_lengths(&[highs.len(), lows.len()])?;
+        return crate::bulk_by_segment(highs.len(), 0, &segment_starts, |start, end| {
+            ti::bulk::parabolic_time_price_system(
+                &highs[start..end],
+                &lows[start..end],
+                af_start,
+                af_max,
+                af_step,
+                position.clone().into(),
+                previous_sar,
+            )
+        });
+    }
     Ok(ti::bulk::parabolic_time_price_system(
         &highs,
         &lows,
         af_start,
-        af_step,
         af_max,
-        crate::PyPosition::from_string(position)?.into(),
+        af_step,
+        position.into(),
         previous_sar,
     ))
 }
@@ -283,9 +311,9 @@ fn bulk_parabolic_time_price_system(
 ///     List of Directional Movement System tuples (+DI, -DI, ADX, ADXR)
 #[pyfunction(name = "directional_movement_system")]
 fn bulk_directional_movement_system(
-    highs: Vec<f64>,
-    lows: Vec<f64>,
-    close: Vec<f64>,
+    highs: crate::PriceSeries,
+    lows: crate::PriceSeries,
+    close: crate::PriceSeries,
     period: usize,
     constant_model_type: &str,
 ) -> PyResult<Vec<(f64, f64, f64, f64)>> {
@@ -331,15 +359,31 @@ fn single_volume_price_trend(
 ///     prices: List of prices
 ///     volumes: List of volumes
 ///     previous_vpt: Previous VPT value (use 0.0 if none)
+///     segment_starts: Indices of the first bar of each segment (e.g. each session open), the
+///         calculation restarts at every segment (default None, one segment)
 ///
 /// Returns:
-///     List of VPT values
+///     List of VPT values. With `segment_starts` the first bar of each segment has no value
+///     and is NaN.
 #[pyfunction(name = "volume_price_trend")]
+#[pyo3(signature = (prices, volumes, previous_vpt, segment_starts=None))]
 fn bulk_volume_price_trend(
-    prices: Vec<f64>,
-    volumes: Vec<f64>,
+    prices: crate::PriceSeries,
+    volumes: crate::PriceSeries,
     previous_vpt: f64,
+    segment_starts: Option<Vec<usize>>,
 ) -> PyResult<Vec<f64>> {
+    if let Some(segment_starts) = segment_starts {
+        // Each volume belongs to the price after it, the first price has no volume
+        crate::check_segment_lengths(&[prices.len(), volumes.len() + 1])?;
+        return crate::bulk_by_segment(prices.len(), 1, &segment_starts, |start, end| {
+            ti::bulk::volume_price_trend(
+                &prices[start..end],
+                &volumes[start..end - 1],
+                previous_vpt,
+            )
+        });
+    }
     Ok(ti::bulk::volume_price_trend(
         &prices,
         &volumes,
@@ -363,7 +407,7 @@ fn bulk_volume_price_trend(
 ///     TSI value
 #[pyfunction(name = "true_strength_index")]
 fn single_true_strength_index(
-    prices: Vec<f64>,
+    prices: crate::PriceSeries,
     first_period: usize,
     first_constant_model: &str,
     second_constant_model: &str,
@@ -386,22 +430,44 @@ fn single_true_strength_index(
 ///     second_constant_model: Choice of "simple_moving_average", "smoothed_moving_average",
 ///         "exponential_moving_average", "simple_moving_median", or "simple_moving_mode"
 ///     second_period: Period for second smoothing
+///     last: Only calculate the last N values, each value reads `first_period + second_period`
+///         prices so only the final N + first_period + second_period - 1 prices are read
+///         (default None, all values)
+///     normalize: Tuple of a normalization, "z_score", "percentile_rank", "robust_scale" or
+///         "min_max_scale", and the period to normalize the TSI over, with `last` the final N
+///         normalized values are returned (default None)
 ///
 /// Returns:
-///     List of TSI values
+///     List of TSI values, normalized when `normalize` is given, in which case
+///     the list is shorter by the normalization period - 1
 #[pyfunction(name = "true_strength_index")]
+#[pyo3(signature = (prices, first_constant_model, first_period, second_constant_model, second_period, last=None, normalize=None))]
 fn bulk_true_strength_index(
-    prices: Vec<f64>,
+    prices: &Bound<'_, PyAny>,
     first_constant_model: &str,
     first_period: usize,
     second_constant_model: &str,
     second_period: usize,
+    last: Option<usize>,
+    normalize: Option<(String, usize)>,
 ) -> PyResult<Vec<f64>> {
-    Ok(ti::bulk::true_strength_index(
-        &prices,
-        crate::PyConstantModelType::from_string(first_constant_model)?.into(),
-        first_period,
-        crate::PyConstantModelType::from_string(second_constant_model)?.into(),
-        second_period,
-    ))
+    // Each normalized value also reads the TSI values before it
+    let normalize_lag = normalize
+        .as_ref()
+        .map_or(0, |(_, period)| period.saturating_sub(1));
+    let prices = crate::extract_tails(
+        &[prices],
+        first_period + second_period + normalize_lag,
+        last,
+    )?;
+    crate::normalization::normalize_output(
+        ti::bulk::true_strength_index(
+            &prices[0],
+            crate::PyConstantModelType::from_string(first_constant_model)?.into(),
+            first_period,
+            crate::PyConstantModelType::from_string(second_constant_model)?.into(),
+            second_period,
+        ),
+        normalize,
+    )
 }
@@ -6,7 +6,7 @@ use rust_ti::volatility_indicators as vi;
 /// ## Structure
 /// - **single**: Functions that return a single value for a slice of prices.
 /// - **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
-#[pymodule]
+#[pymodule(gil_used = false)]
 pub fn volatility_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_bulk_module(m)?;
     register_single_module(m)?;
@@ -16,6 +16,7 @@ pub fn volatility_indicators(m: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **bulk**: Functions that compute values of a slice of prices over a period and return a vector.
 fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let bulk_module = PyModule::new(parent_module.py(), "bulk")?;
+    bulk_module.gil_used(false)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_ulcer_index, &bulk_module)?)?;
     bulk_module.add_function(wrap_pyfunction!(bulk_volatility_system, &bulk_module)?)?;
     parent_module.add_submodule(&bulk_module)?;
@@ -25,6 +26,7 @@ fn register_bulk_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// **single**: Functions that return a single value for a slice of prices.
 fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
     let single_module = PyModule::new(parent_module.py(), "single")?;
+    single_module.gil_used(false)?;
     single_module.add_function(wrap_pyfunction!(single_ulcer_index, &single_module)?)?;
     parent_module.add_submodule(&single_module)?;
     Ok(())
@@ -38,7 +40,7 @@ fn register_single_module(parent_module: &Bound<'_, PyModule>) -> PyResult<()> {
 /// Returns:
 ///     Ulcer Index value
 #[pyfunction(name = "ulcer_index")]
-fn single_ulcer_index(prices: Vec<f64>) -> PyResult<f64> {
+fn single_ulcer_index(prices: crate::PriceSeries) -> PyResult<f64> {
     Ok(vi::single::ulcer_index(&prices))
 }
 
@@ -47,12 +49,25 @@ fn single_ulcer_index(prices: Vec<f64>) -> PyResult<f64> {
 /// Args:
 ///     prices: List of prices
 ///     period: Period over which to calculate the Ulcer Index
+///     parallel: Split the series into segments calculated on all cores (default False)
 ///
 /// Returns:
 ///     List of Ulcer Index values (one per window)
 #[pyfunction(name = "ulcer_index")]
-fn bulk_ulcer_index(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
-    Ok(vi::bulk::ulcer_index(&prices, period))
+#[pyo3(signature = (prices, period, parallel=false))]
+fn bulk_ulcer_index(
+    py: Python<'_>,
+    prices: crate::PriceSeries,
+    period: usize,
+    parallel: bool,
+) -> PyResult<Vec<f64>> {
+    Ok(crate::windowed_bulk(
+        py,
+        parallel,
+        prices.len(),
+        period,
+        |start, end| vi::bulk::ulcer_index(&prices[start..end], period),
+    ))
 }
 
 /// Calculates Welles Wilder's volatility system
@@ -70,9 +85,9 @@ fn bulk_ulcer_index(prices: Vec<f64>, period: usize) -> PyResult<Vec<f64>> {
 ///     List of volatility system SaR points
 #[pyfunction(name = "volatility_system")]
 fn bulk_volatility_system(
-    high: Vec<f64>,
-    low: Vec<f64>,
-    close: Vec<f64>,
+    high: crate::PriceSeries,
+    low: crate::PriceSeries,
+    close: crate::PriceSeries,
     period: usize,
     constant_multiplier: f64,
     constant_model_type: &str,
@@ -0,0 +1,11 @@
+import pytest
+
+@pytest.fixture
+def long_prices():
+    """A series long enough to be split into several segments by the parallel bulk functions"""
+    return [100.0 + (i % 97) * 0.5 - (i % 13) * 1.5 for i in range(5000)]
+
+@pytest.fixture
+def parallel_threads(monkeypatch):
+    """Splits parallel bulk calls into 4 segments whatever the number of cores on the runner"""
+    monkeypatch.setenv("PYTI_PARALLEL_THREADS", "4")
@@ -0,0 +1,78 @@
+import pytest
+
+from pytechnicalindicators import bars, moving_average, other_indicators
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+high = [120.0, 125.0, 123.0, 122.0, 121.0]
+low = [90.0, 95.0, 92.0, 91.0, 90.0]
+close = [100.0, 102.0, 103.0, 101.0, 99.0]
+
+def test_bars():
+    data = bars.Bars(high=high, low=low, close=close)
+    assert len(data) == 5
+    assert data.columns == ["high", "low", "close"]
+    assert data.close.to_list() == close
+    assert len(data.high) == 5
+    assert data.low[1] == 95.0
+    assert data.low[-1] == 90.0
+    with pytest.raises(ValueError):
+        data.volume
+    with pytest.raises(IndexError):
+        data.close[5]
+
+def test_bars_column_inputs():
+    data = bars.Bars(high=high, low=low, close=close)
+    assert moving_average.bulk.moving_average(data.close, "simple", 3) == moving_average.bulk.moving_average(close, "simple", 3)
+    assert other_indicators.bulk.average_true_range(data.close, data.high, data.low, "simple", 3) == other_indicators.bulk.average_true_range(close, high, low, "simple", 3)
+    assert moving_average.bulk.moving_average(data.close[2:], "simple", 3) == [101.0]
+
+def test_bars_append():
+    data = bars.Bars(high=high, low=low, close=close)
+    view = data.close
+    data.append(high=124.0, low=96.0, close=104.0)
+    data.extend(high=[126.0, 127.0], low=[97.0, 98.0], close=[105.0, 106.0])
+    assert len(data) == 8
+    assert data.close.to_list() == close + [104.0, 105.0, 106.0]
+    assert view.to_list() == close
+    with pytest.raises(ValueError):
+        data.append(close=107.0)
+    with pytest.raises(ValueError):
+        data.append(high=124.0, low=96.0, close=104.0, volume=1000.0)
+    with pytest.raises(ValueError):
+        data.extend(high=[126.0], low=[97.0, 98.0], close=[105.0, 106.0])
+
+def test_bars_slice():
+    data = bars.Bars(high=high, low=low, close=close)
+    tail = data[-3:]
+    assert len(tail) == 3
+    assert tail.close.to_list() == close[-3:]
+    tail.append(high=124.0, low=96.0, close=104.0)
+    assert tail.close.to_list() == close[-3:] + [104.0]
+    assert data.close.to_list() == close
+    with pytest.raises(ValueError):
+        data[::2]
+    with pytest.raises(TypeError):
+        data[0]
+
+def test_bars_errors():
+    with pytest.raises(ValueError):
+        bars.Bars(high=high[:4], close=close)
@@ -0,0 +1,95 @@
+import array
+
+import pytest
+
+from pytechnicalindicators import bars, cache, momentum_indicators, moving_average
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+prices = [100.0, 102.0, 103.0, 101.0, 99.0]
+
+def test_result_cache_hit():
+    results = cache.ResultCache()
+    first = results.call(moving_average.bulk.moving_average, prices, "simple", 3)
+    second = results.call(moving_average.bulk.moving_average, prices, "simple", 3)
+    assert first == second == [101.66666666666667, 102.0, 101.0]
+    assert first is not second
+    stats = results.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+def test_result_cache_keys():
+    results = cache.ResultCache()
+    results.call(moving_average.bulk.moving_average, prices, "simple", 3)
+    results.call(moving_average.bulk.moving_average, prices, "simple", period=3)
+    results.call(moving_average.bulk.moving_average, prices, "exponential", 3)
+    results.call(momentum_indicators.bulk.relative_strength_index, prices, "simple", 3)
+    assert results.stats()["misses"] == 4
+    assert len(results) == 4
+
+def test_result_cache_eviction():
+    results = cache.ResultCache(max_bytes=300)
+    results.call(moving_average.bulk.moving_average, prices, "simple", 3)
+    results.call(moving_average.bulk.moving_average, prices, "smoothed", 3)
+    results.call(moving_average.bulk.moving_average, prices, "exponential", 3)
+    stats = results.stats()
+    assert stats["evictions"] > 0
+    assert stats["size_bytes"] <= 300
+
+def test_result_cache_invalidate():
+    results = cache.ResultCache()
+    results.call(moving_average.bulk.moving_average, prices, "simple", 3)
+    results.call(momentum_indicators.bulk.relative_strength_index, prices, "simple", 3)
+    assert results.invalidate(moving_average.bulk.moving_average) == 1
+    assert len(results) == 1
+    results.clear()
+    assert len(results) == 0
+    assert results.stats()["misses"] == 0
+
+def test_result_cache_errors():
+    with pytest.raises(ValueError):
+        cache.ResultCache(max_bytes=0)
+    results = cache.ResultCache()
+    with pytest.raises(ValueError):
+        results.call(moving_average.bulk.moving_average, prices, "", 3)
+    with pytest.raises(TypeError):
+        results.call(moving_average.bulk.moving_average, {}, "simple", 3)
+    with pytest.raises(TypeError):
+        results.call(moving_average.bulk.moving_average, object(), "simple", 3)
+
+def test_result_cache_buffer_keys():
+    results = cache.ResultCache()
+    first = results.call(moving_average.bulk.moving_average, array.array("d", prices), "simple", 3)
+    second = results.call(moving_average.bulk.moving_average, memoryview(array.array("d", prices)), "simple", 3)
+    assert first == second == [101.66666666666667, 102.0, 101.0]
+    assert results.stats()["hits"] == 1
+    data = bars.Bars(close=prices)
+    results.call(moving_average.bulk.moving_average, data.close, "simple", 3)
+    data.append(close=110.0)
+    assert results.call(moving_average.bulk.moving_average, data.close, "simple", 3) == [101.66666666666667, 102.0, 101.0, 103.33333333333333]
+
+def test_result_cache_nested_copy():
+    results = cache.ResultCache()
+    values, mask = results.call(moving_average.bulk.moving_average, prices, "simple", 3, validity_mask=True)
+    values.append(0.0)
+    mask.append(False)
+    assert results.call(moving_average.bulk.moving_average, prices, "simple", 3, validity_mask=True) == ([101.66666666666667, 102.0, 101.0], [True, True, True])
@@ -74,6 +74,10 @@ def test_bulk_moving_constant_bands():
     with pytest.raises(ValueError):
         candle_indicators.bulk.moving_constant_bands(prices, "mode", "", 3.0, 3)
 
+def test_bulk_moving_constant_bands_parallel(long_prices, parallel_threads):
+    assert candle_indicators.bulk.moving_constant_bands(long_prices, "simple", "standard", 2.0, 20, parallel=True) == candle_indicators.bulk.moving_constant_bands(long_prices, "simple", "standard", 2.0, 20)
+    assert candle_indicators.bulk.moving_constant_bands(prices, "simple", "standard", 3.0, 3, parallel=True) == candle_indicators.bulk.moving_constant_bands(prices, "simple", "standard", 3.0, 3)
+
 def test_single_mcginley_dynamic_bands():
     assert candle_indicators.single.mcginley_dynamic_bands(prices, "standard", 3.0, 0.0) == (94.75735931288071, 99.0, 103.24264068711929)
     assert candle_indicators.single.mcginley_dynamic_bands(prices, "mean", 3.0, 0.0) == (95.4, 99.0, 102.6)
@@ -126,6 +130,12 @@ def test_bulk_keltner_channel():
     with pytest.raises(ValueError):
         candle_indicators.bulk.keltner_channel(high, low, close, "mode", "", 2.0, 3)
 
+def test_bulk_keltner_channel_last():
+    assert candle_indicators.bulk.keltner_channel(high, low, close, "simple", "simple", 2.0, 3, last=1) == [(169.88888888888889, 189.88888888888889, 209.88888888888889)]
+    assert candle_indicators.bulk.keltner_channel(high, low, close, "simple", "simple", 2.0, 3, last=10) == candle_indicators.bulk.keltner_channel(high, low, close, "simple", "simple", 2.0, 3)
+    with pytest.raises(ValueError):
+        candle_indicators.bulk.keltner_channel(high, low, close, "simple", "simple", 2.0, 3, last=0)
+
 def test_single_supertrend():
     assert candle_indicators.single.supertrend(high, low, close, "simple", 2.0) == 221.2
     assert candle_indicators.single.supertrend(high, low, close, "smoothed", 2.0) == 218.44930985245122
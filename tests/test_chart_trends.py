@@ -1,3 +1,7 @@
+import math
+
+import pytest
+
 from pytechnicalindicators import chart_trends
 
 """The purpose of these tests are just to confirm that the bindings work.
@@ -55,4 +59,44 @@ def test_break_down_trends():
    
     assert trends == [(0, 2, 1.5, 100.16666666666667), (2, 4, -2.0, 107.0)]
 
-
+def test_break_down_trends_long_series():
+    long_prices = [(100.0 + i if i < 40 else 140.0 - (i - 40)) + 0.15 * ((i * 7) % 5 - 2) for i in range(80)]
+    trends = chart_trends.break_down_trends(long_prices, 1, 0.25, 0.05, 1.3, 2.0, 1.0, 3.0, 0.7, 3.3)
+    assert trends[0][0] == 0 and trends[-1][1] == 79
+    assert 38 <= trends[0][1] <= 46
+    assert trends[0][2] == pytest.approx(1.0, abs=0.05)
+    assert trends[-1][2] == pytest.approx(-1.0, abs=0.05)
+    with pytest.raises(ValueError):
+        chart_trends.break_down_trends([], 1, 0.25, 0.05, 1.3, 2.0, 1.0, 3.0, 0.7, 3.3)
+
+def test_rolling_trend():
+    trends = chart_trends.rolling_trend(prices, 3)
+    assert len(trends) == 3
+    for trend, expected in zip(trends, [(1.5, 100.16666666666667), (-0.5, 102.5), (-2.0, 103.0)]):
+        assert trend[:2] == pytest.approx(expected)
+    assert trends[0][2] == pytest.approx(0.9642857142857143)
+    assert trends[2][2] == pytest.approx(1.0)
+    assert trends[1][3] == pytest.approx(0.7071067811865476)
+    full = chart_trends.rolling_trend(prices, 5)
+    assert full[0][:2] == pytest.approx(chart_trends.overall_trend(prices))
+
+def test_rolling_trend_long_series(long_prices):
+    trends = chart_trends.rolling_trend(long_prices, 20)
+    assert len(trends) == 4981
+    for i in (0, 19, 20, 1234, 4980):
+        assert trends[i][:2] == pytest.approx(chart_trends.overall_trend(long_prices[i:i + 20]))
+
+def test_rolling_trend_nan():
+    gap_prices = [100.0 + i * 0.5 + (i % 3) for i in range(12)]
+    gap_prices[1] = float("nan")
+    trends = chart_trends.rolling_trend(gap_prices, 4)
+    assert len(trends) == 9
+    assert all(math.isnan(value) for trend in trends[:2] for value in trend)
+    for i in range(2, 9):
+        assert trends[i][:2] == pytest.approx(chart_trends.overall_trend(gap_prices[i:i + 4]))
+
+def test_rolling_trend_errors():
+    with pytest.raises(ValueError):
+        chart_trends.rolling_trend(prices, 1)
+    with pytest.raises(ValueError):
+        chart_trends.rolling_trend(prices, 6)
@@ -43,6 +43,16 @@ def test_bulk_correlation():
     assert correlation_indicators.bulk.correlate_asset_prices(prices_a, prices_b, "median", "ulcer", 3) == [float('inf'), 1.03515, 0.6300067463043878]
     assert correlation_indicators.bulk.correlate_asset_prices(prices_a, prices_b, "mode", "mode", 3) == [1.3333333333333333, 0.7777777777777778, 0.7222222222222222]
 
+long_prices_b = [200.0 + (i % 89) * 0.25 - (i % 7) * 2.0 for i in range(5000)]
+
+def test_bulk_correlation_parallel(long_prices, parallel_threads):
+    assert correlation_indicators.bulk.correlate_asset_prices(long_prices, long_prices_b, "simple", "standard", 20, parallel=True) == correlation_indicators.bulk.correlate_asset_prices(long_prices, long_prices_b, "simple", "standard", 20)
+
+def test_bulk_correlation_last(long_prices, parallel_threads):
+    full = correlation_indicators.bulk.correlate_asset_prices(long_prices, long_prices_b, "simple", "standard", 20)
+    assert correlation_indicators.bulk.correlate_asset_prices(long_prices, long_prices_b, "simple", "standard", 20, last=5) == full[-5:]
+    assert correlation_indicators.bulk.correlate_asset_prices(long_prices, long_prices_b, "simple", "standard", 20, parallel=True, last=3000) == full[-3000:]
+
 def test_new_deviation_models_correlation():
     """Test new probability distribution deviation models added in rust_ti 2.2.0"""
     # Test log standard deviation
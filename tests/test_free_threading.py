@@ -0,0 +1,61 @@
+import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytechnicalindicators import cache, momentum_indicators, moving_average, streaming
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+@pytest.mark.skipif(not sysconfig.get_config_var("Py_GIL_DISABLED"), reason="requires a free-threaded build")
+def test_import_keeps_gil_disabled():
+    assert not sys._is_gil_enabled()
+
+def test_concurrent_bulk_calls(long_prices):
+    expected = momentum_indicators.bulk.relative_strength_index(long_prices, "smoothed", 14)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: momentum_indicators.bulk.relative_strength_index(long_prices, "smoothed", 14), range(32)))
+    assert all(result == expected for result in results)
+
+def test_concurrent_result_cache(long_prices):
+    results = cache.ResultCache()
+    periods = [3, 5, 7, 9] * 16
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outputs = list(pool.map(lambda period: results.call(moving_average.bulk.moving_average, long_prices, "simple", period), periods))
+    for period, output in zip(periods, outputs):
+        assert output == moving_average.bulk.moving_average(long_prices, "simple", period)
+    stats = results.stats()
+    assert stats["hits"] + stats["misses"] == len(periods)
+    assert len(results) == 4
+
+def test_concurrent_streaming_updates(long_prices):
+    engine = streaming.StreamingEngine(8)
+    engine.add_relative_strength_index("simple", 3)
+
+    def feed(symbol):
+        for price in long_prices[:50]:
+            engine.update([symbol], [price + 1.0], [price - 1.0], [price])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(feed, range(8)))
+    latest = engine.latest()
+    assert all(row == latest[0] for row in latest)
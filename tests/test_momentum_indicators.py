@@ -47,6 +47,14 @@ def test_bulk_relative_strength_index():
     with pytest.raises(ValueError):
         momentum_indicators.bulk.relative_strength_index(prices, "", 3)
 
+def test_bulk_relative_strength_index_normalize():
+    assert momentum_indicators.bulk.relative_strength_index(prices, "simple", 3, normalize=("percentile_rank", 3)) == [0.3333333333333333]
+    assert momentum_indicators.bulk.relative_strength_index(prices, "simple", 3, normalize=("min_max_scale", 3)) == [0.0]
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.relative_strength_index(prices, "simple", 3, normalize=("", 3))
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.relative_strength_index(prices, "simple", 3, normalize=("z_score", 4))
+
 def test_single_stochastic_oscillator():
     assert momentum_indicators.single.stochastic_oscillator(prices) == 0.0
 
@@ -105,6 +113,14 @@ def test_single_money_flow_index():
 def test_bulk_money_flow_index():
     assert momentum_indicators.bulk.money_flow_index(prices, volume, 3) == [55.314533622559644, 0.0, 58.60655737704918]
 
+def test_bulk_money_flow_index_nan_policy():
+    assert momentum_indicators.bulk.money_flow_index(prices, volume, 3, nan_policy="skip") == [55.314533622559644, 0.0, 58.60655737704918]
+    values, mask = momentum_indicators.bulk.money_flow_index(prices, volume, 3, validity_mask=True)
+    assert values == [55.314533622559644, 0.0, 58.60655737704918]
+    assert mask == [True, True, True]
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.money_flow_index(prices, volume[:-1], 3, nan_policy="skip")
+
 def test_single_rate_of_change():
     assert momentum_indicators.single.rate_of_change(prices[-1], prices[-2]) == -1.9801980198019802
 
@@ -117,6 +133,30 @@ def test_single_on_balance_volume():
 def test_bulk_on_balance_volume():
     assert momentum_indicators.bulk.on_balance_volume(prices, volume, 0.0) == [1500.0, 2700.0, 1800.0, 500.0]
 
+def test_bulk_on_balance_volume_segments():
+    segmented = momentum_indicators.bulk.on_balance_volume(prices + prices, volume + volume, 0.0, segment_starts=[5])
+    assert segmented[:4] == segmented[5:] == [1500.0, 2700.0, 1800.0, 500.0]
+    assert segmented[4] != segmented[4]
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.on_balance_volume(prices, volume, 0.0, nan_policy="skip", segment_starts=[2])
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.on_balance_volume(prices, volume, 0.0, segment_starts=[3, 2])
+
+def test_bulk_on_balance_volume_nan_policy():
+    nan_prices = [100.0, 102.0, float("nan"), 101.0, 99.0]
+    values, mask = momentum_indicators.bulk.on_balance_volume(nan_prices, volume, 0.0, nan_policy="skip", validity_mask=True)
+    assert mask == [True, False, True, True]
+    assert [v for v, m in zip(values, mask) if m] == [1500.0, 600.0, -700.0]
+    values, mask = momentum_indicators.bulk.on_balance_volume(nan_prices, volume, 0.0, nan_policy="forward_fill", validity_mask=True)
+    assert mask == [True, False, True, True]
+    assert [v for v, m in zip(values, mask) if m] == [1500.0, 600.0, -700.0]
+    values, mask = momentum_indicators.bulk.on_balance_volume(nan_prices, volume, 0.0, nan_policy="reset", validity_mask=True)
+    assert mask == [True, False, False, True]
+    assert [v for v, m in zip(values, mask) if m] == [1500.0, -1300.0]
+    assert momentum_indicators.bulk.on_balance_volume(prices, volume, 0.0, nan_policy="skip") == [1500.0, 2700.0, 1800.0, 500.0]
+    with pytest.raises(ValueError):
+        momentum_indicators.bulk.on_balance_volume(nan_prices, volume, 0.0, nan_policy="")
+
 def test_single_commodity_channel_index():
     assert momentum_indicators.single.commodity_channel_index(prices, "simple", "standard", 0.015) == -94.28090415820633
     assert momentum_indicators.single.commodity_channel_index(prices, "smoothed", "mean", 0.015) == -100.9043312708234
@@ -139,6 +179,9 @@ def test_bulk_commodity_channel_index():
     with pytest.raises(ValueError):
         momentum_indicators.bulk.commodity_channel_index(prices, "mode", "", 0.015, 3)
 
+def test_bulk_commodity_channel_index_parallel(long_prices, parallel_threads):
+    assert momentum_indicators.bulk.commodity_channel_index(long_prices, "exponential", "mean", 0.015, 20, parallel=True) == momentum_indicators.bulk.commodity_channel_index(long_prices, "exponential", "mean", 0.015, 20)
+
 def test_single_mcginley_dynamic_commodity_channel_index():
     assert momentum_indicators.single.mcginley_dynamic_commodity_channel_index(prices, 0.0, "standard", 0.015) == (0.0, 99.0)
     assert momentum_indicators.single.mcginley_dynamic_commodity_channel_index(prices, 0.0, "mean", 0.015) == (0.0, 99.0)
@@ -38,8 +38,36 @@ def test_bulk_moving_average():
     with pytest.raises(ValueError):
         moving_average.bulk.moving_average(prices, "", 3)
 
+def test_bulk_moving_average_last():
+    for moving_average_type in ("simple", "smoothed", "exponential"):
+        full = moving_average.bulk.moving_average(prices, moving_average_type, 3)
+        assert moving_average.bulk.moving_average(prices, moving_average_type, 3, last=2) == full[-2:]
+    assert moving_average.bulk.moving_average(tuple(prices), "simple", 3, last=2) == [102.0, 101.0]
+    with pytest.raises(ValueError):
+        moving_average.bulk.moving_average([1.0, 2.0, 3.0, float("nan"), 5.0], "simple", 2, nan_policy="skip", last=1)
+
 def test_single_mcginley_dynamic():
     assert moving_average.single.mcginley_dynamic(prices[-1], 0.0, 3) == 99.0
 
 def test_bulk_mcginley_dynamic():
     assert moving_average.bulk.mcginley_dynamic(prices, 0.0, 3) == [103.0, 102.2789387706985, 101.03380467203097]
+
+def test_bulk_mcginley_dynamic_segments():
+    segmented = moving_average.bulk.mcginley_dynamic(prices + prices[:2] + prices, 0.0, 3, segment_starts=[5, 7])
+    assert len(segmented) == 10
+    assert segmented[:3] == segmented[7:] == [103.0, 102.2789387706985, 101.03380467203097]
+    assert all(value != value for value in segmented[3:7])
+
+def test_bulk_moving_average_nan_policy():
+    nan_prices = [100.0, 102.0, float("nan"), 101.0, 99.0, 98.0]
+    values, mask = moving_average.bulk.moving_average(nan_prices, "simple", 2, nan_policy="skip", validity_mask=True)
+    assert mask == [True, False, True, True, True]
+    assert [v for v, m in zip(values, mask) if m] == [101.0, 101.5, 100.0, 98.5]
+    values, mask = moving_average.bulk.moving_average(nan_prices, "simple", 2, nan_policy="forward_fill", validity_mask=True)
+    assert mask == [True, False, True, True, True]
+    assert [v for v, m in zip(values, mask) if m] == [101.0, 101.5, 100.0, 98.5]
+    values, mask = moving_average.bulk.moving_average(nan_prices, "simple", 2, nan_policy="reset", validity_mask=True)
+    assert mask == [True, False, False, True, True]
+    assert [v for v, m in zip(values, mask) if m] == [101.0, 100.0, 98.5]
+    with pytest.raises(ValueError):
+        moving_average.bulk.moving_average(nan_prices, "simple", 2, nan_policy="")
@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from pytechnicalindicators import normalization
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+values = [1.0, 3.0, 2.0, 5.0, 4.0]
+
+def test_single_z_score():
+    assert normalization.single.z_score(values) == pytest.approx(0.7071067811865475)
+
+def test_bulk_z_score():
+    assert normalization.bulk.z_score(values, 3) == pytest.approx([0.0, 1.3363062095621223, 0.2672612419124245])
+    assert normalization.bulk.z_score([2.0, 2.0, 2.0, 2.0], 3) == [0.0, 0.0]
+    with pytest.raises(ValueError):
+        normalization.bulk.z_score(values, 1)
+    with pytest.raises(ValueError):
+        normalization.bulk.z_score(values, 6)
+
+def test_single_percentile_rank():
+    assert normalization.single.percentile_rank(values) == 0.8
+
+def test_bulk_percentile_rank():
+    assert normalization.bulk.percentile_rank(values, 3) == [0.6666666666666666, 1.0, 0.6666666666666666]
+
+def test_single_robust_scale():
+    assert normalization.single.robust_scale(values) == 0.5
+
+def test_bulk_robust_scale():
+    assert normalization.bulk.robust_scale(values, 3) == pytest.approx([0.0, 1.3333333333333333, 0.0])
+
+def test_single_min_max_scale():
+    assert normalization.single.min_max_scale(values) == 0.75
+
+def test_bulk_min_max_scale():
+    assert normalization.bulk.min_max_scale(values, 3) == [0.5, 1.0, 0.6666666666666666]
+
+def test_bulk_nan_windows():
+    with_nan = [1.0, math.nan, 2.0, 5.0, 4.0]
+    for normalizer in (normalization.bulk.z_score, normalization.bulk.percentile_rank, normalization.bulk.robust_scale, normalization.bulk.min_max_scale):
+        normalized = normalizer(with_nan, 3)
+        assert math.isnan(normalized[0]) and math.isnan(normalized[1])
+        assert normalized[2] == pytest.approx(normalizer(values[2:], 3)[0])
@@ -40,6 +40,8 @@ def test_single_true_range():
 
 def test_bulk_true_range():
     assert other_indicators.bulk.true_range(close, high, low) == [25.0, 18.0, 5.0, 16.0, 16.0]
+    with pytest.raises(ValueError):
+        other_indicators.bulk.true_range(close, high[:-1], low)
 
 def test_single_average_true_range():
     assert other_indicators.single.average_true_range(close, high, low, "simple") == 16.0
@@ -64,6 +66,8 @@ def test_single_internal_bar_strength():
 
 def test_bulk_internal_bar_strength():
     assert other_indicators.bulk.internal_bar_strength(high, low, close) == [0.68, 0.4444444444444444, 0.2, 0.8125, 0.5625]
+    with pytest.raises(ValueError):
+        other_indicators.bulk.internal_bar_strength([], [], [])
 
 def test_bulk_positivity_indicator():
     assert other_indicators.bulk.positivity_indicator(open_prices, close, 3, "simple") == [(-0.4975124378109453, -3.9158374792703152), (1.6042780748663104, -1.2977447876482116), (-4.25531914893617, -1.0495178372936016)]
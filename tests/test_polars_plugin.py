@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+import pytechnicalindicators
+from pytechnicalindicators import candle_indicators, momentum_indicators, moving_average
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+# The polars CI job sets PYTI_REQUIRE_POLARS so a broken feature build fails instead of skipping
+if os.environ.get("PYTI_REQUIRE_POLARS"):
+    import polars as pl
+    assert hasattr(pytechnicalindicators, "polars_plugin"), "built without the polars feature"
+else:
+    pl = pytest.importorskip("polars")
+    if not hasattr(pytechnicalindicators, "polars_plugin"):
+        pytest.skip("built without the polars feature", allow_module_level=True)
+
+pytechnicalindicators.polars_plugin.register_namespace()
+
+prices = [100.0, 102.0, 103.0, 101.0, 99.0]
+
+def test_moving_average_expression():
+    df = pl.DataFrame({"close": prices})
+    result = df.select(pl.col("close").ti.moving_average(3, "simple"))["close"].to_list()
+    assert result == [None, None] + moving_average.bulk.moving_average(prices, "simple", 3)
+
+def test_relative_strength_index_over():
+    df = pl.LazyFrame({"symbol": ["a"] * 5 + ["b"] * 5, "close": prices + prices[::-1]})
+    result = df.select(pl.col("close").ti.relative_strength_index(3, "simple").over("symbol")).collect()["close"].to_list()
+    assert result[:5] == [None, None] + momentum_indicators.bulk.relative_strength_index(prices, "simple", 3)
+    assert result[5:] == [None, None] + momentum_indicators.bulk.relative_strength_index(prices[::-1], "simple", 3)
+
+def test_moving_constant_bands_expression():
+    df = pl.DataFrame({"close": prices})
+    result = df.select(pl.col("close").ti.moving_constant_bands(3, "simple", "standard", 2.0).struct.unnest())
+    bands = candle_indicators.bulk.moving_constant_bands(prices, "simple", "standard", 2.0, 3)
+    assert result["middle"].to_list() == [None, None] + [b[1] for b in bands]
+
+def test_expression_errors():
+    with pytest.raises(ValueError):
+        pl.col("close").ti.relative_strength_index(3, "")
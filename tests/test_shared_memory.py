@@ -0,0 +1,71 @@
+import array
+import math
+import pickle
+
+import pytest
+
+from pytechnicalindicators import moving_average, other_indicators, shared_memory
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+high = [120.0, 125.0, 123.0, 122.0, 121.0]
+low = [90.0, 95.0, 92.0, 91.0, 90.0]
+close = [100.0, 102.0, 103.0, 101.0, 99.0]
+
+def test_buffer_inputs():
+    assert moving_average.bulk.moving_average(array.array("d", close), "simple", 3) == [101.66666666666667, 102.0, 101.0]
+    assert moving_average.bulk.moving_average(memoryview(array.array("d", close)), "simple", 3) == [101.66666666666667, 102.0, 101.0]
+    assert moving_average.bulk.moving_average(memoryview(array.array("d", close)).toreadonly(), "simple", 3) == [101.66666666666667, 102.0, 101.0]
+    assert moving_average.bulk.moving_average(array.array("d", close), "simple", 3, nan_policy="skip") == [101.66666666666667, 102.0, 101.0]
+    with pytest.raises(TypeError):
+        moving_average.bulk.moving_average(memoryview(array.array("d", close[:4])).cast("B").cast("d", (2, 2)), "simple", 2)
+
+def test_shared_frame():
+    with shared_memory.SharedFrame.publish({"high": high, "low": low, "close": close}, outputs=["atr"]) as frame:
+        assert frame.columns == ["high", "low", "close", "atr"]
+        assert len(frame) == 5
+        assert frame.column("close").tolist() == close
+        assert frame.column("close").readonly
+        atr = other_indicators.bulk.average_true_range(frame.column("close"), frame.column("high"), frame.column("low"), "simple", 3)
+        assert atr == other_indicators.bulk.average_true_range(close, high, low, "simple", 3)
+        frame.write("atr", atr)
+        written = frame.column("atr").tolist()
+        assert math.isnan(written[0]) and math.isnan(written[1])
+        assert written[2:] == atr
+
+def test_shared_frame_pickle():
+    with shared_memory.SharedFrame.publish({"close": close}, outputs=["sma"]) as frame:
+        worker_frame = pickle.loads(pickle.dumps(frame))
+        assert worker_frame.name == frame.name
+        worker_frame.write("sma", moving_average.bulk.moving_average(worker_frame.column("close"), "simple", 3))
+        worker_frame.close()
+        assert frame.column("sma").tolist()[2:] == [101.66666666666667, 102.0, 101.0]
+
+def test_shared_frame_errors():
+    with pytest.raises(ValueError):
+        shared_memory.SharedFrame.publish({"high": high, "low": low[:3]})
+    with pytest.raises(ValueError):
+        shared_memory.SharedFrame.publish({"close": close}, outputs=["close"])
+    with shared_memory.SharedFrame.publish({"close": close}) as frame:
+        with pytest.raises(KeyError):
+            frame.column("open")
+        with pytest.raises(ValueError):
+            frame.write("close", high + low)
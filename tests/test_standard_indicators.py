@@ -1,3 +1,5 @@
+import pytest
+
 from pytechnicalindicators import standard_indicators
 
 """The purpose of these tests are just to confirm that the bindings work.
@@ -43,6 +45,13 @@ def test_single_exponential_moving_average():
 def test_bulk_exponential_moving_average():
     assert standard_indicators.bulk.exponential_moving_average(prices, 30) == [215.29552232471173, 216.91990305584258, 217.89096009276992, 218.55139303267376, 218.79831857416528]
 
+def test_bulk_exponential_moving_average_last():
+    full = standard_indicators.bulk.exponential_moving_average(prices, 30)
+    assert standard_indicators.bulk.exponential_moving_average(prices, 30, last=2) == full[-2:]
+    assert standard_indicators.bulk.exponential_moving_average(prices, 30, last=len(full)) == full
+    with pytest.raises(ValueError):
+        standard_indicators.bulk.exponential_moving_average(prices, 30, nan_policy="forward_fill", last=2)
+
 def test_single_bollinger_bands():
     assert standard_indicators.single.bollinger_bands(prices[:20]) == (175.05324174971474, 203.2, 231.34675825028523)
 
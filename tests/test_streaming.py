@@ -0,0 +1,80 @@
+import math
+
+import pytest
+
+from pytechnicalindicators import candle_indicators, momentum_indicators, other_indicators, streaming, trend_indicators
+
+"""The purpose of these tests are just to confirm that the bindings work.
+
+These tests are not meant to be in depth, nor to test all edge cases, those should be
+done in [RustTI](https://github.com/chironmind/RustTI). These tests exist to confirm whether an update in the bindings, or
+RustTI has broken functionality.
+
+To run the tests `maturin` needs to have built the egg. To do so run the following from
+your CLI
+
+```shell
+$ source you_venv_location/bin/activate
+
+$ pip3 install -r test_requirements.txt
+
+$ maturin develop
+
+$ pytest .
+```
+"""
+
+high = [200.0, 210.0, 205.0, 190.0, 195.0]
+low = [175.0, 192.0, 200.0, 174.0, 179.0]
+close = [192.0, 200.0, 201.0, 187.0, 188.0]
+
+def test_streaming_engine():
+    engine = streaming.StreamingEngine(2)
+    assert engine.add_relative_strength_index("simple", 3) == 0
+    assert engine.add_average_true_range("simple", 3) == 1
+    assert engine.add_supertrend("simple", 2.0, 3) == 2
+    assert engine.add_macd_line(2, "exponential", 4, "exponential") == 3
+    assert engine.add_parabolic_time_price_system(0.02, 0.02, 0.2, "long") == 4
+    assert engine.n_indicators == 5
+
+    rows = engine.update([0, 1], [high[0], high[0]], [low[0], low[0]], [close[0], close[0]])
+    assert len(rows) == 2
+    assert math.isnan(rows[0][0])
+    assert rows[0][4] == low[0]
+
+    for i in range(1, len(close)):
+        rows = engine.update([0], [high[i]], [low[i]], [close[i]])
+
+    assert rows[0][0] == momentum_indicators.bulk.relative_strength_index(close, "simple", 3)[-1]
+    assert rows[0][1] == other_indicators.bulk.average_true_range(close, high, low, "simple", 3)[-1]
+    assert rows[0][2] == candle_indicators.bulk.supertrend(high, low, close, "simple", 2.0, 3)[-1]
+    assert rows[0][3] == momentum_indicators.single.macd_line(close[-4:], 2, "exponential", "exponential")
+
+    latest = engine.latest()
+    assert len(latest) == 2
+    assert latest[0] == rows[0]
+    assert math.isnan(latest[1][0])
+
+def test_streaming_parabolic_time_price_system():
+    trend_high = [200.0, 210.0, 205.0, 190.0, 185.0]
+    trend_low = [175.0, 192.0, 200.0, 174.0, 179.0]
+    engine = streaming.StreamingEngine(1)
+    engine.add_parabolic_time_price_system(0.0, 0.02, 0.2, "long")
+    sars = [engine.update([0], [h], [l], [0.0])[0][0] for h, l in zip(trend_high, trend_low)]
+    assert sars == pytest.approx(trend_indicators.bulk.parabolic_time_price_system(trend_high, trend_low, 0.0, 0.02, 0.2, "long", 0.0))
+    assert sars == pytest.approx([175.0, 175.0, 175.7, 176.386, 210.0])
+
+def test_streaming_engine_errors():
+    engine = streaming.StreamingEngine(1)
+    with pytest.raises(ValueError):
+        engine.add_relative_strength_index("", 3)
+    with pytest.raises(ValueError):
+        engine.add_macd_line(4, "simple", 2, "simple")
+    engine.add_relative_strength_index("simple", 3)
+    with pytest.raises(ValueError):
+        engine.update([1], [high[0]], [low[0]], [close[0]])
+    with pytest.raises(ValueError):
+        engine.update([0], [high[0]], [low[0]], [])
+    engine.update([0], [high[0]], [low[0]], [close[0]])
+    with pytest.raises(ValueError):
+        engine.add_average_true_range("simple", 3)
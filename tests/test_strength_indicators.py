@@ -38,6 +38,14 @@ def test_bulk_accumulation_distribution_no_previous():
 def test_single_volume_index():
     assert strength_indicators.single.volume_index(close[-1], close[-2], 0.0) == 0.005376190340015442
 
+def test_bulk_volume_index():
+    volume_index = strength_indicators.single.volume_index(close[1], close[0], 0.0)
+    expected = [volume_index]
+    for i in range(2, len(close)):
+        volume_index = strength_indicators.single.volume_index(close[i], close[i - 1], volume_index)
+        expected.append(volume_index)
+    assert strength_indicators.bulk.volume_index(close, 0.0) == expected
+
 def test_bulk_positive_volume_index():
     assert strength_indicators.bulk.positive_volume_index(close, volume, 0.0) == [0.043402777777777776, 0.043402777777777776, 0.043402777777777776, 0.04363487819370172]
 
@@ -62,3 +70,5 @@ def test_bulk_relative_vigor_index():
      with pytest.raises(ValueError):
          strength_indicators.bulk.relative_vigor_index(open_prices, high, low, close, "", 4)
 
+def test_bulk_relative_vigor_index_normalize():
+    assert strength_indicators.bulk.relative_vigor_index(open_prices, high, low, close, "simple", 4, normalize=("percentile_rank", 2)) == [0.5]
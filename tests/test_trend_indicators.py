@@ -59,10 +59,16 @@ def test_single_long_parabolic_time_price_system():
     assert trend_indicators.single.long_parabolic_time_price_system(low[-1], max(high), 0.02, min(low[-2:])) == 174.0
 
 def test_bulk_parabolic_time_price_system():
-    assert trend_indicators.bulk.parabolic_time_price_system(high, low, 0.0, 0.02, 0.2, 'long', 0.0) == [175.0, 175.0, 182.0, 210.0, 210.0]
+    assert trend_indicators.bulk.parabolic_time_price_system(high, low, 0.0, 0.02, 0.2, 'long', 0.0) == pytest.approx([175.0, 175.0, 175.7, 176.386, 210.0])
     with pytest.raises(ValueError):
         trend_indicators.bulk.parabolic_time_price_system(high, low, 0.0, 0.02, 0.2, '', 0.0)
 
+def test_bulk_parabolic_time_price_system_segments():
+    segmented = trend_indicators.bulk.parabolic_time_price_system(high + high, low + low, 0.0, 0.02, 0.2, 'long', 0.0, segment_starts=[5])
+    assert segmented == pytest.approx([175.0, 175.0, 175.7, 176.386, 210.0] * 2)
+    with pytest.raises(ValueError):
+        trend_indicators.bulk.parabolic_time_price_system(high, low[:4], 0.0, 0.02, 0.2, 'long', 0.0, segment_starts=[2])
+
 extended_high = high + [180.0, 195.0, 205.0, 210.0, 225.0]
 extended_low = low + [160.0, 150.0, 170.0, 190.0, 185.0]
 extended_close = close + [175.0, 160.0, 180.0, 200.0, 205.0]
@@ -82,6 +88,11 @@ def test_single_volume_price_trend():
 def test_bulk_volume_price_trend():
     assert trend_indicators.bulk.volume_price_trend(prices, volume[:-1], 0.0) == [20.0, 34.705882352941174, 11.40491147915477, -6.416870699063054]
 
+def test_bulk_volume_price_trend_segments():
+    segmented = trend_indicators.bulk.volume_price_trend(prices + prices, volume + volume[:-1], 0.0, segment_starts=[5])
+    assert segmented[:4] == segmented[5:] == [20.0, 34.705882352941174, 11.40491147915477, -6.416870699063054]
+    assert segmented[4] != segmented[4]
+
 def test_single_true_strength_index():
     assert trend_indicators.single.true_strength_index(prices, 3, "simple", "simple") == -0.2
     assert trend_indicators.single.true_strength_index(prices, 3, "smoothed", "smoothed") == -0.5599999999999999
@@ -104,3 +115,16 @@ def test_bulk_true_strength_index():
     with pytest.raises(ValueError):
         trend_indicators.bulk.true_strength_index(prices, "mode", 2, "", 3)
 
+def test_bulk_true_strength_index_last():
+    extended_prices = [103.0, 99.0, 98.0] + prices
+    full = trend_indicators.bulk.true_strength_index(extended_prices, "simple", 2, "simple", 3)
+    assert trend_indicators.bulk.true_strength_index(extended_prices, "simple", 2, "simple", 3, last=1) == full[-1:] == [-0.19999999999999998]
+    assert trend_indicators.bulk.true_strength_index(extended_prices, "simple", 2, "simple", 3, last=2) == full[-2:]
+    full = trend_indicators.bulk.true_strength_index(extended_prices, "exponential", 2, "exponential", 3)
+    assert trend_indicators.bulk.true_strength_index(extended_prices, "exponential", 2, "exponential", 3, last=2) == full[-2:]
+
+def test_bulk_true_strength_index_normalize():
+    extended_prices = [103.0, 99.0, 98.0] + prices
+    normalized = trend_indicators.bulk.true_strength_index(extended_prices, "simple", 2, "simple", 3, normalize=("min_max_scale", 2))
+    assert len(normalized) == 3
+    assert trend_indicators.bulk.true_strength_index(extended_prices, "simple", 2, "simple", 3, last=1, normalize=("min_max_scale", 2)) == normalized[-1:]
@@ -33,6 +33,10 @@ def test_single_ulcer_index():
 def test_bulk_ulcer_index():
     assert volatility_indicators.bulk.ulcer_index(prices, 5) == [1.9417475728155338]
 
+def test_bulk_ulcer_index_parallel(long_prices, parallel_threads):
+    assert volatility_indicators.bulk.ulcer_index(long_prices, 14, parallel=True) == volatility_indicators.bulk.ulcer_index(long_prices, 14)
+    assert volatility_indicators.bulk.ulcer_index(prices, 3, parallel=True) == volatility_indicators.bulk.ulcer_index(prices, 3)
+
 def test_bulk_volatility_system():
     assert volatility_indicators.bulk.volatility_system(high, low, close, 3, 2.0, "simple") == [169.0, 175.0, 181.0]
     assert volatility_indicators.bulk.volatility_system(high, low, close, 3, 2.0, "smoothed") == [174.36842105263156, 175.10526315789474, 180.26315789473685]